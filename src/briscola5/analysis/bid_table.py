@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Sequence
+
+from briscola5.application.record import silenced
+from briscola5.bots.greedy_bot import estimate_hand_strength
+from briscola5.bots.simulator import BOT_TYPES, deal_seeded, play_game, split_evenly
+from briscola5.domain.card import Card
+from briscola5.domain.rules import MAX_TOTAL_POINTS, MIN_BID, PLAYER_COUNT
+from briscola5.domain.state import Phase
+
+CLASS_WIDTH = 5
+NUM_CLASSES = 32
+
+
+def hand_class(hand: Sequence[Card]) -> int:
+    """Buckets a hand by `estimate_hand_strength` into CLASS_WIDTH-wide classes."""
+    strength = estimate_hand_strength(list(hand))
+    return min(max(int(strength // CLASS_WIDTH), 0), NUM_CLASSES - 1)
+
+
+def _empty_histograms() -> list[list[int]]:
+    return [[0] * (MAX_TOTAL_POINTS + 1) for _ in range(NUM_CLASSES)]
+
+
+def rollout_histograms(
+    num_deals: int, seed: int, caller_bot: str = "Greedy", opponent_bot: str = "Greedy"
+) -> list[list[int]]:
+    """Worker entry point: per hand class, a histogram of the caller team's final points.
+
+    Each deal is played with the first bidder forced to win the auction at MIN_BID,
+    so the caller's cards alone decide the class being measured.
+    """
+    rng = random.Random(seed)
+    histograms = _empty_histograms()
+    for deal_idx in range(num_deals):
+        dealer = deal_idx % PLAYER_COUNT
+        caller = (dealer + 1) % PLAYER_COUNT
+        bots = {
+            i: BOT_TYPES[caller_bot if i == caller else opponent_bot](player_id=i)
+            for i in range(PLAYER_COUNT)
+        }
+        service = deal_seeded(dealer, rng)
+        with silenced():
+            cls = hand_class(service.state.hands[caller])
+            service.auction_phase(caller, MIN_BID)
+            for offset in range(1, PLAYER_COUNT):
+                service.auction_phase((caller + offset) % PLAYER_COUNT, None)
+            try:
+                play_game(service, bots)
+            except RuntimeError:
+                continue
+        points = service.state.team_points_if_known()
+        if service.state.phase == Phase.GAME_OVER and points is not None:
+            histograms[cls][points[0]] += 1
+    return histograms
+
+
+class BidTable:
+    """Calibrated P(caller team reaches target) per hand class, for targets MIN_BID..120.
+
+    `limits` holds, per class, the highest target reached with probability at least
+    `confidence` (None when even MIN_BID is too risky or the class has fewer than
+    `min_samples` deals), so a bidding strategy needs a single list lookup.
+    """
+
+    def __init__(
+        self, histograms: list[list[int]], confidence: float = 0.5, min_samples: int = 50
+    ) -> None:
+        self.histograms = histograms
+        self.confidence = confidence
+        self.min_samples = min_samples
+        self.samples = [sum(histogram) for histogram in histograms]
+        self.probabilities: list[list[float]] = []
+        self.limits: list[int | None] = []
+        for histogram, total in zip(histograms, self.samples):
+            reached = []
+            above = sum(histogram[MIN_BID:])
+            for target in range(MIN_BID, MAX_TOTAL_POINTS + 1):
+                reached.append(above / total if total else 0.0)
+                above -= histogram[target]
+            self.probabilities.append(reached)
+            limit = None
+            if total >= min_samples:
+                for target, probability in zip(range(MIN_BID, MAX_TOTAL_POINTS + 1), reached):
+                    if probability >= confidence:
+                        limit = target
+            self.limits.append(limit)
+
+    def probability(self, cls: int, target: int) -> float:
+        return self.probabilities[cls][target - MIN_BID]
+
+    def max_bid(self, cls: int) -> int | None:
+        return self.limits[cls]
+
+    def is_calibrated(self, cls: int) -> bool:
+        return self.samples[cls] >= self.min_samples
+
+    def save(self, path: str | os.PathLike) -> None:
+        data = {
+            "class_width": CLASS_WIDTH,
+            "confidence": self.confidence,
+            "min_samples": self.min_samples,
+            "histograms": self.histograms,
+        }
+        Path(path).write_text(json.dumps(data), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | os.PathLike, confidence: float | None = None) -> BidTable:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        if data["class_width"] != CLASS_WIDTH:
+            raise ValueError(f"Bid table uses class width {data['class_width']}")
+        return cls(
+            data["histograms"],
+            confidence=data["confidence"] if confidence is None else confidence,
+            min_samples=data["min_samples"],
+        )
+
+
+# pylint: disable=too-many-arguments, too-many-positional-arguments
+def estimate_bid_table(
+    num_deals: int,
+    workers: int | None = None,
+    seed: int = 0,
+    caller_bot: str = "Greedy",
+    opponent_bot: str = "Greedy",
+    confidence: float = 0.5,
+) -> BidTable:
+    """Runs `num_deals` rollouts split across a process pool and merges the histograms."""
+    workers = workers or os.cpu_count() or 1
+    shares = split_evenly(num_deals, workers)
+    histograms = _empty_histograms()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(rollout_histograms, deals, seed * 1_000_003 + i, caller_bot, opponent_bot)
+            for i, deals in enumerate(shares)
+            if deals
+        ]
+        for future in futures:
+            for merged, part in zip(histograms, future.result()):
+                for points, count in enumerate(part):
+                    merged[points] += count
+    return BidTable(histograms, confidence=confidence)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Estimate a calibrated bid table.")
+    parser.add_argument("output", help="path of the JSON bid table to write")
+    parser.add_argument("--deals", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--caller-bot", choices=sorted(BOT_TYPES), default="Greedy")
+    parser.add_argument("--opponent-bot", choices=sorted(BOT_TYPES), default="Greedy")
+    parser.add_argument("--confidence", type=float, default=0.5)
+    args = parser.parse_args(argv)
+
+    table = estimate_bid_table(
+        args.deals,
+        workers=args.workers,
+        seed=args.seed,
+        caller_bot=args.caller_bot,
+        opponent_bot=args.opponent_bot,
+        confidence=args.confidence,
+    )
+    table.save(args.output)
+    for cls, limit in enumerate(table.limits):
+        if table.samples[cls]:
+            print(f"class {cls:2d}: {table.samples[cls]:7d} deals, max bid {limit}")
+
+
+if __name__ == "__main__":
+    main()
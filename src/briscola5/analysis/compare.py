@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import argparse
+import math
+import random
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Iterator, Sequence
+
+from briscola5.bots.runner import play_seeded_game
+from briscola5.bots.simulator import BOT_TYPES
+from briscola5.domain.state import PLAYER_COUNT
+
+BETTER = "better"
+NOT_BETTER = "not better"
+INCONCLUSIVE = "inconclusive"
+
+
+class SPRT:  # pylint: disable=too-many-instance-attributes
+    """Wald's sequential probability ratio test on the discordant pairs of duplicate games.
+
+    Only pairs where exactly one of the two bots won carry information. With `p` the
+    probability that A is the winner of such a pair, H0 is p = 0.5 (A is not better)
+    and H1 is p = 0.5 + delta; alpha and beta are the false positive/negative rates.
+    """
+
+    __slots__ = ("p0", "p1", "lower", "upper", "llr", "wins", "losses", "ties")
+
+    def __init__(self, delta: float = 0.05, alpha: float = 0.05, beta: float = 0.05) -> None:
+        if not 0 < delta < 0.5:
+            raise ValueError("delta must be between 0 and 0.5")
+        self.p0 = 0.5
+        self.p1 = 0.5 + delta
+        self.lower = math.log(beta / (1 - alpha))
+        self.upper = math.log((1 - beta) / alpha)
+        self.llr = 0.0
+        self.wins = 0
+        self.losses = 0
+        self.ties = 0
+
+    def update(self, a_won: bool, b_won: bool) -> str | None:
+        """Adds one pair and returns the decision once a bound is crossed."""
+        if a_won == b_won:
+            self.ties += 1
+        elif a_won:
+            self.wins += 1
+            self.llr += math.log(self.p1 / self.p0)
+        else:
+            self.losses += 1
+            self.llr += math.log((1 - self.p1) / (1 - self.p0))
+        return self.decision
+
+    @property
+    def decision(self) -> str | None:
+        if self.llr >= self.upper:
+            return BETTER
+        if self.llr <= self.lower:
+            return NOT_BETTER
+        return None
+
+
+def lineup_for(bot: str, seat: int, reference: str) -> tuple[str, ...]:
+    return tuple(bot if i == seat else reference for i in range(PLAYER_COUNT))
+
+
+def seat_under_test(deal: int) -> int:
+    """Seat of the tested bot on `deal`, whose dealer is `deal % 5`.
+
+    The offset from the dealer moves on every five deals, so over 25 deals the tested
+    bot plays each dealer-relative position five times.
+    """
+    return (deal + 1 + deal // PLAYER_COUNT) % PLAYER_COUNT
+
+
+def play_pairs(
+    start: int, count: int, seed: int, bots: tuple[str, str], reference: str
+) -> list[tuple[bool, bool] | None]:
+    """Worker entry point: deals `start..start+count` played once with each bot.
+
+    Both games of a pair share the deck, the dealer and the bots' random stream; the
+    tested bot sits at `seat_under_test(deal)` and the `reference` bot fills the other seats.
+    A pair is None when either game could not be finished. Like `runner.play_batch`,
+    the caller's global random state is restored afterwards.
+    """
+    saved = random.getstate()
+    pairs: list[tuple[bool, bool] | None] = []
+    try:
+        for deal in range(start, start + count):
+            seat = seat_under_test(deal)
+            a_result, b_result = (
+                play_seeded_game(deal, seed, lineup_for(bot, seat, reference)) for bot in bots
+            )
+            if a_result.error is not None or b_result.error is not None:
+                pairs.append(None)
+            else:
+                pairs.append((seat in a_result.winners, seat in b_result.winners))
+    finally:
+        random.setstate(saved)
+    return pairs
+
+
+def _iter_pairs(
+    bots: tuple[str, str], reference: str, seed: int, workers: int, batch_size: int
+) -> Iterator[tuple[bool, bool] | None]:
+    """Endless stream of pairs in deal order, with at most `2 * workers` batches in flight."""
+    starts = (start for start in range(0, 1 << 62, batch_size))
+    if workers <= 1:
+        for start in starts:
+            yield from play_pairs(start, batch_size, seed, bots, reference)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque[Future] = deque()
+        try:
+            for start in starts:
+                pending.append(pool.submit(play_pairs, start, batch_size, seed, bots, reference))
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+# pylint: disable=too-many-arguments, too-many-locals
+def compare_bots(
+    bot_a: str,
+    bot_b: str,
+    *,
+    delta: float = 0.05,
+    alpha: float = 0.05,
+    beta: float = 0.05,
+    max_pairs: int = 20_000,
+    max_voided_run: int = 100,
+    reference: str = "Greedy",
+    seed: int = 0,
+    workers: int = 1,
+    batch_size: int = 50,
+) -> dict:
+    """Plays duplicate pairs until the SPRT decides whether `bot_a` beats `bot_b`.
+
+    Stops with INCONCLUSIVE after `max_pairs` scored pairs, or after `max_voided_run`
+    voided pairs in a row (a bot that keeps failing, or an engine that gives up).
+    """
+    for name in (bot_a, bot_b, reference):
+        if name not in BOT_TYPES:
+            raise ValueError(f"Unknown bot {name!r}")
+    test = SPRT(delta, alpha, beta)
+    scored = voided = voided_run = 0
+    decision: str | None = None
+    for pair in _iter_pairs((bot_a, bot_b), reference, seed, workers, batch_size):
+        if pair is None:
+            voided += 1
+            voided_run += 1
+            if voided_run >= max_voided_run:
+                break
+            continue
+        scored += 1
+        voided_run = 0
+        decision = test.update(*pair)
+        if decision is not None or scored >= max_pairs:
+            break
+    return {
+        "bot_a": bot_a,
+        "bot_b": bot_b,
+        "decision": decision or INCONCLUSIVE,
+        "pairs": scored,
+        "voided_pairs": voided,
+        "a_only_wins": test.wins,
+        "b_only_wins": test.losses,
+        "ties": test.ties,
+        "llr": test.llr,
+        "bounds": [test.lower, test.upper],
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Sequentially test whether bot A beats bot B on duplicate deals."
+    )
+    parser.add_argument("bot_a", choices=sorted(BOT_TYPES))
+    parser.add_argument("bot_b", choices=sorted(BOT_TYPES))
+    parser.add_argument("--reference", choices=sorted(BOT_TYPES), default="Greedy")
+    parser.add_argument("--delta", type=float, default=0.05)
+    parser.add_argument("--alpha", type=float, default=0.05)
+    parser.add_argument("--beta", type=float, default=0.05)
+    parser.add_argument("--max-pairs", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    summary = compare_bots(
+        args.bot_a,
+        args.bot_b,
+        delta=args.delta,
+        alpha=args.alpha,
+        beta=args.beta,
+        max_pairs=args.max_pairs,
+        reference=args.reference,
+        seed=args.seed,
+        workers=args.workers,
+    )
+    print(
+        f"{args.bot_a} vs {args.bot_b}: {summary['decision']} after {summary['pairs']} pairs "
+        f"({summary['a_only_wins']} / {summary['b_only_wins']} decisive, "
+        f"{summary['ties']} tied, {summary['voided_pairs']} voided)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Sequence
+
+from briscola5.application.game_service import GameService
+from briscola5.application.record import ActionKind, decode_action, silenced
+from briscola5.bots.base import BaseBot
+from briscola5.bots.greedy_bot import GreedyBot
+from briscola5.bots.simulator import play_recorded, split_evenly
+from briscola5.domain.card import (
+    DECK_SIZE,
+    Card,
+    Rank,
+    Suit,
+    card_from_index,
+    card_index,
+    cards_to_mask,
+    full_deck,
+)
+from briscola5.domain.rules import PLAYER_COUNT
+from briscola5.domain.state import Phase
+from briscola5.domain.view import Observation
+
+HAND_SIZE = DECK_SIZE // PLAYER_COUNT
+
+# (caller's discard, called card) as card indices.
+Option = tuple[int, int]
+
+
+class _ScriptedBot(BaseBot):
+    """GreedyBot, except for a fixed dead-trick discard and call."""
+
+    def __init__(self, player_id: int, discard: Card, call: Card | None = None) -> None:
+        super().__init__(player_id)
+        self.inner = GreedyBot(player_id)
+        self.discard = discard
+        self.call = call
+
+    def make_bid(self, state: Observation) -> int | None:
+        return self.inner.make_bid(state)
+
+    def choose_discard(self, state: Observation) -> int:
+        return list(state.hands[self.player_id]).index(self.discard)
+
+    def declare_trump_and_card(self, state: Observation) -> tuple[Suit, Rank]:
+        if self.call is None:
+            return self.inner.declare_trump_and_card(state)
+        return self.call.suit, self.call.rank
+
+    def play_card(self, state: Observation) -> int:
+        return self.inner.play_card(state)
+
+
+def _auctioned(deck: Sequence[int], dealer: int, caller: int, target: int) -> GameService:
+    """A service dealt `deck` whose auction `caller` won with `target`, everyone else passing."""
+    service = GameService()
+    with silenced():
+        service.setup_game(dealer, deck=[card_from_index(i) for i in deck])
+        while service.state.phase is Phase.AUCTION:
+            player = service.state.turn.current_player
+            bid = target if player == caller and service.state.auction.last_bid is None else None
+            service.auction_phase(player, bid)
+    return service
+
+
+class DeadTrickPosition:
+    """A deal right after the auction, seen by the caller.
+
+    For every legal discard of the caller, the other seats' discards are those
+    GreedyBot makes on the real deal; they are visible when the call is made, so
+    rollouts keep them fixed and only re-deal the cards still hidden from the caller.
+    """
+
+    __slots__ = ("deck", "dealer", "caller", "target", "discards")
+
+    def __init__(self, deck: Sequence[int], dealer: int, caller: int, target: int) -> None:
+        self.deck = tuple(deck)
+        self.dealer = dealer
+        self.caller = caller
+        self.target = target
+        # Caller's discard -> every seat's discard, for the discards the engine accepts.
+        self.discards: dict[int, tuple[int, ...]] = {}
+        hand = self.deck[caller * HAND_SIZE : (caller + 1) * HAND_SIZE]
+        for discard in hand:
+            bots: dict[int, BaseBot] = {seat: GreedyBot(seat) for seat in range(PLAYER_COUNT)}
+            bots[caller] = _ScriptedBot(caller, card_from_index(discard))
+            record = play_recorded(_auctioned(self.deck, dealer, caller, target), bots)
+            if record is None:
+                continue
+            played = {
+                player: value
+                for kind, player, value in map(decode_action, record.actions)
+                if kind is ActionKind.DISCARD
+            }
+            if played.get(caller) == discard and len(played) == PLAYER_COUNT:
+                self.discards[discard] = tuple(played[seat] for seat in range(PLAYER_COUNT))
+
+    def options(self) -> list[Option]:
+        """Every (discard, called card) pair the rules allow, discards in hand order."""
+        rules = _auctioned(self.deck, self.dealer, self.caller, self.target).state.rules
+        hand = self.deck[self.caller * HAND_SIZE : (self.caller + 1) * HAND_SIZE]
+        options: list[Option] = []
+        for discard, dead_trick in self.discards.items():
+            kept = cards_to_mask(card_from_index(i) for i in hand if i != discard)
+            forbidden = rules.forbidden_calls(kept, sum(1 << i for i in dead_trick))
+            options.extend(
+                (discard, call) for call in range(DECK_SIZE) if not forbidden >> call & 1
+            )
+        return options
+
+    def world(self, discard: int, rng: random.Random) -> list[int]:
+        """A deck consistent with what the caller knows after discarding `discard`."""
+        dead_trick = self.discards[discard]
+        hand = self.deck[self.caller * HAND_SIZE : (self.caller + 1) * HAND_SIZE]
+        hidden = [i for i in range(DECK_SIZE) if i not in hand and i not in dead_trick]
+        rng.shuffle(hidden)
+        deck: list[int] = []
+        for seat in range(PLAYER_COUNT):
+            if seat == self.caller:
+                deck.extend(hand)
+            else:
+                deck.extend(hidden[: HAND_SIZE - 1])
+                deck.append(dead_trick[seat])
+                del hidden[: HAND_SIZE - 1]
+        return deck
+
+    def rollout(self, option: Option, deck: Sequence[int]) -> int | None:
+        """Caller team points of the game played from `deck` with `option`, or None."""
+        discard, call = option
+        service = _auctioned(deck, self.dealer, self.caller, self.target)
+        dead_trick = self.discards[discard]
+        bots: dict[int, BaseBot] = {
+            seat: _ScriptedBot(seat, card_from_index(dead_trick[seat]))
+            for seat in range(PLAYER_COUNT)
+        }
+        bots[self.caller] = _ScriptedBot(
+            self.caller, card_from_index(discard), card_from_index(call)
+        )
+        if play_recorded(service, bots) is None:
+            return None
+        points = service.state.team_points_if_known()
+        if service.state.phase is not Phase.GAME_OVER or points is None:
+            return None
+        return points[0]
+
+
+class OptionStats:
+    __slots__ = ("option", "count", "total", "squares", "pruned_round")
+
+    def __init__(self, option: Option) -> None:
+        self.option = option
+        self.count = 0
+        self.total = 0.0
+        self.squares = 0.0
+        self.pruned_round: int | None = None
+
+    @property
+    def discard(self) -> Card:
+        return card_from_index(self.option[0])
+
+    @property
+    def call(self) -> Card:
+        return card_from_index(self.option[1])
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else math.nan
+
+    @property
+    def stderr(self) -> float:
+        if self.count < 2:
+            return math.inf
+        variance = (self.squares - self.total**2 / self.count) / (self.count - 1)
+        return math.sqrt(max(variance, 0.0) / self.count)
+
+    def __repr__(self) -> str:
+        return (
+            f"OptionStats(discard={self.discard}, call={self.call}, mean={self.mean:.1f}, "
+            f"stderr={self.stderr:.1f}, n={self.count})"
+        )
+
+
+def rollout_batch(
+    position: DeadTrickPosition, options: Sequence[Option], start: int, count: int, seed: int
+) -> list[tuple[int, float, float]]:
+    """Worker entry point: (games, sum, sum of squares) of each option over worlds
+    `start..start+count`.
+
+    World `w` is drawn from `Random(seed, w)` for every option with the same discard,
+    so options are compared on common deals.
+    """
+    totals = [[0, 0.0, 0.0] for _ in options]
+    for world in range(start, start + count):
+        decks: dict[int, list[int]] = {}
+        for totals_row, option in zip(totals, options):
+            if option[0] not in decks:
+                decks[option[0]] = position.world(option[0], random.Random(f"{seed}:{world}"))
+            points = position.rollout(option, decks[option[0]])
+            if points is not None:
+                totals_row[0] += 1
+                totals_row[1] += points
+                totals_row[2] += points * points
+    return [(int(games), total, squares) for games, total, squares in totals]
+
+
+# pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
+def analyze(
+    position: DeadTrickPosition,
+    worlds_per_round: int = 32,
+    rounds: int = 8,
+    workers: int | None = None,
+    seed: int = 0,
+    z: float = 2.0,
+    options: Sequence[Option] | None = None,
+) -> list[OptionStats]:
+    """Expected caller team points of every option, best first.
+
+    Rollouts run in rounds of `worlds_per_round` worlds split across a process pool.
+    After each round an option is pruned once its mean plus `z` standard errors falls
+    below the leader's mean minus `z` standard errors; pruned options keep their
+    statistics and `pruned_round`. Stops early when a single option is left.
+    """
+    stats = [OptionStats(option) for option in (options or position.options())]
+    workers = workers or os.cpu_count() or 1
+    alive = list(stats)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for round_idx in range(rounds):
+            if len(alive) <= 1:
+                break
+            live = [s.option for s in alive]
+            first = round_idx * worlds_per_round
+            futures = []
+            for share in split_evenly(worlds_per_round, workers):
+                if share:
+                    futures.append(pool.submit(rollout_batch, position, live, first, share, seed))
+                    first += share
+            for future in futures:
+                for option_stats, (games, total, squares) in zip(alive, future.result()):
+                    option_stats.count += games
+                    option_stats.total += total
+                    option_stats.squares += squares
+
+            leader = max(alive, key=lambda s: s.mean if s.count else -math.inf)
+            threshold = leader.mean - z * leader.stderr
+            for option_stats in alive:
+                if option_stats.count and option_stats.mean + z * option_stats.stderr < threshold:
+                    option_stats.pruned_round = round_idx
+            alive = [s for s in alive if s.pruned_round is None]
+    return sorted(stats, key=lambda s: (s.pruned_round is None, s.mean), reverse=True)
+
+
+def greedy_option(position: DeadTrickPosition) -> Option | None:
+    """What GreedyBot would discard and call on the real deal."""
+    service = _auctioned(position.deck, position.dealer, position.caller, position.target)
+    record = play_recorded(service, {seat: GreedyBot(seat) for seat in range(PLAYER_COUNT)})
+    if record is None:
+        return None
+    discard = call = None
+    for kind, player, value in map(decode_action, record.actions):
+        if kind is ActionKind.DISCARD and player == position.caller:
+            discard = value
+        elif kind is ActionKind.CALL:
+            call = value
+    return None if discard is None or call is None else (discard, call)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Rank dead-trick discards and calls.")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the deal")
+    parser.add_argument("--dealer", type=int, default=0)
+    parser.add_argument("--caller", type=int, default=None, help="default: first bidder")
+    parser.add_argument("--target", type=int, default=71)
+    parser.add_argument("--worlds", type=int, default=32, help="rollouts per option per round")
+    parser.add_argument("--rounds", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    deck = full_deck()
+    random.Random(args.seed).shuffle(deck)
+    caller = (args.dealer + 1) % PLAYER_COUNT if args.caller is None else args.caller
+    position = DeadTrickPosition([card_index(c) for c in deck], args.dealer, caller, args.target)
+    hand = [
+        card_from_index(i) for i in position.deck[caller * HAND_SIZE : (caller + 1) * HAND_SIZE]
+    ]
+    print(f"Caller P{caller} bid {args.target} holding {hand}")
+
+    results = analyze(position, args.worlds, args.rounds, args.workers, args.seed)
+    greedy = greedy_option(position)
+    for rank, option_stats in enumerate(results[: args.top], 1):
+        state = (
+            "" if option_stats.pruned_round is None else f" (pruned r{option_stats.pruned_round})"
+        )
+        marker = " <- GreedyBot" if option_stats.option == greedy else ""
+        print(
+            f"{rank:3d}. discard {option_stats.discard}, call {option_stats.call}: "
+            f"{option_stats.mean:5.1f} +- {option_stats.stderr:4.1f} "
+            f"({option_stats.count} games){state}{marker}"
+        )
+    if greedy is not None:
+        position_of = [s.option for s in results].index(greedy) + 1
+        print(f"GreedyBot's choice ranks {position_of} of {len(results)}")
+
+
+if __name__ == "__main__":
+    main()
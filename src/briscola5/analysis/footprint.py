@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import sys
+import tracemalloc
+from typing import Callable, Sequence
+
+from briscola5.application.compact import CompactTable
+from briscola5.application.game_service import GameService
+from briscola5.application.record import replay
+from briscola5.bots.greedy_bot import GreedyBot
+from briscola5.bots.simulator import deal_seeded, play_recorded
+from briscola5.domain.state import PLAYER_COUNT
+
+IDLE_BUDGET = 1024
+
+
+def positions(count: int, moves: int, seed: int = 0) -> list[GameService]:
+    """`count` tables, each stopped `moves` actions into a seeded all-GreedyBot game.
+
+    Deals the engine cannot finish are skipped, as in `simulate_records`.
+    """
+    services: list[GameService] = []
+    deal = 0
+    while len(services) < count:
+        service = deal_seeded(deal % PLAYER_COUNT, random.Random(seed * 1_000_003 + deal))
+        deal += 1
+        record = play_recorded(service, {seat: GreedyBot(seat) for seat in range(PLAYER_COUNT)})
+        if record is None:
+            continue
+        for _, (position, _) in zip(range(moves + 1), replay(record)):
+            service = position
+        services.append(service)
+    return services
+
+
+def bytes_per_table(build: Callable[[int], object], count: int) -> float:
+    """Average memory kept alive by `build(i)` for i in range(count), via tracemalloc."""
+    gc.collect()
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tables = [build(i) for i in range(count)]
+        used = tracemalloc.get_traced_memory()[0] - before - sys.getsizeof(tables)
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    return used / count
+
+
+def measure(count: int = 1000, moves: int = 0, seed: int = 0) -> dict[str, float]:
+    """Bytes per table held as a live GameService and as a CompactTable."""
+    services = positions(count, moves, seed)
+    compact = [CompactTable.from_service(service) for service in services]
+    return {
+        "service": bytes_per_table(lambda i: compact[i].service(), count),
+        "compact": bytes_per_table(lambda i: CompactTable.from_service(services[i]), count),
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Report the memory held per idle table.")
+    parser.add_argument("--tables", type=int, default=1000)
+    parser.add_argument(
+        "--moves", type=int, nargs="+", default=[0, 60], help="actions played before measuring"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    over_budget = False
+    for moves in args.moves:
+        sizes = measure(args.tables, moves, args.seed)
+        over_budget |= sizes["compact"] > IDLE_BUDGET
+        print(
+            f"after {moves:>2} actions: GameService {sizes['service']:7.0f} B/table, "
+            f"CompactTable {sizes['compact']:5.0f} B/table "
+            f"({sizes['service'] / sizes['compact']:.1f}x smaller)"
+        )
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,382 @@
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
+from typing import BinaryIO, Callable, Iterator, Protocol, Sequence, Union, cast
+
+from briscola5.application.game_service import GameService
+from briscola5.application.record import (
+    ACTION_PHASE,
+    ActionKind,
+    GameRecord,
+    apply_action,
+    encode_action,
+    silenced,
+)
+from briscola5.bots.base import BaseBot
+from briscola5.bots.greedy_bot import GreedyBot
+from briscola5.bots.random_bot import RandomBot
+from briscola5.bots.simulator import deal_seeded, play_recorded
+from briscola5.domain.card import DECK_SIZE, card_from_index
+from briscola5.domain.rules import PLAYER_COUNT
+from briscola5.domain.snapshot import ZOBRIST, Snapshot
+
+_MAGIC = b"B5GC"
+_HEADER = struct.Struct("<4sI")
+_LENGTH = struct.Struct("<H")
+_OUTCOME = struct.Struct(f"<{PLAYER_COUNT}BbbQ")
+_MASK64 = (1 << 64) - 1
+_REFERENCE_SEED = 0x5EED
+
+
+class Engine(Protocol):
+    """What the differential tester drives: a deal, encoded actions and snapshots."""
+
+    def setup(self, dealer: int, deck: Sequence[int]) -> None: ...
+
+    def apply(self, action: int) -> bool: ...
+
+    def snapshot(self) -> Snapshot: ...
+
+
+class ServiceEngine:
+    """The reference engine: a GameService (or subclass) driven through `apply_action`."""
+
+    __slots__ = ("service",)
+
+    def __init__(self, service_class: type[GameService] = GameService) -> None:
+        self.service = service_class()
+
+    def setup(self, dealer: int, deck: Sequence[int]) -> None:
+        with silenced():
+            self.service.setup_game(dealer, deck=[card_from_index(i) for i in deck])
+
+    def apply(self, action: int) -> bool:
+        with silenced():
+            return apply_action(self.service, action)
+
+    def snapshot(self) -> Snapshot:
+        return Snapshot.from_state(self.service.state)
+
+
+EngineSpec = Union[str, type]
+
+
+def load_engine(spec: EngineSpec) -> Callable[[], Engine]:
+    """An engine factory from a class or a "module:Class" path.
+
+    GameService subclasses are wrapped in ServiceEngine; anything else must implement
+    the Engine protocol and be constructible without arguments.
+    """
+    if isinstance(spec, str):
+        module, _, name = spec.partition(":")
+        spec = getattr(import_module(module), name)
+    assert isinstance(spec, type)
+    engine_class = spec
+    if issubclass(engine_class, GameService):
+        return lambda: ServiceEngine(engine_class)
+    return cast(Callable[[], Engine], engine_class)
+
+
+class Outcome:
+    """Expected result of a golden game: final points, partner, winner and a trace digest.
+
+    The digest folds the Zobrist key of the snapshot after every action, so any
+    difference along the way shows up even when the final score agrees.
+    """
+
+    __slots__ = ("points", "partner", "caller_team_won", "digest")
+
+    def __init__(
+        self, points: Sequence[int], partner: int, caller_team_won: int, digest: int
+    ) -> None:
+        self.points = tuple(points)
+        self.partner = partner
+        self.caller_team_won = caller_team_won
+        self.digest = digest
+
+    def pack(self) -> bytes:
+        return _OUTCOME.pack(*self.points, self.partner, self.caller_team_won, self.digest)
+
+    @classmethod
+    def unpack(cls, data: bytes) -> Outcome:
+        *points, partner, won, digest = _OUTCOME.unpack(data)
+        return cls(points, partner, won, digest)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Outcome):
+            return False
+        return self.pack() == other.pack()
+
+    def __repr__(self) -> str:
+        return (
+            f"Outcome(points={self.points}, partner={self.partner}, "
+            f"caller_team_won={self.caller_team_won}, digest={self.digest:#x})"
+        )
+
+
+# Whether an action was accepted, or the name of the exception it raised.
+Result = Union[bool, str]
+
+
+def _result_code(result: Result) -> int:
+    return zlib.crc32(str(result).encode())
+
+
+def _run(engine: Engine, record: GameRecord) -> Iterator[tuple[Result, Snapshot]]:
+    """Deals and applies `record` on `engine`, yielding (result, snapshot) for the deal
+    and then for every action.
+
+    The global random state is fixed while the engine runs (a deal restarted after
+    five passes is shuffled with it) and restored afterwards.
+    """
+    saved = random.getstate()
+    random.seed(_REFERENCE_SEED)
+    try:
+        engine.setup(record.dealer, record.deck)
+        yield True, engine.snapshot()
+        for action in record.actions:
+            result: Result
+            try:
+                result = engine.apply(action)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                result = type(exc).__name__
+            yield result, engine.snapshot()
+    finally:
+        random.setstate(saved)
+
+
+def outcome(engine: Engine, record: GameRecord) -> Outcome:
+    digest = 0
+    for result, snapshot in _run(engine, record):
+        digest = (digest * 0x100000001B3 ^ ZOBRIST.key(snapshot) ^ _result_code(result)) & _MASK64
+    final = engine.snapshot()
+    return Outcome(final.points, final.partner, final.caller_team_won, digest)
+
+
+def random_record(seed: int, noise: float = 0.0) -> GameRecord:
+    """A seeded game played by a random lineup of Greedy and Random bots.
+
+    With `noise`, about that fraction of extra actions the rules reject is mixed in,
+    to compare how engines refuse moves too: actions of every kind outside their
+    phase, bids, passes and cards out of turn, and card values that are no card.
+    """
+    rng = random.Random(seed)
+    service = deal_seeded(seed % PLAYER_COUNT, rng)
+    bots: dict[int, BaseBot] = {
+        seat: rng.choice((GreedyBot, RandomBot))(player_id=seat) for seat in range(PLAYER_COUNT)
+    }
+    saved = random.getstate()
+    random.seed(seed)
+    try:
+        record = play_recorded(service, bots)
+    finally:
+        random.setstate(saved)
+    if record is None:  # the engine gave up mid-game: keep the deal, replay nothing
+        record = GameRecord.from_service(deal_seeded(seed % PLAYER_COUNT, random.Random(seed)))
+    if noise <= 0:
+        return record
+    engine = ServiceEngine()
+    engine.setup(record.dealer, record.deck)
+    actions = []
+    for action in record.actions:
+        state = engine.service.state
+        if rng.random() < noise:
+            kind, player = rng.choice(list(ActionKind)), rng.randrange(PLAYER_COUNT)
+            if ACTION_PHASE[kind] is state.phase:
+                if kind is ActionKind.CALL:  # any seat may call: pass out of phase instead
+                    kind = ActionKind.PASS
+                else:
+                    player = (state.turn.current_player + rng.randrange(1, PLAYER_COUNT)) % (
+                        PLAYER_COUNT
+                    )
+            value = rng.randrange(256 if kind is ActionKind.BID else DECK_SIZE + 24)
+            actions.append(encode_action(kind, player, value))
+        actions.append(action)
+        engine.apply(action)
+    return GameRecord(record.dealer, record.deck, actions)
+
+
+def write_corpus(file: BinaryIO, games: Sequence[tuple[GameRecord, Outcome]]) -> None:
+    file.write(_HEADER.pack(_MAGIC, len(games)))
+    for record, expected in games:
+        data = record.to_bytes()
+        file.write(_LENGTH.pack(len(data)) + data + expected.pack())
+
+
+def read_corpus(file: BinaryIO) -> Iterator[tuple[GameRecord, Outcome]]:
+    magic, count = _HEADER.unpack(file.read(_HEADER.size))
+    if magic != _MAGIC:
+        raise ValueError("Not a golden game corpus")
+    for _ in range(count):
+        (length,) = _LENGTH.unpack(file.read(_LENGTH.size))
+        record = GameRecord.from_bytes(file.read(length))
+        yield record, Outcome.unpack(file.read(_OUTCOME.size))
+
+
+def generate_corpus(
+    path: str | os.PathLike, games: int, seed: int = 0, noise: float = 0.05
+) -> None:
+    """Writes `games` seeded games with the reference engine's outcomes."""
+    corpus = []
+    for game in range(games):
+        record = random_record(seed * 1_000_003 + game, noise)
+        corpus.append((record, outcome(ServiceEngine(), record)))
+    with open(path, "wb") as file:
+        write_corpus(file, corpus)
+
+
+def verify_corpus(path: str | os.PathLike, engine: EngineSpec = GameService) -> list[int]:
+    """Indices of the corpus games whose outcome differs on `engine`."""
+    factory = load_engine(engine)
+    with open(path, "rb") as file:
+        return [
+            index
+            for index, (record, expected) in enumerate(read_corpus(file))
+            if outcome(factory(), record) != expected
+        ]
+
+
+def first_divergence(
+    candidate: Callable[[], Engine],
+    record: GameRecord,
+    reference: Callable[[], Engine] = ServiceEngine,
+) -> int | None:
+    """Number of actions applied when the engines first disagree (0: on the deal itself)."""
+    runs = zip(_run(reference(), record), _run(candidate(), record))
+    for index, (expected, actual) in enumerate(runs):
+        if expected != actual:
+            return index
+    return None
+
+
+def shrink(
+    candidate: Callable[[], Engine],
+    record: GameRecord,
+    reference: Callable[[], Engine] = ServiceEngine,
+) -> GameRecord:
+    """A shortest-found action sequence on the same deal on which the engines still differ.
+
+    Cuts the record at its first divergence, then removes ever smaller chunks of
+    actions (delta debugging) while the engines keep disagreeing.
+    """
+    index = first_divergence(candidate, record, reference)
+    if index is None:
+        raise ValueError("The engines agree on this record")
+    actions = record.actions[:index]
+
+    def diverges(subset: list[int]) -> bool:
+        trial = GameRecord(record.dealer, record.deck, subset)
+        return first_divergence(candidate, trial, reference) is not None
+
+    if diverges([]):
+        actions = []
+    chunks = 2
+    while len(actions) >= 2:
+        size = max(len(actions) // chunks, 1)
+        for start in range(0, len(actions), size):
+            trial = actions[:start] + actions[start + size :]
+            if diverges(trial):
+                actions = trial
+                chunks = max(chunks - 1, 2)
+                break
+        else:
+            if size == 1:
+                break
+            chunks = min(chunks * 2, len(actions))
+    return GameRecord(record.dealer, record.deck, actions)
+
+
+def diff_batch(
+    engine: EngineSpec, start: int, count: int, noise: float
+) -> tuple[int, int | None]:
+    """Worker entry point: (games run, first diverging seed or None) for seeds start..+count."""
+    candidate = load_engine(engine)
+    for seed in range(start, start + count):
+        if first_divergence(candidate, random_record(seed, noise)) is not None:
+            return seed - start + 1, seed
+    return count, None
+
+
+# pylint: disable=too-many-arguments, too-many-positional-arguments
+def differential_test(
+    engine: EngineSpec,
+    games: int,
+    workers: int = 1,
+    seed: int = 0,
+    noise: float = 0.05,
+    batch_size: int = 500,
+) -> tuple[int, GameRecord | None]:
+    """Runs `engine` against GameService on `games` random games.
+
+    Returns how many games were run and, on a divergence, the shrunk record of the
+    lowest diverging seed found. With several workers batches of seeds run in a
+    process pool; `engine` must then be importable ("module:Class" or a class).
+    """
+    batches = [
+        (seed + start, min(batch_size, games - start)) for start in range(0, games, batch_size)
+    ]
+    played, failing = 0, None
+    if workers <= 1:
+        results = (diff_batch(engine, start, count, noise) for start, count in batches)
+        for ran, failing in results:
+            played += ran
+            if failing is not None:
+                break
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(diff_batch, engine, start, count, noise) for start, count in batches
+            ]
+            # Batches are read in seed order, so the first failure is the lowest seed.
+            for future in futures:
+                ran, failing = future.result()
+                played += ran
+                if failing is not None:
+                    for pending in futures:
+                        pending.cancel()
+                    break
+    if failing is None:
+        return played, None
+    return played, shrink(load_engine(engine), random_record(failing, noise))
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Golden game corpus and differential tests.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    generate = commands.add_parser("generate", help="write a corpus of seeded games")
+    generate.add_argument("corpus")
+    generate.add_argument("--games", type=int, default=1000)
+    generate.add_argument("--seed", type=int, default=0)
+    verify = commands.add_parser("verify", help="replay a corpus on an engine")
+    verify.add_argument("corpus")
+    verify.add_argument("--engine", default="briscola5.application.game_service:GameService")
+    diff = commands.add_parser("diff", help="compare an engine with GameService")
+    diff.add_argument("engine", help='"module:Class" of the engine to test')
+    diff.add_argument("--games", type=int, default=100_000)
+    diff.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    diff.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.command == "generate":
+        generate_corpus(args.corpus, args.games, args.seed)
+        print(f"{args.games} golden games written to {args.corpus}")
+    elif args.command == "verify":
+        failures = verify_corpus(args.corpus, args.engine)
+        print(f"{len(failures)} games differ" + (f": {failures[:20]}" if failures else ""))
+    else:
+        played, record = differential_test(args.engine, args.games, args.workers, args.seed)
+        if record is None:
+            print(f"No divergence in {played} games")
+        else:
+            print(f"Divergence after {played} games; minimal reproduction:")
+            print(f"dealer={record.dealer} deck={list(record.deck)} actions={record.actions}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import time
+from typing import Sequence
+
+import numpy as np
+
+from briscola5.bots.greedy_bot import (
+    STRENGTH_CEILING,
+    STRENGTH_FLOOR,
+    GreedyBot,
+    evaluate_trump_suit,
+)
+from briscola5.bots.simulator import deal_seeded, play_recorded
+from briscola5.domain.card import DECK_SIZE, Rank, Suit, mask_to_cards
+from briscola5.domain.rules import (
+    BID_BUCKET_WIDTH,
+    MAX_TOTAL_POINTS,
+    MIN_BID,
+    NUM_BID_BUCKETS,
+    PLAYER_COUNT,
+)
+from briscola5.domain.state import Phase
+
+HAND_SIZE = DECK_SIZE // PLAYER_COUNT
+_RANKS = len(Rank)
+_SUIT_BITS = (1 << _RANKS) - 1
+_SHIFTS = np.arange(len(Suit), dtype=np.uint64) * np.uint64(_RANKS)
+
+
+def _suit_tables() -> tuple[np.ndarray, np.ndarray]:
+    """`evaluate_trump_suit` and the points of every subset of one suit's ten ranks.
+
+    Both only depend on the ranks held in the suit, so one table per quantity serves all
+    suits. The tables are filled by the scalar code, so results match it exactly.
+    """
+    values = np.empty(1 << _RANKS)
+    points = np.empty(1 << _RANKS, dtype=np.int64)
+    first_suit = next(iter(Suit))
+    for subset in range(1 << _RANKS):
+        cards = mask_to_cards(subset)  # bits 0..9 are the ranks of the first suit
+        values[subset] = evaluate_trump_suit(cards, first_suit)
+        points[subset] = sum(card.points for card in cards)
+    return values, points
+
+
+_TRUMP_VALUES, _SUIT_POINTS = _suit_tables()
+
+
+def hands_to_masks(hands: np.ndarray) -> np.ndarray:
+    """(..., 8) arrays of card indices to (...) uint64 40-bit hand masks."""
+    bits = np.left_shift(np.uint64(1), np.asarray(hands).astype(np.uint64))
+    masks: np.ndarray = np.bitwise_or.reduce(bits, axis=-1)
+    return masks
+
+
+def _suit_subsets(hands: np.ndarray) -> np.ndarray:
+    """(..., 4) rank subsets per suit of hands given as card indices or as masks.
+
+    One-dimensional integer arrays (and any uint64 array) are masks, whatever their
+    integer dtype; anything else holds card indices in its last axis.
+    """
+    hands = np.asarray(hands)
+    if hands.ndim == 1 or hands.dtype == np.uint64:
+        masks = hands.astype(np.uint64)
+    else:
+        masks = hands_to_masks(hands)
+    return ((masks[..., None] >> _SHIFTS) & np.uint64(_SUIT_BITS)).astype(np.intp)
+
+
+def evaluate_trump_suits(hands: np.ndarray) -> np.ndarray:
+    """`evaluate_trump_suit` for every suit: (..., 4) floats, columns in Suit order.
+
+    `hands` holds card indices in its last axis (e.g. (N, 8)), or is a 1-D array of
+    hand masks of any integer dtype (or a uint64 array of masks of any shape).
+    """
+    values: np.ndarray = _TRUMP_VALUES[_suit_subsets(hands)]
+    return values
+
+
+def estimate_hand_strengths(hands: np.ndarray) -> np.ndarray:
+    """`estimate_hand_strength` of each hand, for the inputs `evaluate_trump_suits` takes."""
+    subsets = _suit_subsets(hands)
+    strengths: np.ndarray = _SUIT_POINTS[subsets].sum(axis=-1) + _TRUMP_VALUES[subsets].max(
+        axis=-1
+    )
+    return strengths
+
+
+def max_bids(
+    strengths: np.ndarray, lowest: int = MIN_BID, highest: int = MAX_TOTAL_POINTS
+) -> np.ndarray:
+    """GreedyBot's `max_bid` for each strength (same constants, same rounding)."""
+    normalized = np.clip(
+        (strengths - STRENGTH_FLOOR) / (STRENGTH_CEILING - STRENGTH_FLOOR), 0.0, 1.0
+    )
+    bids: np.ndarray = np.rint(lowest + normalized * (highest - lowest)).astype(np.int64)
+    return bids
+
+
+def bid_buckets(targets: np.ndarray) -> np.ndarray:
+    """`shared_counters.bid_bucket` of each target."""
+    buckets: np.ndarray = np.clip(
+        (np.asarray(targets) - MIN_BID) // BID_BUCKET_WIDTH, 0, NUM_BID_BUCKETS - 1
+    )
+    return buckets
+
+
+def random_deals(count: int, rng: np.random.Generator) -> np.ndarray:
+    """`count` uniformly shuffled decks dealt as (count, 5, 8) card indices (int8)."""
+    decks = np.broadcast_to(np.arange(DECK_SIZE, dtype=np.int8), (count, DECK_SIZE))
+    dealt: np.ndarray = rng.permuted(decks, axis=1).reshape(count, PLAYER_COUNT, HAND_SIZE)
+    return dealt
+
+
+class StrengthSummary:
+    """Histograms of hand strength, one per bid bucket, filled in chunks.
+
+    Hands go to the bucket of the bid they are shown with, by default the limit
+    GreedyBot's `max_bid` gives their strength.
+    """
+
+    __slots__ = ("edges", "counts", "_sum", "_sum_squares")
+
+    def __init__(self, bins: int = 75, high: float = 150.0) -> None:
+        self.edges = np.linspace(0.0, high, bins + 1)
+        self.counts = np.zeros((NUM_BID_BUCKETS, bins), dtype=np.int64)
+        self._sum = 0.0
+        self._sum_squares = 0.0
+
+    def add(self, strengths: np.ndarray, buckets: np.ndarray | None = None) -> None:
+        if buckets is None:
+            buckets = bid_buckets(max_bids(strengths))
+        bins = self.counts.shape[1]
+        columns = np.clip(np.searchsorted(self.edges, strengths, side="right") - 1, 0, bins - 1)
+        cells = np.bincount(buckets * bins + columns, minlength=self.counts.size)
+        self.counts += cells.reshape(self.counts.shape)
+        self._sum += float(strengths.sum())
+        self._sum_squares += float(np.square(strengths).sum())
+
+    @property
+    def total(self) -> int:
+        return int(self.counts.sum())
+
+    @property
+    def histogram(self) -> np.ndarray:
+        """Counts per strength bin over all buckets."""
+        histogram: np.ndarray = self.counts.sum(axis=0)
+        return histogram
+
+    def mean(self) -> float:
+        """Mean strength; NaN while the summary is empty."""
+        total = self.total
+        return self._sum / total if total else math.nan
+
+    def std(self) -> float:
+        total = self.total
+        if not total:
+            return math.nan
+        return float(np.sqrt(max(self._sum_squares / total - self.mean() ** 2, 0.0)))
+
+    def bucket_shares(self) -> np.ndarray:
+        """Fraction of the hands in each bid bucket (NaN while the summary is empty)."""
+        sizes = self.counts.sum(axis=1)
+        if not self.total:
+            return np.full(len(sizes), math.nan)
+        shares: np.ndarray = sizes / self.total
+        return shares
+
+    def bucket_means(self) -> np.ndarray:
+        """Mean strength per bid bucket (bin centres; NaN for empty buckets)."""
+        centres = (self.edges[:-1] + self.edges[1:]) / 2
+        sizes = self.counts.sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means: np.ndarray = self.counts @ centres / sizes
+        return means
+
+
+def summarize_deals(num_deals: int, seed: int = 0, chunk: int = 250_000) -> StrengthSummary:
+    """Strength summary of every hand of `num_deals` random deals, in bounded memory."""
+    rng = np.random.default_rng(seed)
+    summary = StrengthSummary()
+    for start in range(0, num_deals, chunk):
+        hands = random_deals(min(chunk, num_deals - start), rng).reshape(-1, HAND_SIZE)
+        summary.add(estimate_hand_strengths(hands))
+    return summary
+
+
+class PlayedStrengths:
+    """Dealt hand strengths next to the points actually won, from GreedyBot games."""
+
+    __slots__ = ("strengths", "points", "callers", "targets", "team_points")
+
+    def __init__(
+        self,
+        strengths: np.ndarray,
+        points: np.ndarray,
+        callers: np.ndarray,
+        targets: np.ndarray,
+        team_points: np.ndarray,
+    ) -> None:
+        self.strengths = strengths  # (games, 5), by seat
+        self.points = points  # (games, 5) card points each seat won
+        self.callers = callers
+        self.targets = targets
+        self.team_points = team_points  # caller team points
+
+    @property
+    def caller_strengths(self) -> np.ndarray:
+        strengths: np.ndarray = self.strengths[np.arange(len(self.callers)), self.callers]
+        return strengths
+
+    def seat_correlation(self) -> float:
+        """Pearson r between a seat's dealt strength and the points it won."""
+        return float(np.corrcoef(self.strengths.ravel(), self.points.ravel())[0, 1])
+
+    def caller_correlation(self) -> float:
+        """Pearson r between the caller's dealt strength and its team's points."""
+        return float(np.corrcoef(self.caller_strengths, self.team_points)[0, 1])
+
+    def by_target(self) -> StrengthSummary:
+        """Caller strengths histogrammed by the bucket of the bid that won the auction."""
+        summary = StrengthSummary()
+        summary.add(self.caller_strengths, bid_buckets(self.targets))
+        return summary
+
+
+def play_strengths(num_games: int, seed: int = 0) -> PlayedStrengths:
+    """Plays seeded all-GreedyBot games and collects `PlayedStrengths`.
+
+    Deals the engine cannot finish are skipped, as in `simulate_records`.
+    """
+    rng = random.Random(seed)
+    decks, points, callers, targets, team_points = [], [], [], [], []
+    for game in range(num_games):
+        service = deal_seeded(game % PLAYER_COUNT, rng)
+        record = play_recorded(service, {seat: GreedyBot(seat) for seat in range(PLAYER_COUNT)})
+        if record is None:
+            continue
+        state = service.state
+        team = state.team_points_if_known()
+        if state.phase != Phase.GAME_OVER or team is None or state.call.target_points is None:
+            continue
+        decks.append(record.deck)  # the deck dealt last, after any all-pass re-deal
+        points.append(state.score.player_points)
+        callers.append(state.call.caller_player)
+        targets.append(state.call.target_points)
+        team_points.append(team[0])
+    hands = np.array(decks, dtype=np.int8).reshape((-1, PLAYER_COUNT, HAND_SIZE))
+    return PlayedStrengths(
+        strengths=estimate_hand_strengths(hands),
+        points=np.array(points),
+        callers=np.array(callers),
+        targets=np.array(targets),
+        team_points=np.array(team_points),
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Summarize hand strength over random deals.")
+    parser.add_argument("--deals", type=int, default=10_000_000)
+    parser.add_argument("--games", type=int, default=2000, help="GreedyBot games to correlate")
+    parser.add_argument("--chunk", type=int, default=250_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    if args.deals <= 0:
+        parser.error("--deals must be positive")
+
+    start = time.perf_counter()
+    summary = summarize_deals(args.deals, args.seed, args.chunk)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{args.deals} deals ({summary.total} hands) in {elapsed:.1f}s: "
+        f"strength {summary.mean():.1f} +- {summary.std():.1f}"
+    )
+    for bucket, (share, mean) in enumerate(zip(summary.bucket_shares(), summary.bucket_means())):
+        low = MIN_BID + bucket * BID_BUCKET_WIDTH
+        print(f"  max bid {low:3d}+: {share:6.1%} of hands, mean strength {mean:5.1f}")
+
+    if args.games:
+        played = play_strengths(args.games, args.seed)
+        print(
+            f"{len(played.callers)} GreedyBot games: r(seat strength, points won) = "
+            f"{played.seat_correlation():.3f}, r(caller strength, team points) = "
+            f"{played.caller_correlation():.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import contextlib
+import struct
+from typing import Hashable, Iterator, Sequence
+
+from briscola5.application.game_service import GameService
+from briscola5.domain.card import (
+    DECK_SIZE,
+    card_from_index,
+    card_index,
+    cards_to_mask,
+    mask_to_cards,
+)
+from briscola5.domain.rules import PLAYER_COUNT, STANDARD_RULES, RuleSet
+from briscola5.domain.snapshot import NONE, PHASE_INDEX, PHASES, SUIT_INDEX, SUITS
+from briscola5.domain.state import AuctionState, GameState
+from briscola5.domain.trick import PlayedCard
+from briscola5.domain.view import Observation
+
+SCALARS = 16
+# Deck order, the scalar fields, points, won-card masks, then trick and hand lengths;
+# the cards of the hands (in hand order) and the trick entries (`player * 40 + card`,
+# in play order) follow the fixed part.
+_FIXED = struct.Struct(f"<{DECK_SIZE}B{SCALARS}b{PLAYER_COUNT}B{PLAYER_COUNT}QB{PLAYER_COUNT}B")
+_POINTS = DECK_SIZE + SCALARS
+_WON = _POINTS + PLAYER_COUNT
+_LENGTHS = _WON + PLAYER_COUNT
+
+
+def _opt(value: int | None) -> int:
+    return NONE if value is None else value
+
+
+def _unopt(value: int) -> int | None:
+    return None if value == NONE else value
+
+
+def pack_scalars(
+    state: Observation, current: int, dealer: int, partner: int | None
+) -> tuple[int, ...]:
+    """The SCALARS fields of a position; `partner` is the partner as far as it is known."""
+    auction, call = state.auction, state.call
+    return (
+        PHASE_INDEX[state.phase],
+        current,
+        dealer,
+        auction.start_player,
+        auction.current_player,
+        state.trick.index,
+        _opt(auction.last_bid),
+        _opt(auction.last_bidder),
+        sum(1 << seat for seat, passed in enumerate(auction.passed) if passed),
+        _opt(call.caller_player),
+        _opt(call.target_points),
+        NONE if call.trump_suit is None else SUIT_INDEX[call.trump_suit],
+        NONE if call.called_card is None else card_index(call.called_card),
+        _opt(partner),
+        call.partner_revealed,
+        NONE if call.caller_team_won is None else int(call.caller_team_won),
+    )
+
+
+def restore_scalars(state: GameState, scalars: Sequence[int]) -> None:
+    """Sets the SCALARS fields packed by `CompactTable.from_service` on `state`."""
+    # pylint: disable=too-many-locals
+    (
+        phase,
+        current,
+        dealer,
+        start,
+        auction_current,
+        trick_index,
+        last_bid,
+        last_bidder,
+        passed,
+        caller,
+        target,
+        trump,
+        called,
+        partner,
+        revealed,
+        won,
+    ) = scalars
+    state.phase = PHASES[phase]
+    state.turn.current_player = current
+    state.turn.dealer_player = dealer
+    state.trick.index = trick_index
+
+    auction = state.auction = AuctionState(PLAYER_COUNT, start)
+    auction.current_player = auction_current
+    auction.last_bid = _unopt(last_bid)
+    auction.last_bidder = _unopt(last_bidder)
+    auction.passed = [bool(passed >> seat & 1) for seat in range(PLAYER_COUNT)]
+
+    call = state.call
+    call.caller_player = _unopt(caller)
+    call.target_points = _unopt(target)
+    call.trump_suit = None if trump == NONE else SUITS[trump]
+    call.called_card = None if called == NONE else card_from_index(called)
+    call.partner_player_internal = _unopt(partner)
+    call.partner_revealed = bool(revealed)
+    call.caller_team_won = None if won == NONE else bool(won)
+
+
+class CompactTable:
+    """A table packed into one immutable `bytes` record of 107 to 152 bytes.
+
+    Unlike a Snapshot it keeps everything a GameService holds, including the dealt
+    deck and the order of cards in each hand, so a table can be packed between
+    moves and resumed exactly: bots and players address cards by hand index.
+    """
+
+    __slots__ = ("record", "rules")
+
+    def __init__(self, record: bytes, rules: RuleSet = STANDARD_RULES) -> None:
+        self.record = record
+        self.rules = rules
+
+    @classmethod
+    def from_service(cls, service: GameService) -> CompactTable:
+        state = service.state
+        partner = state.call.partner_player_internal
+        scalars = pack_scalars(
+            state, state.turn.current_player, state.turn.dealer_player, partner
+        )
+        fixed = _FIXED.pack(
+            *(card_index(card) for card in service.deck),
+            *scalars,
+            *state.score.player_points,
+            *(cards_to_mask(cards) for cards in state.score.won_cards),
+            len(state.trick.played),
+            *(len(hand) for hand in state.hands),
+        )
+        cards = bytes(card_index(card) for hand in state.hands for card in hand)
+        trick = bytes(pc.player_id * DECK_SIZE + card_index(pc.card) for pc in state.trick.played)
+        return cls(fixed + cards + trick, state.rules)
+
+    def service(self) -> GameService:
+        """A new live GameService in exactly the packed position."""
+        fields = _FIXED.unpack_from(self.record)
+        service = GameService(self.rules)
+        service.deck = [card_from_index(i) for i in fields[:DECK_SIZE]]
+        state = service.state
+        restore_scalars(state, fields[DECK_SIZE:_POINTS])
+
+        offset = _FIXED.size
+        for seat, length in enumerate(fields[_LENGTHS + 1 :]):
+            state.hands[seat] = [
+                card_from_index(i) for i in self.record[offset : offset + length]
+            ]
+            offset += length
+        state.trick.played = [
+            PlayedCard(player_id=entry // DECK_SIZE, card=card_from_index(entry % DECK_SIZE))
+            for entry in self.record[offset : offset + fields[_LENGTHS]]
+        ]
+        state.score.player_points = list(fields[_POINTS:_WON])
+        state.score.won_cards = [mask_to_cards(mask) for mask in fields[_WON:_LENGTHS]]
+        return service
+
+    def __len__(self) -> int:
+        return len(self.record)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactTable):
+            return False
+        return self.record == other.record and self.rules is other.rules
+
+    def __hash__(self) -> int:
+        return hash(self.record)
+
+    def __repr__(self) -> str:
+        return f"CompactTable({len(self.record)} bytes)"
+
+
+class TableStore:
+    """Idle tables kept packed; a table is only a GameService while `open`."""
+
+    def __init__(self) -> None:
+        self._tables: dict[Hashable, CompactTable] = {}
+
+    def add(self, table_id: Hashable, service: GameService) -> None:
+        self._tables[table_id] = CompactTable.from_service(service)
+
+    def remove(self, table_id: Hashable) -> None:
+        del self._tables[table_id]
+
+    def get(self, table_id: Hashable) -> CompactTable:
+        return self._tables[table_id]
+
+    def set(self, table_id: Hashable, table: CompactTable) -> None:
+        self._tables[table_id] = table
+
+    def items(self) -> Iterator[tuple[Hashable, CompactTable]]:
+        return iter(self._tables.items())
+
+    @contextlib.contextmanager
+    def open(self, table_id: Hashable) -> Iterator[GameService]:
+        """Materialises the table and packs it again when the block exits normally.
+
+        If the block raises, the table keeps the position it had before.
+        """
+        service = self._tables[table_id].service()
+        yield service
+        self._tables[table_id] = CompactTable.from_service(service)
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def __contains__(self, table_id: object) -> bool:
+        return table_id in self._tables
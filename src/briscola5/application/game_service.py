@@ -2,26 +2,39 @@ from __future__ import annotations
 
 import random
 
-from briscola5.domain.card import Card, Rank, Suit, full_deck
+from briscola5.domain.card import Card, Rank, Suit, cards_to_mask, full_deck
 from briscola5.domain.color_cli import Col
-from briscola5.domain.state import GameState, Phase
+from briscola5.domain.rules import STANDARD_RULES, RuleSet
+from briscola5.domain.state import PLAYER_COUNT, AuctionState, GameState, Phase
 from briscola5.domain.trick import PlayedCard, resolve_trick, trick_points
 
 
 class GameService:
     """Service to orchestrate the Briscola in 5 game logic and transitions."""
 
-    def __init__(self):
-        self.state = GameState()
+    def __init__(self, rules: RuleSet = STANDARD_RULES):
+        self.rules = rules
+        self.state = GameState(rules)
         self.deck = full_deck()
 
-    def setup_game(self, dealer_id: int):
-        """Initializes the deck, deals hands, and sets the starting auction player."""
+    def setup_game(self, dealer_id: int, deck: list[Card] | None = None):
+        """Initializes the deck, deals hands, and sets the starting auction player.
+
+        When `deck` is given it is dealt in that order instead of being shuffled,
+        so a deal can be replayed exactly.
+        """
         print(f"{Col.BOLD}--- Start Game ---{Col.RESET}")
-        random.shuffle(self.deck)
+        if deck is None:
+            random.shuffle(self.deck)
+        else:
+            self.deck = list(deck)
+        self.state.auction = AuctionState(
+            player_count=PLAYER_COUNT, start_player=(dealer_id + 1) % PLAYER_COUNT
+        )
+        hand_size = self.rules.hand_size
         for i in range(5):
-            start = i * 8
-            end = start + 8
+            start = i * hand_size
+            end = start + hand_size
             self.state.hands[i] = self.deck[start:end]
         self.state.turn.dealer_player = dealer_id
         self.state.turn.current_player = (dealer_id + 1) % 5
@@ -48,10 +61,7 @@ class GameService:
                 print(f"{Col.RED}Error: Cannot play card.{Col.RESET}")
                 print(f"{Col.RED}Target points not set in call.{Col.RESET}")
                 return False
-            pt = self.state.call.target_points
-            for card_played in self.state.trick.played:
-                pt += card_played.card.points
-            if self.state.hands[player_id][card_index].points + pt > 120:
+            if not self.state.is_legal_discard(self.state.hands[player_id][card_index]):
                 print(f"{Col.RED}Error:{Col.BOLD}")
                 print(
                     f"{Col.RED}Cannot play {self.state.hands[player_id][card_index]}{Col.RESET}"
@@ -92,11 +102,11 @@ class GameService:
                 f"{Col.RED}Error: Called card {called_card_obj} are in caller's hand!{Col.RESET}"
             )
             return False
-        for card_played in self.state.trick.played:
-            if card_played.card == called_card_obj:
-                print(f"{Col.RED}Error: Called card {called_card_obj}{Col.RESET}")
-                print(f"{Col.RED}is already played in the first trick!{Col.RESET}")
-                return False
+        dead_trick = cards_to_mask(pc.card for pc in self.state.trick.played)
+        if self.rules.forbidden_calls(0, dead_trick) & cards_to_mask([called_card_obj]):
+            print(f"{Col.RED}Error: Called card {called_card_obj}{Col.RESET}")
+            print(f"{Col.RED}is already played in the first trick!{Col.RESET}")
+            return False
         self.state.call.trump_suit = suit
         self.state.call.called_card = called_card_obj
 
@@ -122,20 +132,20 @@ class GameService:
         print(f"{Col.BOLD}Player {winner_id} starts next round.{Col.RESET}")
         return True
 
-    def auction_phase(self, player_id: int, offer: int | None):
-        """Manages auction bids and determines the caller."""
+    def auction_phase(self, player_id: int, offer: int | None) -> bool:
+        """Manages auction bids and determines the caller; returns False on a rejected turn."""
         auction = self.state.auction
         if player_id != self.state.turn.current_player:
             print(f"{Col.RED}Error: Expected Player {self.state.turn.current_player}{Col.RESET}")
-            return
+            return False
         if offer is None:
             auction.passed[player_id] = True
             print(f"{Col.RED}Player {player_id} PASSED.{Col.RESET}")
         else:
-            last_bid = auction.last_bid if auction.last_bid is not None else 70
-            if offer <= last_bid:
-                print(f"{Col.RED}Error: Bid {offer} too low (Last: {last_bid}){Col.RESET}")
-                return
+            if not self.rules.is_valid_bid(offer, auction.last_bid):
+                lowest, highest = self.rules.opening_bid(auction.last_bid), self.rules.max_bid
+                print(f"{Col.RED}Error: Bid {offer} outside {lowest}-{highest}{Col.RESET}")
+                return False
             auction.last_bid = offer
             auction.last_bidder = player_id
             print(f"{Col.GREEN}Player {player_id} bids {offer}!{Col.RESET}")
@@ -147,9 +157,9 @@ class GameService:
             print(f"{Col.RED}Error: No valid bids placed. Cannot conclude auction.{Col.RESET}")
             print(f"{Col.RED}All players passed. Restarting game...{Col.RESET}")
             self.setup_game(self.state.turn.dealer_player)
-            return
         else:
             self._next_player_auction()
+        return True
 
     def _next_player_auction(self):
         current = self.state.turn.current_player
@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+import os
+import struct
+import time
+import zlib
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+from briscola5.application.compact import CompactTable, TableStore
+from briscola5.application.game_service import GameService
+from briscola5.application.record import ActionKind, apply_action, decode_action, silenced
+from briscola5.domain.card import DECK_SIZE, card_from_index, card_index
+from briscola5.domain.rules import STANDARD_RULES, RuleSet
+
+# Frames are `length, crc32` followed by `length` bytes of entries. Each entry starts
+# with its kind and table id; ACTION carries one encoded action (see record.py), DEAL
+# the dealer, dealt deck and rules of a (re)started table.
+_FRAME = struct.Struct("<II")
+_ENTRY = struct.Struct("<BI")
+_ACTION = struct.Struct("<H")
+_DEAL = struct.Struct(f"<B{DECK_SIZE}B")
+_RULES = struct.Struct("<BBhB")
+RULES_SIZE = _RULES.size
+_SNAPSHOT_MAGIC = b"B5SN"
+_SNAPSHOT_TABLE = struct.Struct("<IH")
+
+ACTION, DEAL, CLOSE = 0, 1, 2
+_BODY_SIZE = {ACTION: _ACTION.size, DEAL: _DEAL.size + _RULES.size, CLOSE: 0}
+
+_rules_cache: dict[tuple[int, int, int, int], RuleSet] = {}
+
+
+def pack_rules(rules: RuleSet) -> bytes:
+    cap = -1 if rules.dead_trick_cap is None else rules.dead_trick_cap
+    return _RULES.pack(rules.min_bid, rules.max_bid, cap, rules.call_discarded_card)
+
+
+def unpack_rules(data: bytes | memoryview, offset: int = 0) -> RuleSet:
+    """Rule sets read back are shared, so tables keep pointing at few objects."""
+    fields = _RULES.unpack_from(data, offset)
+    rules = _rules_cache.get(fields)
+    if rules is None:
+        if fields == _RULES.unpack(pack_rules(STANDARD_RULES)):
+            rules = STANDARD_RULES
+        else:
+            min_bid, max_bid, cap, discarded = fields
+            rules = RuleSet(
+                min_bid=min_bid,
+                max_bid=max_bid,
+                dead_trick_cap=None if cap < 0 else cap,
+                call_discarded_card=bool(discarded),
+            )
+        _rules_cache[fields] = rules
+    return rules
+
+
+def _segments(directory: Path, prefix: str) -> list[tuple[int, Path]]:
+    found = []
+    for path in directory.glob(f"{prefix}-*"):
+        stem = path.name[len(prefix) + 1 :].split(".")[0]
+        if stem.isdigit() and not path.name.endswith(".tmp"):
+            found.append((int(stem), path))
+    return sorted(found)
+
+
+def read_frames(path: Path) -> Iterator[bytes]:
+    """Payloads of the complete, intact frames of a log segment.
+
+    Reading stops at the first short or corrupt frame: that is where a crash cut the
+    last group commit, which was therefore never acknowledged.
+    """
+    data = path.read_bytes()
+    offset = 0
+    while offset + _FRAME.size <= len(data):
+        length, crc = _FRAME.unpack_from(data, offset)
+        payload = data[offset + _FRAME.size : offset + _FRAME.size + length]
+        if len(payload) < length or zlib.crc32(payload) != crc:
+            return
+        yield payload
+        offset += _FRAME.size + length
+
+
+def iter_entries(payload: bytes) -> Iterator[tuple[int, int, bytes]]:
+    """(kind, table id, body) for each entry of a frame."""
+    offset = 0
+    while offset < len(payload):
+        kind, table_id = _ENTRY.unpack_from(payload, offset)
+        offset += _ENTRY.size
+        size = _BODY_SIZE[kind]
+        yield kind, table_id, payload[offset : offset + size]
+        offset += size
+
+
+class WriteAheadLog:
+    """Append-only, CRC-framed log segments with group commit.
+
+    Appends are buffered; `commit` writes them as one frame with one write and one
+    fsync, so many tables share the cost of making their moves durable. An entry is
+    durable once the `commit` that wrote it has returned.
+    """
+
+    __slots__ = ("directory", "sequence", "sync", "_file", "_buffer", "_pending")
+
+    def __init__(self, directory: Path, sequence: int, sync: bool = True) -> None:
+        self.directory = directory
+        self.sequence = sequence
+        self.sync = sync
+        self._file = self._open()
+        self._buffer = bytearray()
+        self._pending = 0
+
+    def _open(self) -> BinaryIO:
+        path = self.directory / f"wal-{self.sequence:08d}.log"
+        return open(path, "ab")  # pylint: disable=consider-using-with
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def append_action(self, table_id: int, action: int) -> None:
+        self._buffer += _ENTRY.pack(ACTION, table_id) + _ACTION.pack(action)
+        self._pending += 1
+
+    def append_deal(self, table_id: int, service: GameService) -> None:
+        dealer = service.state.turn.dealer_player
+        deck = (card_index(card) for card in service.deck)
+        self._buffer += _ENTRY.pack(DEAL, table_id) + _DEAL.pack(dealer, *deck)
+        self._buffer += pack_rules(service.rules)
+        self._pending += 1
+
+    def append_close(self, table_id: int) -> None:
+        self._buffer += _ENTRY.pack(CLOSE, table_id)
+        self._pending += 1
+
+    def commit(self) -> None:
+        if not self._buffer:
+            return
+        payload = bytes(self._buffer)
+        self._file.write(_FRAME.pack(len(payload), zlib.crc32(payload)) + payload)
+        self._file.flush()
+        if self.sync:
+            os.fsync(self._file.fileno())
+        self._buffer.clear()
+        self._pending = 0
+
+    def rotate(self) -> None:
+        """Commits, then continues in the next segment."""
+        self.commit()
+        self._file.close()
+        self.sequence += 1
+        self._file = self._open()
+
+    def close(self) -> None:
+        self.commit()
+        self._file.close()
+
+
+def _deal(body: bytes) -> GameService:
+    dealer, *deck = _DEAL.unpack_from(body)
+    service = GameService(unpack_rules(body, _DEAL.size))
+    with silenced():
+        service.setup_game(dealer, deck=[card_from_index(i) for i in deck])
+    return service
+
+
+class DurableTables:  # pylint: disable=too-many-instance-attributes
+    """A TableStore whose changes are logged before they are acknowledged.
+
+    Opening a directory restores every table: the newest snapshot is loaded as packed
+    records and only the log written after it is replayed. `checkpoint` (also run
+    every `snapshot_every` logged entries) writes a new snapshot atomically and
+    drops the segments it covers, which bounds recovery time. Appends are made
+    durable in groups, when `group_size` entries are pending or when the host calls
+    `commit`, typically once per event-loop iteration.
+    """
+
+    # pylint: disable-next=too-many-arguments
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        *,
+        group_size: int = 256,
+        snapshot_every: int = 100_000,
+        sync: bool = True,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.group_size = group_size
+        self.snapshot_every = snapshot_every
+        self.store = TableStore()
+        self.recovery_stats: dict[str, float] = {}
+        self._since_snapshot = 0
+        sequence = self._recover()
+        self.log = WriteAheadLog(self.directory, sequence, sync)
+
+    def _recover(self) -> int:
+        """Restores the tables; returns the sequence number for the next log segment."""
+        start = time.perf_counter()
+        snapshot_seq = 0
+        snapshots = _segments(self.directory, "snapshot")
+        if snapshots:
+            snapshot_seq, path = snapshots[-1]
+            self._load_snapshot(path.read_bytes())
+
+        live: dict[int, GameService] = {}
+        replayed = 0
+        segments = [seq for seq, _ in _segments(self.directory, "wal") if seq >= snapshot_seq]
+        for seq in segments:
+            for payload in read_frames(self.directory / f"wal-{seq:08d}.log"):
+                for kind, table_id, body in iter_entries(payload):
+                    self._replay(live, kind, table_id, body)
+                    replayed += 1
+        for table_id, service in live.items():
+            self.store.add(table_id, service)
+        self._since_snapshot = replayed
+        self.recovery_stats = {
+            "tables": len(self.store),
+            "entries": replayed,
+            "seconds": time.perf_counter() - start,
+        }
+        return max(segments, default=snapshot_seq) + 1
+
+    def _replay(
+        self, live: dict[int, GameService], kind: int, table_id: int, body: bytes
+    ) -> None:
+        """Applies one entry; tables stay materialised in `live` until recovery ends."""
+        if kind == DEAL:
+            live[table_id] = _deal(body)
+            return
+        if kind == CLOSE:
+            live.pop(table_id, None)
+            if table_id in self.store:
+                self.store.remove(table_id)
+            return
+        service = live.get(table_id)
+        if service is None:
+            service = live[table_id] = self.store.get(table_id).service()
+        with silenced():
+            apply_action(service, _ACTION.unpack(body)[0])
+
+    def _load_snapshot(self, data: bytes) -> None:
+        if data[:4] != _SNAPSHOT_MAGIC or zlib.crc32(data[8:]) != int.from_bytes(
+            data[4:8], "little"
+        ):
+            raise ValueError("Corrupt table snapshot")
+        offset = 8
+        while offset < len(data):
+            table_id, length = _SNAPSHOT_TABLE.unpack_from(data, offset)
+            offset += _SNAPSHOT_TABLE.size
+            rules = unpack_rules(data, offset)
+            offset += _RULES.size
+            self.store.set(table_id, CompactTable(data[offset : offset + length], rules))
+            offset += length
+
+    def create(self, table_id: int, service: GameService) -> None:
+        """Adds a dealt table; its deal is logged so recovery can replay from it."""
+        self.store.add(table_id, service)
+        self.log.append_deal(table_id, service)
+        self._logged()
+
+    def apply(self, table_id: int, action: int) -> bool:
+        """Applies an encoded action and logs it if the service accepted it.
+
+        A pass that ends an auction without bids makes the engine re-deal; the new
+        deal is logged too, since it cannot be replayed from the action.
+        """
+        with self.store.open(table_id) as service:
+            redeal = decode_action(action)[0] is ActionKind.PASS
+            deck = list(service.deck) if redeal else None
+            with silenced():
+                accepted = apply_action(service, action)
+            if accepted:
+                self.log.append_action(table_id, action)
+                self._logged()
+                if redeal and service.deck != deck:
+                    self.log.append_deal(table_id, service)
+                    self._logged()
+        return accepted
+
+    def close_table(self, table_id: int) -> None:
+        self.store.remove(table_id)
+        self.log.append_close(table_id)
+        self._logged()
+
+    def _logged(self) -> None:
+        self._since_snapshot += 1
+        if self.log.pending >= self.group_size:
+            self.commit()
+
+    def commit(self) -> None:
+        self.log.commit()
+        if self._since_snapshot >= self.snapshot_every:
+            self.checkpoint()
+
+    def checkpoint(self) -> None:
+        """Writes a snapshot of every table and deletes the log segments it replaces."""
+        self.log.rotate()
+        sequence = self.log.sequence
+        parts = []
+        for table_id, table in self.store.items():
+            parts.append(_SNAPSHOT_TABLE.pack(table_id, len(table.record)))
+            parts.append(pack_rules(table.rules) + table.record)
+        body = b"".join(parts)
+        header = _SNAPSHOT_MAGIC + zlib.crc32(body).to_bytes(4, "little")
+
+        target = self.directory / f"snapshot-{sequence:08d}.bin"
+        tmp = target.with_suffix(".tmp")
+        with open(tmp, "wb") as file:
+            file.write(header + body)
+            file.flush()
+            if self.log.sync:
+                os.fsync(file.fileno())
+        os.replace(tmp, target)
+        for seq, path in _segments(self.directory, "snapshot") + _segments(self.directory, "wal"):
+            if seq < sequence:
+                path.unlink()
+        self._since_snapshot = 0
+
+    def close(self) -> None:
+        self.log.close()
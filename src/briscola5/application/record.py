@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import contextlib
+import struct
+from enum import IntEnum
+from typing import BinaryIO, Iterable, Iterator, Sequence
+
+from briscola5.application.game_service import GameService
+from briscola5.domain.card import DECK_SIZE, card_from_index, card_index
+from briscola5.domain.rules import PLAYER_COUNT
+from briscola5.domain.state import Phase
+
+_HEADER = struct.Struct(f"<B{DECK_SIZE}BH")
+_LENGTH = struct.Struct("<H")
+
+
+class ActionKind(IntEnum):
+    BID = 0
+    PASS = 1
+    DISCARD = 2
+    CALL = 3
+    PLAY = 4
+
+
+# The only phase in which each kind of action may be applied.
+ACTION_PHASE = {
+    ActionKind.BID: Phase.AUCTION,
+    ActionKind.PASS: Phase.AUCTION,
+    ActionKind.DISCARD: Phase.DEAD_TRICK_PLAY,
+    ActionKind.CALL: Phase.DEAD_TRICK_CALL,
+    ActionKind.PLAY: Phase.TRICK_PLAY,
+}
+
+
+def encode_action(kind: ActionKind, player_id: int, value: int = 0) -> int:
+    """Packs an action into a 16-bit int: kind (3 bits), player (3 bits), value (8 bits).
+
+    `value` is the bid for BID and the 0..39 card index for DISCARD, CALL and PLAY.
+    """
+    return kind << 11 | player_id << 8 | value
+
+
+def decode_action(action: int) -> tuple[ActionKind, int, int]:
+    return ActionKind(action >> 11), action >> 8 & 0x7, action & 0xFF
+
+
+class GameRecord:
+    """A dealt deck plus the ordered list of encoded actions applied to it."""
+
+    __slots__ = ("dealer", "deck", "actions")
+
+    def __init__(
+        self, dealer: int, deck: Sequence[int], actions: list[int] | None = None
+    ) -> None:
+        if len(deck) != DECK_SIZE:
+            raise ValueError(f"Expected {DECK_SIZE} cards in deck, got {len(deck)}")
+        self.dealer = dealer
+        self.deck: tuple[int, ...] = tuple(deck)
+        self.actions: list[int] = actions if actions is not None else []
+
+    @classmethod
+    def from_service(cls, service: GameService) -> GameRecord:
+        """Starts a record from the deal currently held by `service`."""
+        deck = [card_index(card) for card in service.deck]
+        return cls(service.state.turn.dealer_player, deck)
+
+    def append(self, kind: ActionKind, player_id: int, value: int = 0) -> None:
+        self.actions.append(encode_action(kind, player_id, value))
+
+    def to_bytes(self) -> bytes:
+        header = _HEADER.pack(self.dealer, *self.deck, len(self.actions))
+        return header + struct.pack(f"<{len(self.actions)}H", *self.actions)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> GameRecord:
+        fields = _HEADER.unpack_from(data)
+        count = fields[-1]
+        actions = list(struct.unpack_from(f"<{count}H", data, _HEADER.size))
+        return cls(fields[0], fields[1:-1], actions)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, GameRecord):
+            return False
+        return (self.dealer, self.deck, self.actions) == (other.dealer, other.deck, other.actions)
+
+    def __repr__(self) -> str:
+        return f"GameRecord(dealer={self.dealer}, actions={len(self.actions)})"
+
+
+def write_records(file: BinaryIO, records: Iterable[GameRecord]) -> int:
+    """Appends records as length-prefixed `to_bytes()` blobs; returns how many."""
+    count = 0
+    for record in records:
+        data = record.to_bytes()
+        file.write(_LENGTH.pack(len(data)) + data)
+        count += 1
+    return count
+
+
+def read_records(file: BinaryIO) -> Iterator[GameRecord]:
+    """Records written by `write_records`, read one at a time."""
+    while prefix := file.read(_LENGTH.size):
+        (length,) = _LENGTH.unpack(prefix)
+        yield GameRecord.from_bytes(file.read(length))
+
+
+class _NullWriter:
+    def write(self, text: str) -> int:
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+def silenced() -> contextlib.AbstractContextManager:
+    """Discards the service's console output, cheaper than writing to os.devnull."""
+    return contextlib.redirect_stdout(_NullWriter())  # type: ignore[type-var]
+
+
+def apply_action(service: GameService, action: int) -> bool:
+    """Applies an encoded action to `service`; returns False if the service rejected it.
+
+    Actions out of their phase, for a seat that does not exist or for a card that does
+    not exist are rejected here, before the service sees them: encoded actions may
+    come from untrusted clients.
+    """
+    kind, player_id, value = decode_action(action)
+    if (
+        service.state.phase is not ACTION_PHASE[kind]
+        or player_id >= PLAYER_COUNT
+        or value >= DECK_SIZE
+        and kind not in (ActionKind.BID, ActionKind.PASS)
+    ):
+        return False
+    if kind is ActionKind.BID:
+        return service.auction_phase(player_id, value)
+    if kind is ActionKind.PASS:
+        return service.auction_phase(player_id, None)
+    card = card_from_index(value)
+    if kind is ActionKind.CALL:
+        return service.make_call(card.suit, card.rank)
+    hand = service.state.hands[player_id]
+    if card not in hand:
+        return False
+    return service.play_card(player_id, hand.index(card))
+
+
+def replay(record: GameRecord) -> Iterator[tuple[GameService, int]]:
+    """Replays a record, yielding the service *before* each action together with the action.
+
+    The same service instance is yielded every time; it is only valid until the
+    generator is advanced.
+    """
+    service = GameService()
+    with silenced():
+        service.setup_game(record.dealer, deck=[card_from_index(i) for i in record.deck])
+    for action in record.actions:
+        yield service, action
+        with silenced():
+            if not apply_action(service, action):
+                raise ValueError(f"Recorded action {decode_action(action)} was rejected")
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from array import array
+from enum import IntEnum
+
+from briscola5.application.game_service import GameService
+from briscola5.application.record import ActionKind, apply_action
+from briscola5.domain.card import card_index
+from briscola5.domain.state import Phase
+
+PUBLIC = -1
+
+
+class EventKind(IntEnum):
+    DEAL = 0  # seat: dealer
+    HAND = 1  # seat: owner, value: card index (only sent to that seat)
+    BID = 2  # value: bid
+    PASS = 3
+    PLAY = 4  # value: card index
+    CALL = 5  # seat: caller, value: called card index (its suit is trump)
+    TRICK = 6  # seat: winner, value: points
+    PARTNER = 7  # seat: revealed partner
+    OVER = 8  # seat: caller, value: caller team points
+
+
+def encode_event(kind: EventKind, seat: int, value: int = 0) -> int:
+    """Same 16-bit layout as `encode_action`, with one more bit for the kind."""
+    return kind << 11 | seat << 8 | value
+
+
+def decode_events(payload: bytes) -> list[tuple[EventKind, int, int]]:
+    events = array("H")
+    events.frombytes(payload)
+    return [(EventKind(event >> 11), event >> 8 & 0x7, event & 0xFF) for event in events]
+
+
+_HAND = EventKind.HAND << 11
+_EVENT_OF_ACTION: dict[int, int] = {
+    ActionKind.BID: EventKind.BID << 11,
+    ActionKind.PASS: EventKind.PASS << 11,
+    ActionKind.DISCARD: EventKind.PLAY << 11,
+    ActionKind.CALL: EventKind.CALL << 11,
+    ActionKind.PLAY: EventKind.PLAY << 11,
+}
+
+
+def _view_filter(events: list[int], view: int) -> bytes:
+    """The events `view` may see: HAND events are kept for their own seat only."""
+    if view == PUBLIC:
+        return array("H", [e for e in events if e & 0xF800 != _HAND]).tobytes()
+    own = _HAND | view << 8
+    return array("H", [e for e in events if e & 0xF800 != _HAND or e & 0xFF00 == own]).tobytes()
+
+
+class Subscription:
+    """A reader's position in the message channel of its view."""
+
+    __slots__ = ("view", "_channel", "_cursor")
+
+    def __init__(self, view: int, channel: list[bytes]) -> None:
+        self.view = view
+        self._channel = channel
+        self._cursor = 0
+
+    def poll(self) -> list[bytes]:
+        """Messages published since the last poll (the whole history on the first one)."""
+        messages = self._channel[self._cursor :]
+        self._cursor = len(self._channel)
+        return messages
+
+
+class TableFeed:
+    """Streams one table's moves as small deltas to its players and spectators.
+
+    Moves go through `apply`, which emits the events the move caused. `flush`
+    coalesces everything pending into one message per view (each seat, plus PUBLIC
+    for spectators) and appends it to that view's channel, so publishing costs the
+    same for one subscriber or hundreds: subscribers of a view share the message
+    objects and read them with `Subscription.poll`. Late subscribers start from the
+    channel's history, which holds the whole game.
+    """
+
+    __slots__ = ("service", "_pending", "_history", "_channels", "_private")
+
+    def __init__(self, service: GameService) -> None:
+        self.service = service
+        self._pending: list[int] = []
+        self._history: list[int] = []
+        self._channels: dict[int, list[bytes]] = {}
+        self._private = False
+        self._deal()
+
+    def subscribe(self, seat: int | None = None) -> Subscription:
+        """A player's view of its own seat, or the spectators' PUBLIC view."""
+        view = PUBLIC if seat is None else seat
+        channel = self._channels.get(view)
+        if channel is None:
+            channel = self._channels[view] = []
+            if self._history:
+                channel.append(_view_filter(self._history, view))
+        return Subscription(view, channel)
+
+    def _emit(self, kind: EventKind, seat: int, value: int = 0) -> None:
+        self._pending.append(encode_event(kind, seat, value))
+
+    def _deal(self) -> None:
+        self._private = True
+        state = self.service.state
+        self._emit(EventKind.DEAL, state.turn.dealer_player)
+        for seat, hand in enumerate(state.hands):
+            for card in hand:
+                self._emit(EventKind.HAND, seat, card_index(card))
+
+    def apply(self, action: int) -> bool:
+        """Applies an encoded action; returns False if the service rejected it.
+
+        Like `apply_action`, this leaves the service's console output alone: hosts
+        wrap their loop in `silenced()` once.
+        """
+        state = self.service.state
+        kind = action >> 11
+        trick_index, revealed = state.trick.index, state.call.partner_revealed
+        collected = sum(state.score.player_points)
+        auction = state.auction
+        if not apply_action(self.service, action):
+            return False
+
+        # Action and event kinds differ, the seat and value bits are shared.
+        pending = self._pending
+        pending.append(_EVENT_OF_ACTION[kind] | action & 0x7FF)
+        if state.auction is not auction:  # everybody passed and the engine re-dealt
+            self._deal()
+        if state.trick.index != trick_index:
+            winner = state.turn.current_player
+            points = sum(state.score.player_points) - collected
+            pending.append(encode_event(EventKind.TRICK, winner, points))
+        partner = state.call.partner_player_internal
+        if state.call.partner_revealed and not revealed and partner is not None:
+            pending.append(encode_event(EventKind.PARTNER, partner))
+        caller = state.call.caller_player
+        if state.phase is Phase.GAME_OVER and caller is not None:
+            team = state.team_points_if_known()
+            caller_points = state.score.player_points[caller] if team is None else team[0]
+            pending.append(encode_event(EventKind.OVER, caller, caller_points))
+        return True
+
+    def flush(self) -> None:
+        """Publishes the pending events, one coalesced message per subscribed view."""
+        pending = self._pending
+        if not pending:
+            return
+        if self._private:
+            for view, channel in self._channels.items():
+                channel.append(_view_filter(pending, view))
+            self._private = False
+        else:
+            # No private cards: every view gets the very same message object.
+            message = array("H", pending).tobytes()
+            for channel in self._channels.values():
+                channel.append(message)
+        self._history += pending
+        self._pending = []
+
+    @property
+    def views(self) -> tuple[int, ...]:
+        return tuple(self._channels)
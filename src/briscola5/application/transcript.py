@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, Sequence
+
+from briscola5.application.record import ActionKind, GameRecord, encode_action, write_records
+from briscola5.domain.card import DECK_SIZE, full_deck
+from briscola5.domain.rules import PLAYER_COUNT
+
+GAME_MARKER = "--- Start Game ---"
+_MARKER_BYTES = GAME_MARKER.encode()
+
+_ANSI = re.compile(r"\x1b\[[0-9;]*m")
+_DEALER = re.compile(r"Game Setup Complete\. Dealer: (\d)")
+_BID = re.compile(r"Player (\d) bids (\d+)!")
+_PASS = re.compile(r"Player (\d) PASSED\.")
+_PLAY = re.compile(r"Player (\d) plays (Card\(\w+,\w\))")
+_WINNER = re.compile(r"Winner: (\d) \| Points: (\d+)")
+_CALL = re.compile(r">>> CALL DECLARED: (Card\(\w+,\w\)) <<<")
+_CARDS = {repr(card): index for index, card in enumerate(full_deck())}
+
+
+class TranscriptParser:  # pylint: disable=too-many-instance-attributes
+    """Rebuilds GameRecords from the console output of GameService, one line at a time.
+
+    The deck is never printed, but every card is played by the seat it was dealt
+    to, so a finished game gives back each hand (in the order it was played, which
+    replays the same actions). Only the game being read is kept in memory; games
+    that stop before their last card (including deals restarted after four
+    passes) are counted in `incomplete` and dropped.
+    """
+
+    __slots__ = (
+        "games",
+        "incomplete",
+        "_open",
+        "_dealer",
+        "_caller",
+        "_actions",
+        "_hands",
+        "_called",
+        "_auction_over",
+    )
+
+    def __init__(self) -> None:
+        self.games = 0
+        self.incomplete = 0
+        self._open = False
+        self._reset()
+
+    def _reset(self) -> None:
+        self._dealer: int | None = None
+        self._caller: int | None = None
+        self._actions: list[int] = []
+        self._hands: list[list[int]] = [[] for _ in range(PLAYER_COUNT)]
+        self._called = False
+        self._auction_over = False
+
+    def _append(self, kind: ActionKind, player: int, value: int = 0) -> None:
+        self._actions.append(encode_action(kind, player, value))
+
+    def feed(self, line: str) -> GameRecord | None:
+        """Reads one line; returns the previous game when this line starts a new one."""
+        line = _ANSI.sub("", line).strip()
+        if not line:
+            return None
+        if line == GAME_MARKER:
+            finished = self.finish()
+            self._open = True
+            return finished
+        if not self._open:
+            return None
+        if line.startswith("Player "):
+            if match := _PLAY.fullmatch(line):
+                player, card = int(match[1]), _CARDS[match[2]]
+                if self._auction_over:
+                    kind = ActionKind.PLAY if self._called else ActionKind.DISCARD
+                    self._append(kind, player, card)
+                    self._hands[player].append(card)
+            elif match := _BID.fullmatch(line):
+                self._append(ActionKind.BID, int(match[1]), int(match[2]))
+            elif match := _PASS.fullmatch(line):
+                self._append(ActionKind.PASS, int(match[1]))
+        elif match := _CALL.fullmatch(line):
+            if self._caller is not None:
+                self._append(ActionKind.CALL, self._caller, _CARDS[match[1]])
+                self._called = True
+        elif match := _WINNER.fullmatch(line):
+            self._caller = int(match[1])
+            self._auction_over = True
+        elif match := _DEALER.fullmatch(line):
+            self._dealer = int(match[1])
+        return None
+
+    def finish(self) -> GameRecord | None:
+        """Closes the game being read; returns it if it was played to the end."""
+        record = None
+        if self._open:
+            deck = [card for hand in self._hands for card in hand]
+            if self._dealer is not None and self._called and len(set(deck)) == DECK_SIZE:
+                record = GameRecord(self._dealer, deck, self._actions)
+                self.games += 1
+            else:
+                self.incomplete += 1
+        self._open = False
+        self._reset()
+        return record
+
+
+def parse_transcript(
+    lines: Iterable[str], parser: TranscriptParser | None = None
+) -> Iterator[GameRecord]:
+    """Streams the finished games of a transcript; pass a `parser` to read its counters."""
+    parser = parser or TranscriptParser()
+    for line in lines:
+        record = parser.feed(line)
+        if record is not None:
+            yield record
+    record = parser.finish()
+    if record is not None:
+        yield record
+
+
+def _lines(path: str | os.PathLike, start: int, end: int) -> Iterator[str]:
+    with open(path, "rb") as file:
+        file.seek(start)
+        position = start
+        while position < end:
+            line = file.readline()
+            if not line:
+                return
+            position += len(line)
+            yield line.decode("utf-8", "replace")
+
+
+def game_boundaries(path: str | os.PathLike, parts: int) -> list[int]:
+    """Byte offsets splitting `path` into up to `parts` ranges that each start a game."""
+    size = os.path.getsize(path)
+    offsets = [0]
+    with open(path, "rb") as file:
+        for part in range(1, parts):
+            file.seek(max(size * part // parts, offsets[-1]))
+            position = file.tell()
+            if position:
+                position += len(file.readline())  # skip the partial line
+            while line := file.readline():
+                if _MARKER_BYTES in line:
+                    break
+                position += len(line)
+            else:
+                break
+            if position > offsets[-1]:
+                offsets.append(position)
+    return offsets + [size]
+
+
+def convert_range(
+    path: str | os.PathLike, start: int, end: int, output: str | os.PathLike
+) -> tuple[int, int]:
+    """Worker entry point: writes the games of one byte range; returns (games, incomplete)."""
+    parser = TranscriptParser()
+    with open(output, "wb") as file:
+        write_records(file, parse_transcript(_lines(path, start, end), parser))
+    return parser.games, parser.incomplete
+
+
+def convert(
+    path: str | os.PathLike, output: str | os.PathLike, workers: int = 1
+) -> tuple[int, int]:
+    """Converts a transcript into a `write_records` archive; returns (games, incomplete).
+
+    With several workers the file is split at game boundaries and each range is
+    parsed by its own process into a part file; the parts are then concatenated in
+    order, so the archive is the same as with one worker.
+    """
+    offsets = game_boundaries(path, max(workers, 1))
+    ranges = list(zip(offsets, offsets[1:]))
+    if len(ranges) == 1:
+        return convert_range(path, *ranges[0], output)
+    parts = [f"{os.fspath(output)}.part{i}" for i in range(len(ranges))]
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(convert_range, path, start, end, part)
+                for (start, end), part in zip(ranges, parts)
+            ]
+            counts = [future.result() for future in futures]
+        with open(output, "wb") as out:
+            for part in parts:
+                with open(part, "rb") as file:
+                    shutil.copyfileobj(file, out)
+    finally:
+        for part in parts:
+            if os.path.exists(part):
+                os.remove(part)
+    return sum(games for games, _ in counts), sum(skipped for _, skipped in counts)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Convert console transcripts to records.")
+    parser.add_argument("transcript", help="captured stdout of GameService games")
+    parser.add_argument("output", help="record archive to write")
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    games, incomplete = convert(args.transcript, args.output, args.workers)
+    print(f"{games} games written to {args.output}, {incomplete} incomplete skipped")
+
+
+if __name__ == "__main__":
+    main()
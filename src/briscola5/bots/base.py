@@ -1,30 +1,36 @@
 from abc import ABC, abstractmethod
 
 from briscola5.domain.card import Rank, Suit
-from briscola5.domain.state import GameState
+from briscola5.domain.view import Observation
 
 
 class BaseBot(ABC):
+    # Scheduling hints, read by the bot registry: rough cost of one decision relative
+    # to GreedyBot, whether the bot can decide for many tables in one call, and
+    # whether its moves depend only on the state it is shown.
+    decision_cost: float = 1.0
+    batch_capable: bool = False
+    deterministic: bool = False
 
     def __init__(self, player_id: int) -> None:
         self.player_id = player_id
 
     @abstractmethod
-    def make_bid(self, state: GameState) -> int | None:
+    def make_bid(self, state: Observation) -> int | None:
 
         pass
 
     @abstractmethod
-    def choose_discard(self, state: GameState) -> int:
+    def choose_discard(self, state: Observation) -> int:
 
         pass
 
     @abstractmethod
-    def declare_trump_and_card(self, state: GameState) -> tuple[Suit, Rank]:
+    def declare_trump_and_card(self, state: Observation) -> tuple[Suit, Rank]:
 
         pass
 
     @abstractmethod
-    def play_card(self, state: GameState) -> int:
+    def play_card(self, state: Observation) -> int:
 
         pass
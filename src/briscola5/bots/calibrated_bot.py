@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from briscola5.analysis.bid_table import MIN_BID, BidTable, hand_class
+from briscola5.bots.greedy_bot import GreedyBot
+from briscola5.domain.view import Observation
+
+
+class CalibratedBidBot(GreedyBot):
+    """GreedyBot whose bidding limit comes from a Monte Carlo calibrated BidTable.
+
+    Hand classes the table has too few samples for fall back to GreedyBot's heuristic.
+    """
+
+    def __init__(self, player_id: int, table: BidTable) -> None:
+        super().__init__(player_id)
+        self.table = table
+
+    def make_bid(self, state: Observation) -> int | None:
+        cls = hand_class(state.hands[self.player_id])
+        if not self.table.is_calibrated(cls):
+            return super().make_bid(state)
+
+        limit = self.table.max_bid(cls)
+        bid = max(state.rules.opening_bid(state.auction.last_bid), MIN_BID)
+        if limit is None or bid > min(limit, state.rules.max_bid):
+            return None
+        return bid
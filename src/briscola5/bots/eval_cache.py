@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import struct
+import sys
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from multiprocessing import shared_memory
+
+EVICTION_POLICIES = ("lru", "depth")
+MAX_DEPTH = 254
+
+_EMPTY = -1
+_HEADER = struct.Struct("<Q")
+_SLOT_BYTES = 8 + 8 + 1
+
+
+def _float_bits(value: float) -> int:
+    return int.from_bytes(struct.pack("<d", value), "little")
+
+
+class EvalCache(ABC):
+    """Bounded map from 64-bit position keys (see `domain.snapshot.state_key`) to scores.
+
+    Subclasses provide the storage; this class keeps hit/miss/eviction counters.
+    `depth` is how deep the stored score was searched: deeper results are more
+    valuable, which the depth-preferred policies use when choosing what to keep.
+    """
+
+    __slots__ = ("capacity", "hits", "misses", "evictions")
+
+    policy = ""
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("Cache capacity must be positive")
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: int, min_depth: int = 0) -> float | None:
+        """Score stored for `key` if it was searched at least `min_depth` deep."""
+        value = self._lookup(key, min_depth)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    @abstractmethod
+    def put(self, key: int, value: float, depth: int = 0) -> None:
+        pass
+
+    @abstractmethod
+    def _lookup(self, key: int, min_depth: int) -> float | None:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def memory_bytes(self) -> int:
+        pass
+
+    def clear(self) -> None:
+        self.hits = self.misses = self.evictions = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        return {
+            "policy": self.policy,
+            "capacity": self.capacity,
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+            "memory_bytes": self.memory_bytes(),
+        }
+
+
+class LruEvalCache(EvalCache):
+    """Keeps the `capacity` most recently used entries."""
+
+    __slots__ = ("_entries",)
+
+    policy = "lru"
+
+    def __init__(self, capacity: int) -> None:
+        super().__init__(capacity)
+        self._entries: OrderedDict[int, tuple[float, int]] = OrderedDict()
+
+    def _lookup(self, key: int, min_depth: int) -> float | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[1] < min_depth:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: int, value: float, depth: int = 0) -> None:
+        entries = self._entries
+        old = entries.get(key)
+        if old is not None and old[1] > depth:
+            entries.move_to_end(key)
+            return
+        entries[key] = (value, depth)
+        entries.move_to_end(key)
+        if len(entries) > self.capacity:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def memory_bytes(self) -> int:
+        """Approximate: the dict itself plus one key, tuple, float and depth per entry."""
+        per_entry = sys.getsizeof(1 << 62) + sys.getsizeof((0.0, 0)) + sys.getsizeof(0.5)
+        return sys.getsizeof(self._entries) + len(self._entries) * per_entry
+
+    def clear(self) -> None:
+        super().clear()
+        self._entries.clear()
+
+
+class DepthPreferredEvalCache(EvalCache):
+    """Direct-mapped table (slot = key % capacity) that keeps the deeper of two results.
+
+    A new entry replaces the slot when it is empty, holds the same key, or holds a
+    result searched no deeper; otherwise the new entry is dropped.
+    """
+
+    __slots__ = ("_keys", "_values", "_depths", "_size")
+
+    policy = "depth"
+
+    def __init__(self, capacity: int) -> None:
+        super().__init__(capacity)
+        self._keys = [_EMPTY] * capacity
+        self._values = [0.0] * capacity
+        self._depths = [0] * capacity
+        self._size = 0
+
+    def _lookup(self, key: int, min_depth: int) -> float | None:
+        slot = key % self.capacity
+        if self._keys[slot] != key or self._depths[slot] < min_depth:
+            return None
+        return self._values[slot]
+
+    def put(self, key: int, value: float, depth: int = 0) -> None:
+        slot = key % self.capacity
+        current = self._keys[slot]
+        if current == _EMPTY:
+            self._size += 1
+        elif current != key:
+            if self._depths[slot] > depth:
+                return
+            self.evictions += 1
+        elif self._depths[slot] > depth:
+            return
+        self._keys[slot] = key
+        self._values[slot] = value
+        self._depths[slot] = depth
+
+    def __len__(self) -> int:
+        return self._size
+
+    def memory_bytes(self) -> int:
+        """The three slot lists; slot payloads are shared small ints and floats."""
+        return sum(sys.getsizeof(column) for column in (self._keys, self._values, self._depths))
+
+    def clear(self) -> None:
+        super().clear()
+        self._keys = [_EMPTY] * self.capacity
+        self._values = [0.0] * self.capacity
+        self._depths = [0] * self.capacity
+        self._size = 0
+
+
+class SharedEvalCache(EvalCache):
+    """Depth-preferred table in `multiprocessing.shared_memory`, shared by pool workers.
+
+    Writes are lock-free: each slot stores `key ^ value bits ^ depth` instead of the
+    key, so a slot torn by two concurrent writers fails the check and reads as a miss.
+    Depths are stored plus one so that zeroed memory reads as empty. Hit/miss/eviction
+    counters are per process. The creating process should call `unlink()` when done.
+    """
+
+    __slots__ = ("shm", "_checks", "_values", "_depths", "_owner")
+
+    policy = "depth"
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool) -> None:
+        buf = shm.buf
+        if buf is None:
+            raise ValueError("Shared memory block is closed")
+        (capacity,) = _HEADER.unpack_from(buf)
+        super().__init__(capacity)
+        self.shm = shm
+        self._owner = owner
+        start = _HEADER.size
+        self._checks = buf[start : start + 8 * capacity].cast("Q")
+        start += 8 * capacity
+        self._values = buf[start : start + 8 * capacity].cast("d")
+        start += 8 * capacity
+        self._depths = buf[start : start + capacity]
+
+    @classmethod
+    def create(cls, capacity: int, name: str | None = None) -> SharedEvalCache:
+        if capacity <= 0:
+            raise ValueError("Cache capacity must be positive")
+        shm = shared_memory.SharedMemory(
+            name=name, create=True, size=_HEADER.size + capacity * _SLOT_BYTES
+        )
+        _HEADER.pack_into(shm.buf, 0, capacity)  # type: ignore[arg-type]
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> SharedEvalCache:
+        return cls(shared_memory.SharedMemory(name=name), owner=False)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def _lookup(self, key: int, min_depth: int) -> float | None:
+        slot = key % self.capacity
+        stored = self._depths[slot]
+        value = self._values[slot]
+        if not stored or self._checks[slot] != key ^ _float_bits(value) ^ stored:
+            return None
+        if stored - 1 < min_depth:
+            return None
+        return value
+
+    def put(self, key: int, value: float, depth: int = 0) -> None:
+        if not 0 <= depth <= MAX_DEPTH:
+            raise ValueError(f"Shared cache depth must be within 0..{MAX_DEPTH}")
+        slot = key % self.capacity
+        stored = self._depths[slot]
+        if stored and stored - 1 > depth:
+            return
+        if stored:
+            old_key = self._checks[slot] ^ _float_bits(self._values[slot]) ^ stored
+            self.evictions += old_key != key
+        self._depths[slot] = depth + 1
+        self._values[slot] = value
+        self._checks[slot] = key ^ _float_bits(value) ^ (depth + 1)
+
+    def __len__(self) -> int:
+        return self.capacity - self._depths.tobytes().count(0)
+
+    def memory_bytes(self) -> int:
+        return self.shm.size
+
+    def clear(self) -> None:
+        super().clear()
+        self._depths[:] = bytes(self.capacity)
+
+    def close(self) -> None:
+        for view in (self._checks, self._values, self._depths):
+            view.release()
+        self.shm.close()
+
+    def unlink(self) -> None:
+        self.close()
+        if self._owner:
+            self.shm.unlink()
+
+
+def make_eval_cache(capacity: int, policy: str = "lru") -> EvalCache:
+    if policy == "lru":
+        return LruEvalCache(capacity)
+    if policy == "depth":
+        return DepthPreferredEvalCache(capacity)
+    raise ValueError(f"Unknown eviction policy {policy!r}; expected one of {EVICTION_POLICIES}")
+
+
+_PROCESS_CACHE: EvalCache | None = None
+
+
+def process_cache() -> EvalCache:
+    """The cache shared by every bot in this process (a 65536-entry LRU unless configured)."""
+    global _PROCESS_CACHE  # pylint: disable=global-statement
+    if _PROCESS_CACHE is None:
+        _PROCESS_CACHE = LruEvalCache(1 << 16)
+    return _PROCESS_CACHE
+
+
+def configure_process_cache(
+    capacity: int = 1 << 16, policy: str = "lru", shared_name: str | None = None
+) -> EvalCache:
+    """Replaces the process cache; with `shared_name` it attaches to a SharedEvalCache.
+
+    Pool workers typically call this from their initializer with the name of a
+    cache created by the parent.
+    """
+    global _PROCESS_CACHE  # pylint: disable=global-statement
+    if shared_name is not None:
+        _PROCESS_CACHE = SharedEvalCache.attach(shared_name)
+    else:
+        _PROCESS_CACHE = make_eval_cache(capacity, policy)
+    return _PROCESS_CACHE
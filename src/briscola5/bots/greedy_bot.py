@@ -1,11 +1,17 @@
 from collections import Counter
+from typing import Sequence
 
 from briscola5.bots.base import BaseBot
 from briscola5.domain.card import Card, Rank, Suit
-from briscola5.domain.state import GameState
+from briscola5.domain.rules import MAX_TOTAL_POINTS, MIN_BID
+from briscola5.domain.view import Observation
 
+# Hand strengths mapped to the lowest and the highest bid by `max_bid`.
+STRENGTH_FLOOR = 15.0
+STRENGTH_CEILING = 80.0
 
-def evaluate_trump_suit(hand: list[Card], suit: Suit) -> float:
+
+def evaluate_trump_suit(hand: Sequence[Card], suit: Suit) -> float:
     cards = [c for c in hand if c.suit == suit]
     count = len(cards)
 
@@ -20,49 +26,53 @@ def evaluate_trump_suit(hand: list[Card], suit: Suit) -> float:
     return points + length_bonus + combo_bonus + strength_score * 0.2
 
 
-def estimate_hand_strength(hand: list[Card]) -> float:
+def estimate_hand_strength(hand: Sequence[Card]) -> float:
     base_points = sum(c.points for c in hand)
     best_trump_value = max(evaluate_trump_suit(hand, s) for s in Suit)
     return base_points + best_trump_value
 
 
-def max_bid(strength: float) -> int:
-    s_min = 15.0
-    s_max = 80.0
-    normalized = (strength - s_min) / (s_max - s_min)
+def max_bid(strength: float, lowest: int = MIN_BID, highest: int = MAX_TOTAL_POINTS) -> int:
+    normalized = (strength - STRENGTH_FLOOR) / (STRENGTH_CEILING - STRENGTH_FLOOR)
     normalized = max(0.0, min(1.0, normalized))
-    bid = 71 + normalized * (120 - 71)
+    bid = lowest + normalized * (highest - lowest)
     return int(round(bid))
 
 
-def choose_bid(hand: list[Card], current_bid: int, position_factor: float) -> int | None:
+def choose_bid(
+    hand: Sequence[Card],
+    current_bid: int,
+    position_factor: float,
+    lowest: int = MIN_BID,
+    highest: int = MAX_TOTAL_POINTS,
+) -> int | None:
     strength = estimate_hand_strength(hand)
-    bid = int(max_bid(strength) * position_factor)
+    bid = min(int(max_bid(strength, lowest, highest) * position_factor), highest)
 
     if current_bid >= bid:
         return None
-    return max(current_bid + 1, 71)
+    return max(current_bid + 1, lowest)
 
 
 class GreedyBot(BaseBot):
+    deterministic = True
 
-    def make_bid(self, state: GameState) -> int | None:
+    def make_bid(self, state: Observation) -> int | None:
         hand = state.hands[self.player_id]
-        current_bid = state.auction.last_bid if state.auction.last_bid is not None else 70
+        rules = state.rules
 
         strength = estimate_hand_strength(hand)
 
         active_players = state.auction.active_players_count()
         factor = 1.05 if active_players <= 3 else 1.0
 
-        bid = int(max_bid(strength) * factor)
-
-        if current_bid >= bid:
+        limit = int(max_bid(strength, rules.min_bid, rules.max_bid) * factor)
+        bid = rules.opening_bid(state.auction.last_bid)
+        if bid > min(limit, rules.max_bid):
             return None
+        return bid
 
-        return max(current_bid + 1, 71)
-
-    def choose_discard(self, state: GameState) -> int:
+    def choose_discard(self, state: Observation) -> int:
         hand = state.hands[self.player_id]
         suit_counts = Counter(card.suit for card in hand)
         dangerous_ranks = [Rank.ASSO, Rank.TRE, Rank.RE]
@@ -84,7 +94,7 @@ class GreedyBot(BaseBot):
 
         return min(range(len(hand)), key=lambda i: (hand[i].points, hand[i].strength))
 
-    def declare_trump_and_card(self, state: GameState) -> tuple[Suit, Rank]:
+    def declare_trump_and_card(self, state: Observation) -> tuple[Suit, Rank]:
         hand = state.hands[self.player_id]
         best_suit = max(Suit, key=lambda s: evaluate_trump_suit(hand, s))
 
@@ -99,7 +109,7 @@ class GreedyBot(BaseBot):
 
         return best_suit, target_rank
 
-    def play_card(self, state: GameState) -> int:
+    def play_card(self, state: Observation) -> int:
         hand = state.hands[self.player_id]
         played = state.trick.played
         trump_suit = state.call.trump_suit
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from os import PathLike
+
+from briscola5.bots.base import BaseBot
+from briscola5.domain.card import DECK_SIZE, Rank, Suit, card_from_index
+from briscola5.domain.view import Observation
+from briscola5.learning.features import BID_ACTIONS, CALL_ACTIONS, MIN_BID, PASS_ACTION
+from briscola5.learning.network import NO_LEGAL_ACTION, NetworkPolicy, PolicyValueNetwork
+
+
+class NetworkBot(BaseBot):
+    """Plays the masked policy of a PolicyValueNetwork.
+
+    Bots at any number of tables may share one NetworkPolicy; runners that collect
+    decisions across tables can call `policy.act_batch` directly instead.
+    """
+
+    decision_cost = 5.0
+    batch_capable = True
+
+    def __init__(self, player_id: int, policy: NetworkPolicy) -> None:
+        super().__init__(player_id)
+        self.policy = policy
+
+    @classmethod
+    def from_weights(cls, player_id: int, path: str | PathLike) -> NetworkBot:
+        return cls(player_id, NetworkPolicy(PolicyValueNetwork.load(path)))
+
+    def _act(self, state: Observation) -> int:
+        return self.policy.act(state, self.player_id)
+
+    def _hand_index(self, state: Observation, action: int) -> int:
+        if action == NO_LEGAL_ACTION:
+            return 0
+        return state.hands[self.player_id].index(card_from_index(action))
+
+    def make_bid(self, state: Observation) -> int | None:
+        action = self._act(state)
+        if action in (PASS_ACTION, NO_LEGAL_ACTION):
+            return None
+        return action - BID_ACTIONS + MIN_BID
+
+    def choose_discard(self, state: Observation) -> int:
+        return self._hand_index(state, self._act(state))
+
+    def declare_trump_and_card(self, state: Observation) -> tuple[Suit, Rank]:
+        action = self._act(state)
+        if not CALL_ACTIONS <= action < CALL_ACTIONS + DECK_SIZE:
+            raise RuntimeError(f"Player {self.player_id} has no legal card to call")
+        card = card_from_index(action - CALL_ACTIONS)
+        return card.suit, card.rank
+
+    def play_card(self, state: Observation) -> int:
+        return self._hand_index(state, self._act(state))
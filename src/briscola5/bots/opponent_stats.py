@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import os
+import struct
+from collections import OrderedDict
+from typing import Sequence
+
+import numpy as np
+
+from briscola5.application.record import ActionKind, GameRecord, decode_action, replay
+from briscola5.bots.shared_counters import bid_bucket, field_layout
+from briscola5.domain.card import Rank, card_from_index
+from briscola5.domain.rules import MIN_BID, NUM_BID_BUCKETS
+from briscola5.domain.state import GameState
+
+JUMP_LIMITS = (1, 4, 9)  # bid raises of 1, 2-4, 5-9 and 10+
+NAME_BYTES = 32
+
+_RANKS = len(Rank)
+_RANK_CODES = {rank: i for i, rank in enumerate(Rank)}
+
+
+LAYOUT = field_layout(
+    {
+        "games": 1,
+        "auction_turns": 1,
+        "passes": 1,
+        "bid_levels": NUM_BID_BUCKETS,
+        "bid_jumps": len(JUMP_LIMITS) + 1,
+        "discard_ranks": _RANKS,
+        "call_ranks": _RANKS,
+        "lead_ranks": _RANKS,
+        "trump_leads": 1,
+    }
+)
+NUM_STATS = sum(width for _, width in LAYOUT.values())
+
+_HEADER = struct.Struct("<4sHHI")
+_MAGIC = b"B5OS"
+_RECORD = np.dtype([("name", f"S{NAME_BYTES}"), ("stamp", "<u8"), ("counts", "<u4", NUM_STATS)])
+
+_GAMES = LAYOUT["games"][0]
+_TURNS = LAYOUT["auction_turns"][0]
+_PASSES = LAYOUT["passes"][0]
+_LEVELS = LAYOUT["bid_levels"][0]
+_JUMPS = LAYOUT["bid_jumps"][0]
+_DISCARDS = LAYOUT["discard_ranks"][0]
+_CALLS = LAYOUT["call_ranks"][0]
+_LEADS = LAYOUT["lead_ranks"][0]
+_TRUMP_LEADS = LAYOUT["trump_leads"][0]
+
+
+def jump_bin(raise_by: int) -> int:
+    for i, limit in enumerate(JUMP_LIMITS):
+        if raise_by <= limit:
+            return i
+    return len(JUMP_LIMITS)
+
+
+class OpponentStats:  # pylint: disable=too-many-instance-attributes
+    """Fixed-size per-opponent histograms of bidding, discard, call and lead habits.
+
+    One row of `NUM_STATS` uint32 counters per opponent name, laid out as `LAYOUT`;
+    at most `capacity` opponents are kept and the least recently updated one gives
+    up its row to a newcomer. With a `path` the rows live in a memory-mapped file,
+    so updates cost one counter increment and the statistics survive restarts;
+    `flush()` forces them to disk. Recording an action and every query are O(1).
+    """
+
+    __slots__ = (
+        "path",
+        "capacity",
+        "_file",
+        "_counts",
+        "_stamps",
+        "_names",
+        "_rows",
+        "_free",
+        "_clock",
+    )
+
+    def __init__(self, path: str | os.PathLike | None = None, capacity: int = 1024) -> None:
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        self.path = path
+        if path is None:
+            records = np.zeros(capacity, _RECORD)
+        else:
+            if not os.path.exists(path):
+                with open(path, "wb") as file:
+                    file.write(_HEADER.pack(_MAGIC, NUM_STATS, 0, capacity))
+                    file.truncate(_HEADER.size + capacity * _RECORD.itemsize)
+            with open(path, "rb") as file:
+                magic, num_stats, _, capacity = _HEADER.unpack(file.read(_HEADER.size))
+            if magic != _MAGIC or num_stats != NUM_STATS:
+                raise ValueError(f"{path} is not an opponent statistics file of this version")
+            records = np.memmap(path, _RECORD, "r+", _HEADER.size, (capacity,))
+        self.capacity = capacity
+        self._file = records
+        self._counts: np.ndarray = records["counts"]
+        self._stamps: np.ndarray = records["stamp"]
+        self._names: np.ndarray = records["name"]
+
+        # Names in least recently updated order, so eviction pops from the front.
+        used = sorted(
+            (row for row in range(capacity) if self._names[row]),
+            key=lambda row: int(self._stamps[row]),
+        )
+        self._rows: OrderedDict[str, int] = OrderedDict(
+            (self._names[row].decode(), row) for row in used
+        )
+        self._free = [row for row in reversed(range(capacity)) if not self._names[row]]
+        self._clock = int(self._stamps.max(initial=0)) + 1
+
+    def _row(self, name: str) -> int:
+        row = self._rows.get(name)
+        if row is None:
+            encoded = name.encode()
+            if not encoded or len(encoded) > NAME_BYTES or "\0" in name:
+                raise ValueError(f"Opponent names must be 1..{NAME_BYTES} bytes: {name!r}")
+            row = self._free.pop() if self._free else self._rows.popitem(last=False)[1]
+            self._counts[row] = 0
+            self._names[row] = encoded
+            self._rows[name] = row
+        else:
+            self._rows.move_to_end(name)
+        self._stamps[row] = self._clock
+        self._clock += 1
+        return row
+
+    def record_action(self, name: str, state: GameState, action: int) -> None:
+        """Counts one encoded action of `name`, given the state just before it."""
+        kind, _, value = decode_action(action)
+        counts = self._counts[self._row(name)]
+        if kind is ActionKind.BID or kind is ActionKind.PASS:
+            counts[_TURNS] += 1
+            if kind is ActionKind.PASS:
+                counts[_PASSES] += 1
+                return
+            counts[_LEVELS + bid_bucket(value)] += 1
+            previous = state.auction.last_bid
+            counts[
+                _JUMPS + jump_bin(value - (MIN_BID - 1 if previous is None else previous))
+            ] += 1
+            return
+        card = card_from_index(value)
+        if kind is ActionKind.DISCARD:
+            counts[_DISCARDS + _RANK_CODES[card.rank]] += 1
+        elif kind is ActionKind.CALL:
+            counts[_CALLS + _RANK_CODES[card.rank]] += 1
+        elif not state.trick.played:
+            counts[_LEADS + _RANK_CODES[card.rank]] += 1
+            counts[_TRUMP_LEADS] += card.suit == state.call.trump_suit
+
+    def record_game(self, record: GameRecord, names: Sequence[str]) -> None:
+        """Counts every action of a finished game; `names[seat]` is who sat there."""
+        for name in names:
+            self._counts[self._row(name), _GAMES] += 1
+        for service, action in replay(record):
+            self.record_action(names[decode_action(action)[1]], service.state, action)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def counts(self, name: str) -> np.ndarray:
+        """A read-only copy of the counters of `name` (zeros if never seen)."""
+        row = self._rows.get(name)
+        if row is None:
+            return np.zeros(NUM_STATS, np.uint32)
+        counts: np.ndarray = self._counts[row].copy()
+        return counts
+
+    def histogram(self, name: str, field: str) -> np.ndarray:
+        """The counters of one `LAYOUT` field, e.g. `histogram(name, "lead_ranks")`."""
+        start, width = LAYOUT[field]
+        return self.counts(name)[start : start + width]
+
+    def games(self, name: str) -> int:
+        return int(self.counts(name)[_GAMES])
+
+    def bid_rate(self, name: str, prior: float = 0.5, weight: float = 2.0) -> float:
+        """Share of auction turns in which `name` bid, shrunk towards `prior`."""
+        counts = self.counts(name)
+        turns = int(counts[_TURNS])
+        return (turns - int(counts[_PASSES]) + prior * weight) / (turns + weight)
+
+    def trump_lead_rate(self, name: str, prior: float = 0.25, weight: float = 2.0) -> float:
+        """Share of the tricks `name` led with a trump, shrunk towards `prior`."""
+        counts = self.counts(name)
+        leads = int(counts[_LEADS : _LEADS + _RANKS].sum())
+        return (int(counts[_TRUMP_LEADS]) + prior * weight) / (leads + weight)
+
+    def flush(self) -> None:
+        if isinstance(self._file, np.memmap):
+            self._file.flush()
+
+    def close(self) -> None:
+        self.flush()
+        del self._counts, self._stamps, self._names, self._file
+
+    def __enter__(self) -> OpponentStats:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import random
+from typing import Callable, Optional, Sequence
+
+from briscola5.application.record import ActionKind, decode_action
+from briscola5.domain.card import DECK_SIZE, Card, card_from_index, cards_to_mask, mask_to_cards
+from briscola5.domain.rules import PLAYER_COUNT
+from briscola5.domain.state import Phase
+from briscola5.domain.trick import PlayedCard, current_winner
+from briscola5.domain.view import Observation
+
+_ALL_CARDS = (1 << DECK_SIZE) - 1
+
+# Likelihood ratio P(player plays card | player is the partner) / P(... | it is not),
+# given the state just before the play and the called card.
+PartnerModel = Callable[[Observation, int, Card, Card], float]
+
+
+# pylint: disable-next=unused-argument
+def uniform_model(state: Observation, player: int, card: Card, called: Card) -> float:
+    """Plays say nothing about who the partner is."""
+    return 1.0
+
+
+class SupportModel:
+    """Partners load points onto a trick the caller is winning and do not take it over.
+
+    `load` is the likelihood ratio of dropping a card worth at least `min_points` on the
+    caller's winning card, `overtake` that of beating it.
+    """
+
+    __slots__ = ("load", "overtake", "min_points")
+
+    def __init__(self, load: float = 2.0, overtake: float = 0.5, min_points: int = 10) -> None:
+        if load <= 0 or overtake <= 0:
+            raise ValueError("Likelihood ratios must be positive")
+        self.load = load
+        self.overtake = overtake
+        self.min_points = min_points
+
+    def __call__(self, state: Observation, player: int, card: Card, called: Card) -> float:
+        played = state.trick.played
+        trump = state.call.trump_suit
+        if not played or current_winner(played, trump) != state.call.caller_player:
+            return 1.0
+        if current_winner([*played, PlayedCard(player, card)], trump) == player:
+            return self.overtake
+        return self.load if card.points >= self.min_points else 1.0
+
+
+def _certain(seat: int) -> tuple[float, ...]:
+    return tuple(1.0 if s == seat else 0.0 for s in range(PLAYER_COUNT))
+
+
+def partner_posterior(
+    state: Observation, seat: int, odds: Sequence[float] | None = None
+) -> Optional[tuple[float, ...]]:
+    """Probability of each seat being the partner, as `seat` knows the game; None before the call.
+
+    Under a uniform deal the called card, while nobody has shown it, is in one of the
+    hands `seat` cannot see other than the caller's (who may not call a card it holds),
+    with probability proportional to the current size of that hand. `odds` scales each
+    seat's share by the evidence gathered from its plays (see `PartnerTracker`).
+    """
+    call = state.call
+    called = call.called_card
+    if called is None or call.caller_player is None:
+        return None
+    if call.revealed_partner is not None:
+        return _certain(call.revealed_partner)
+    for played in state.trick.played:
+        if played.card == called:
+            return _certain(played.player_id)
+    if called in state.hands[seat]:
+        return _certain(seat)
+
+    sizes = state.hand_sizes
+    weights = [
+        0.0 if s in (seat, call.caller_player) else sizes[s] * (1.0 if odds is None else odds[s])
+        for s in range(PLAYER_COUNT)
+    ]
+    total = sum(weights)
+    if total <= 0:
+        raise ValueError("No seat can hold the called card")
+    return tuple(weight / total for weight in weights)
+
+
+class PartnerTracker:
+    """Exact posterior over the partner seat for `seat`, updated one card at a time.
+
+    Feed it every play with `observe` (or every recorded action with
+    `observe_action`), passing the state just before it. A play after the call
+    multiplies its player's odds by the `model`'s likelihood ratio; `posterior`
+    combines those odds with the hand sizes as `partner_posterior` does. Both
+    are a handful of float operations, cheap enough to run for every card.
+    """
+
+    __slots__ = ("seat", "model", "odds")
+
+    def __init__(self, seat: int, model: PartnerModel = uniform_model) -> None:
+        self.seat = seat
+        self.model = model
+        self.odds = [1.0] * PLAYER_COUNT
+
+    def reset(self) -> None:
+        """Forgets the evidence, for a new deal."""
+        self.odds = [1.0] * PLAYER_COUNT
+
+    def observe(self, state: Observation, player: int, card: Card) -> None:
+        call = state.call
+        called = call.called_card
+        if (
+            state.phase is Phase.TRICK_PLAY
+            and called is not None
+            and card != called
+            and not call.partner_revealed
+        ):
+            self.odds[player] *= self.model(state, player, card, called)
+
+    def observe_action(self, state: Observation, action: int) -> None:
+        kind, player, value = decode_action(action)
+        if kind is ActionKind.PLAY:
+            self.observe(state, player, card_from_index(value))
+
+    def posterior(self, state: Observation) -> Optional[tuple[float, ...]]:
+        return partner_posterior(state, self.seat, self.odds)
+
+
+def sample_hands(
+    state: Observation,
+    seat: int,
+    rng: random.Random,
+    posterior: Sequence[float] | None = None,
+) -> list[list[Card]]:
+    """Deals the cards `seat` cannot see to the other seats, consistently with the game.
+
+    Hand sizes are respected and, once the call is made and while the partner is
+    unknown, the called card goes to a partner drawn from `posterior` (by default
+    `partner_posterior(state, seat)`), so no sample puts it in the caller's hand.
+    """
+    hands: list[list[Card]] = [[] for _ in range(PLAYER_COUNT)]
+    hands[seat] = list(state.hands[seat])
+    unseen = mask_to_cards(_ALL_CARDS & ~(state.played_mask() | cards_to_mask(hands[seat])))
+    sizes = list(state.hand_sizes)
+    sizes[seat] = 0
+
+    called = state.call.called_card
+    if called is not None and called in unseen:
+        if posterior is None:
+            posterior = partner_posterior(state, seat)
+        if posterior is not None:
+            partner = rng.choices(range(PLAYER_COUNT), weights=posterior)[0]
+            hands[partner].append(called)
+            sizes[partner] -= 1
+            unseen.remove(called)
+
+    rng.shuffle(unseen)
+    start = 0
+    for other in range(PLAYER_COUNT):
+        hands[other].extend(unseen[start : start + sizes[other]])
+        start += sizes[other]
+    return hands
@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import struct
+import time
+from multiprocessing import shared_memory
+from multiprocessing.connection import Connection
+from typing import Sequence
+
+from briscola5.application.compact import SCALARS, pack_scalars, restore_scalars
+from briscola5.application.persistence import RULES_SIZE, pack_rules, unpack_rules
+from briscola5.bots.base import BaseBot
+from briscola5.bots.registry import BOT_REGISTRY, resolve_bot
+from briscola5.domain.card import DECK_SIZE, Card, Rank, Suit, card_from_index, card_index
+from briscola5.domain.rules import PLAYER_COUNT
+from briscola5.domain.state import GameState
+from briscola5.domain.trick import PlayedCard
+from briscola5.domain.view import Observation, PlayerView
+
+BID, DISCARD, CALL, PLAY = 0, 1, 2, 3
+OK, FAILED = 0, 1
+
+_HAND_SIZE = DECK_SIZE // PLAYER_COUNT
+_SCALARS = SCALARS + 3
+# The CompactTable scalars (with the partner as the seat knows it), the seat, the
+# lengths of the own hand and of the trick, the mask of cards no longer held, points
+# and hand sizes per seat, the own hand (in hand order) and the trick entries
+# (`player * 40 + card`, in play order), both zero-padded; the packed rules follow.
+_OBSERVATION = struct.Struct(
+    f"<{_SCALARS}bQ{PLAYER_COUNT}B{PLAYER_COUNT}B{_HAND_SIZE}B{PLAYER_COUNT}B"
+)
+_POINTS = _SCALARS + 1
+_SIZES = _POINTS + PLAYER_COUNT
+_HAND = _SIZES + PLAYER_COUNT
+_TRICK = _HAND + _HAND_SIZE
+OBSERVATION_SIZE = _OBSERVATION.size + RULES_SIZE
+
+# A ring slot holds one call: method and bot code, the observation, then the reply
+# (status, value, length of the error message) and the message itself.
+_REQUEST = struct.Struct("<BB")
+_REPLY = struct.Struct("<BhH")
+_MESSAGE_SIZE = 128
+_REPLY_AT = _REQUEST.size + OBSERVATION_SIZE
+SLOT_SIZE = _REPLY_AT + _REPLY.size + _MESSAGE_SIZE
+
+
+class BotFailure(RuntimeError):
+    """A pooled bot call failed: the bot raised, or its worker died or was restarted."""
+
+
+class BotTimeout(BotFailure):
+    """A pooled bot call missed its deadline; the worker has been restarted."""
+
+
+def pack_observation(view: PlayerView, buf: memoryview, offset: int = 0) -> None:
+    """Writes what `view.seat` knows into `buf` in the fixed OBSERVATION_SIZE layout."""
+    hand, played = view.hand, view.played
+    current, dealer, partner = view.current_player, view.dealer_player, view.call.partner_player
+    scalars = pack_scalars(view, current, dealer, partner)
+    _OBSERVATION.pack_into(
+        buf,
+        offset,
+        *scalars,
+        view.seat,
+        len(hand),
+        len(played),
+        view.played_mask(),
+        *view.score.player_points,
+        *view.hand_sizes,
+        *(card_index(card) for card in hand),
+        *bytes(_HAND_SIZE - len(hand)),
+        *(pc.player_id * DECK_SIZE + card_index(pc.card) for pc in played),
+        *bytes(PLAYER_COUNT - len(played)),
+    )
+    start = offset + _OBSERVATION.size
+    buf[start : start + RULES_SIZE] = pack_rules(view.rules)
+
+
+def unpack_observation(buf: bytes | memoryview, offset: int = 0) -> PlayerView:
+    """A PlayerView equivalent to the packed one, over a state rebuilt from the record.
+
+    The record holds no other hands, so the rebuilt state fills them with the unseen
+    cards in deck order. That only keeps the hand sizes and card masks the view derives
+    from them right; the view never exposes those hands.
+    """
+    fields = _OBSERVATION.unpack_from(buf, offset)
+    seat, hand_length, trick_length = fields[SCALARS:_SCALARS]
+    state = GameState(unpack_rules(buf, offset + _OBSERVATION.size))
+    restore_scalars(state, fields[:SCALARS])
+
+    hand = fields[_HAND : _HAND + hand_length]
+    known = fields[_SCALARS]
+    for index in hand:
+        known |= 1 << index
+    unseen = [card_from_index(i) for i in range(DECK_SIZE) if not known >> i & 1]
+    for other, size in enumerate(fields[_SIZES:_HAND]):
+        if other == seat:
+            state.hands[other] = [card_from_index(i) for i in hand]
+        else:
+            state.hands[other], unseen = unseen[:size], unseen[size:]
+    state.trick.played = [
+        PlayedCard(player_id=entry // DECK_SIZE, card=card_from_index(entry % DECK_SIZE))
+        for entry in fields[_TRICK : _TRICK + trick_length]
+    ]
+    state.score.player_points = list(fields[_POINTS:_SIZES])
+    return PlayerView(state, seat)
+
+
+def _decide(bot: BaseBot, method: int, state: Observation) -> int:
+    """Runs one bot method; bids are -1 for a pass and calls are a card index."""
+    if method == BID:
+        bid = bot.make_bid(state)
+        return -1 if bid is None else bid
+    if method == DISCARD:
+        return bot.choose_discard(state)
+    if method == CALL:
+        suit, rank = bot.declare_trump_and_card(state)
+        return card_index(Card(suit, rank))
+    return bot.play_card(state)
+
+
+# pylint: disable-next=too-many-locals
+def _serve(shm_name: str, first_slot: int, names: Sequence[str], conn: Connection) -> None:
+    """Worker loop: answers the slots whose numbers arrive on `conn` until it closes.
+
+    Slot numbers travel as raw bytes on the pipe's descriptor, without the framing of
+    `Connection.send_bytes`, which would cost more than the call itself.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    buf = shm.buf
+    assert buf is not None
+    fd = conn.fileno()
+    bots: dict[tuple[int, int], BaseBot] = {}
+    try:
+        while True:
+            ready = os.read(fd, 256)
+            if not ready:
+                return
+            for slot in ready:
+                base = (first_slot + slot) * SLOT_SIZE
+                method, code = _REQUEST.unpack_from(buf, base)
+                view = unpack_observation(buf, base + _REQUEST.size)
+                message = b""
+                try:
+                    bot = bots.get((code, view.seat))
+                    if bot is None:
+                        bot = bots[code, view.seat] = resolve_bot(names[code])(view.seat)
+                    status, value = OK, _decide(bot, method, view)
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    status, value = FAILED, 0
+                    message = repr(error).encode()[:_MESSAGE_SIZE]
+                _REPLY.pack_into(buf, base + _REPLY_AT, status, value, len(message))
+                start = base + _REPLY_AT + _REPLY.size
+                buf[start : start + len(message)] = message
+                os.write(fd, bytes([slot]))
+    finally:
+        del buf
+        shm.close()
+
+
+class BotPool:  # pylint: disable=too-many-instance-attributes
+    """Worker processes that run bot decisions away from the engine.
+
+    Each worker owns `depth` slots of one shared-memory ring. A call packs the seat's
+    observation into a free slot in the fixed `pack_observation` layout and rings the
+    worker with the slot number over a pipe; the worker answers in the same slot. No
+    state is pickled. A worker that misses a call's deadline or dies is killed and
+    restarted, and its calls in flight fail with BotFailure (BotTimeout for the late
+    one); a bot that raises only fails its own call. Restarted workers build their
+    bots afresh. Bots are looked up by registry name inside the workers.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        depth: int = 16,
+        deadline: float = 1.0,
+        names: Sequence[str] | None = None,
+    ) -> None:
+        if workers <= 0 or not 0 < depth <= 256:
+            raise ValueError("A bot pool needs workers > 0 and 0 < depth <= 256")
+        self.workers = workers
+        self.depth = depth
+        self.deadline = deadline
+        self.names = tuple(BOT_REGISTRY if names is None else names)
+        self.restarts = 0
+        self.shm = shared_memory.SharedMemory(create=True, size=workers * depth * SLOT_SIZE)
+        buf = self.shm.buf
+        assert buf is not None
+        self._buf = buf
+        self._processes: list[multiprocessing.Process] = []
+        self._conns: list[Connection] = []
+        self._free: list[list[int]] = []
+        self._done: list[set[int]] = []
+        self._deadlines: list[list[float]] = []
+        self._generations = [0] * workers
+        self._next_worker = 0
+        for worker in range(workers):
+            process, conn = self._start(worker)
+            self._processes.append(process)
+            self._conns.append(conn)
+            self._free.append(list(range(depth - 1, -1, -1)))
+            self._done.append(set())
+            self._deadlines.append([0.0] * depth)
+
+    def _start(self, worker: int) -> tuple[multiprocessing.Process, Connection]:
+        ours, theirs = multiprocessing.Pipe()
+        process = multiprocessing.Process(
+            target=_serve,
+            args=(self.shm.name, worker * self.depth, self.names, theirs),
+            daemon=True,
+        )
+        process.start()
+        theirs.close()
+        return process, ours
+
+    def _restart(self, worker: int) -> None:
+        self._processes[worker].kill()
+        self._processes[worker].join()
+        self._conns[worker].close()
+        self._processes[worker], self._conns[worker] = self._start(worker)
+        self._free[worker] = list(range(self.depth - 1, -1, -1))
+        self._done[worker].clear()
+        self._generations[worker] += 1
+        self.restarts += 1
+
+    def bot(self, name: str, seat: int, fallback: BaseBot | None = None) -> RemoteBot:
+        """A bot for `seat` that decides in a worker; workers are assigned in turn."""
+        worker, self._next_worker = self._next_worker, (self._next_worker + 1) % self.workers
+        return RemoteBot(seat, self, self.names.index(name), worker, fallback)
+
+    def submit(
+        self,
+        worker: int,
+        method: int,
+        code: int,
+        view: PlayerView,
+        deadline: float | None = None,
+    ) -> tuple[int, int, int]:
+        """Queues a call on `worker` and returns its ticket for `result`."""
+        free = self._free[worker]
+        if not free:
+            raise RuntimeError(f"Bot worker {worker} already has {self.depth} calls in flight")
+        slot = free.pop()
+        base = (worker * self.depth + slot) * SLOT_SIZE
+        _REQUEST.pack_into(self._buf, base, method, code)
+        pack_observation(view, self._buf, base + _REQUEST.size)
+        timeout = self.deadline if deadline is None else deadline
+        self._deadlines[worker][slot] = time.monotonic() + timeout
+        try:
+            os.write(self._conns[worker].fileno(), bytes([slot]))
+        except OSError:
+            self._restart(worker)
+            raise BotFailure(f"Bot worker {worker} died") from None
+        return worker, slot, self._generations[worker]
+
+    def result(self, ticket: tuple[int, int, int]) -> int:
+        """Waits for a submitted call until its deadline and returns the decision."""
+        worker, slot, generation = ticket
+        if generation != self._generations[worker]:
+            raise BotFailure(f"Bot worker {worker} was restarted during the call")
+        done, conn = self._done[worker], self._conns[worker]
+        while slot not in done:
+            remaining = self._deadlines[worker][slot] - time.monotonic()
+            try:
+                if remaining <= 0 or not conn.poll(remaining):
+                    self._restart(worker)
+                    raise BotTimeout(f"Bot worker {worker} missed the deadline")
+                ready = os.read(conn.fileno(), self.depth)
+                if not ready:
+                    raise EOFError
+                done.update(ready)
+            except (EOFError, OSError):
+                self._restart(worker)
+                raise BotFailure(f"Bot worker {worker} died") from None
+        done.discard(slot)
+        self._free[worker].append(slot)
+
+        base = (worker * self.depth + slot) * SLOT_SIZE + _REPLY_AT
+        status, value, length = _REPLY.unpack_from(self._buf, base)
+        if status != OK:
+            start = base + _REPLY.size
+            raise BotFailure(bytes(self._buf[start : start + length]).decode(errors="replace"))
+        return int(value)
+
+    def call(self, worker: int, method: int, code: int, view: PlayerView) -> int:
+        return self.result(self.submit(worker, method, code, view))
+
+    def close(self) -> None:
+        for conn in self._conns:
+            conn.close()
+        for process in self._processes:
+            process.join(timeout=1.0)
+            if process.is_alive():
+                process.kill()
+                process.join()
+        del self._buf
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self) -> BotPool:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class RemoteBot(BaseBot):
+    """Stands in for a pooled bot at the table; the engine sees an ordinary bot.
+
+    When a call fails and a `fallback` bot is given, the fallback decides instead.
+    """
+
+    def __init__(
+        self,
+        player_id: int,
+        pool: BotPool,
+        code: int,
+        worker: int,
+        fallback: BaseBot | None = None,
+    ) -> None:
+        super().__init__(player_id)
+        self.pool = pool
+        self.code = code
+        self.worker = worker
+        self.fallback = fallback
+
+    def _ask(self, method: int, state: Observation) -> int:
+        view = state if isinstance(state, PlayerView) else PlayerView(state, self.player_id)
+        try:
+            return self.pool.call(self.worker, method, self.code, view)
+        except BotFailure:
+            if self.fallback is None:
+                raise
+            return _decide(self.fallback, method, view)
+
+    def make_bid(self, state: Observation) -> int | None:
+        bid = self._ask(BID, state)
+        return None if bid < 0 else bid
+
+    def choose_discard(self, state: Observation) -> int:
+        return self._ask(DISCARD, state)
+
+    def declare_trump_and_card(self, state: Observation) -> tuple[Suit, Rank]:
+        card = card_from_index(self._ask(CALL, state))
+        return card.suit, card.rank
+
+    def play_card(self, state: Observation) -> int:
+        return self._ask(PLAY, state)
@@ -2,32 +2,33 @@ import random
 
 from briscola5.bots.base import BaseBot
 from briscola5.domain.card import Rank, Suit, full_deck
-from briscola5.domain.state import GameState
+from briscola5.domain.view import Observation
 
 
 class RandomBot(BaseBot):
+    decision_cost = 0.3
 
-    def make_bid(self, state: GameState) -> int | None:
+    def make_bid(self, state: Observation) -> int | None:
 
-        current_bid = state.auction.last_bid
-        min_bid = (current_bid + 1) if current_bid is not None else 71
+        rules = state.rules
+        min_bid = rules.opening_bid(state.auction.last_bid)
 
-        if min_bid > 120:
+        if min_bid > rules.max_bid:
             return None
 
         if random.choice([True, False]):
             return None
 
-        max_possible_bid = min(min_bid + random.randint(0, 10), 120)
+        max_possible_bid = min(min_bid + random.randint(0, 10), rules.max_bid)
 
         return random.randint(min_bid, max_possible_bid)
 
-    def choose_discard(self, state: GameState) -> int:
+    def choose_discard(self, state: Observation) -> int:
 
         hand = state.hands[self.player_id]
         return random.choice(range(len(hand)))
 
-    def declare_trump_and_card(self, state: GameState) -> tuple[Suit, Rank]:
+    def declare_trump_and_card(self, state: Observation) -> tuple[Suit, Rank]:
         trump_suit = random.choice(list(Suit))
         hand = state.hands[self.player_id]
 
@@ -38,6 +39,6 @@ class RandomBot(BaseBot):
         called_card = random.choice(valid_card)
         return trump_suit, called_card.rank
 
-    def play_card(self, state: GameState) -> int:
+    def play_card(self, state: Observation) -> int:
         hand = state.hands[self.player_id]
         return random.choice(range(len(hand)))
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Iterable, Iterator, Mapping, Sequence
+
+if TYPE_CHECKING:
+    from importlib.metadata import EntryPoint
+
+    from briscola5.bots.base import BaseBot
+
+ENTRY_POINT_GROUP = "briscola5.bots"
+
+
+class BotInfo:
+    """What schedulers need to know about a registered bot, read from its class."""
+
+    __slots__ = ("name", "spec", "decision_cost", "batch_capable", "deterministic")
+
+    def __init__(self, name: str, spec: str, bot: type[BaseBot]) -> None:
+        self.name = name
+        self.spec = spec
+        self.decision_cost = bot.decision_cost
+        self.batch_capable = bot.batch_capable
+        self.deterministic = bot.deterministic
+
+    def __repr__(self) -> str:
+        return (
+            f"BotInfo({self.name!r}, cost={self.decision_cost}, "
+            f"batch_capable={self.batch_capable}, deterministic={self.deterministic})"
+        )
+
+
+class BotRegistry(Mapping[str, "type[BaseBot]"]):
+    """Bot classes by name, given as "module:Class" and imported on first lookup.
+
+    Listing or validating names never imports a bot module, so entry points only pay
+    for the bots they actually seat. With a `group`, packages can add bots through
+    entry points of that group (`name = "module:Class"`); they are discovered on first
+    use and never shadow a bot registered here. Every registered bot must be
+    constructible as `cls(player_id=...)`.
+    """
+
+    def __init__(self, specs: Mapping[str, str], group: str | None = None) -> None:
+        self._specs = dict(specs)
+        self._loaded: dict[str, type[BaseBot]] = {}
+        self._group = group
+
+    def register(self, name: str, spec: str) -> None:
+        self._discover()
+        self._specs[name] = spec
+        self._loaded.pop(name, None)
+
+    def load_entry_points(self, entry_points: Iterable[EntryPoint]) -> None:
+        for entry_point in entry_points:
+            self._specs.setdefault(entry_point.name, entry_point.value)
+
+    def _discover(self) -> None:
+        if self._group is None:
+            return
+        group, self._group = self._group, None
+        from importlib.metadata import entry_points  # pylint: disable=import-outside-toplevel
+
+        self.load_entry_points(entry_points(group=group))
+
+    def __getitem__(self, name: str) -> type[BaseBot]:
+        cls = self._loaded.get(name)
+        if cls is None:
+            self._discover()
+            module, _, attribute = self._specs[name].partition(":")
+            cls = getattr(import_module(module), attribute)
+            self._loaded[name] = cls
+        return cls
+
+    def __iter__(self) -> Iterator[str]:
+        self._discover()
+        return iter(self._specs)
+
+    def __len__(self) -> int:
+        self._discover()
+        return len(self._specs)
+
+    def __contains__(self, name: object) -> bool:
+        self._discover()
+        return name in self._specs
+
+    def info(self, name: str) -> BotInfo:
+        return BotInfo(name, self._specs[name], self[name])
+
+    def by_cost(self) -> list[BotInfo]:
+        """All bots, cheapest decision first (ties by name)."""
+        return sorted(
+            (self.info(name) for name in self), key=lambda info: (info.decision_cost, info.name)
+        )
+
+    def lineup_cost(self, lineup: Sequence[str]) -> float:
+        """Relative cost of one game with `lineup`, for sizing batches and worker pools."""
+        return sum(self[name].decision_cost for name in lineup)
+
+
+BOT_REGISTRY = BotRegistry(
+    {
+        "Greedy": "briscola5.bots.greedy_bot:GreedyBot",
+        "Random": "briscola5.bots.random_bot:RandomBot",
+    },
+    group=ENTRY_POINT_GROUP,
+)
+
+
+def resolve_bot(name: str) -> type[BaseBot]:
+    """The bot class registered as `name`, e.g. `resolve_bot("Greedy")(player_id=0)`."""
+    try:
+        return BOT_REGISTRY[name]
+    except KeyError:
+        raise ValueError(f"Unknown bot {name!r}; known: {', '.join(BOT_REGISTRY)}") from None
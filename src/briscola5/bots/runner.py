@@ -0,0 +1,532 @@
+from __future__ import annotations
+
+import argparse
+import contextlib
+import csv
+import itertools
+import json
+import os
+import random
+import struct
+import sys
+import time
+from collections import deque
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    BinaryIO,
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+    TextIO,
+    TypeVar,
+)
+
+from briscola5.bots.registry import BOT_REGISTRY as BOT_TYPES
+from briscola5.domain.rules import PLAYER_COUNT
+
+if TYPE_CHECKING:
+    from briscola5.bots.telemetry import Telemetry
+
+_T = TypeVar("_T")
+
+
+def bot_names() -> tuple[str, ...]:
+    """Registered bot names, sorted; this is the order of the binary format's bot codes."""
+    return tuple(sorted(BOT_TYPES))
+
+
+DEFAULT_BATCH_SIZE = 256
+BINARY_MAGIC = b"B5SR"
+BINARY_VERSION = 1
+_BINARY_RECORD = struct.Struct(f"<IB{PLAYER_COUNT}BbbhhbBB")
+
+
+class GameResult:  # pylint: disable=too-many-instance-attributes
+    """Outcome of one simulated game; `error` is set when the game could not finish."""
+
+    __slots__ = (
+        "game",
+        "dealer",
+        "lineup",
+        "caller",
+        "partner",
+        "target",
+        "team_points",
+        "caller_team_won",
+        "winners",
+        "error",
+    )
+
+    def __init__(self, game: int, dealer: int, lineup: tuple[str, ...]) -> None:
+        self.game = game
+        self.dealer = dealer
+        self.lineup = lineup
+        self.caller: int | None = None
+        self.partner: int | None = None
+        self.target: int | None = None
+        self.team_points: int | None = None
+        self.caller_team_won: bool | None = None
+        self.winners: tuple[int, ...] = ()
+        self.error: str | None = None
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, GameResult):
+            return False
+        return self.as_dict() == other.as_dict()
+
+    def __repr__(self) -> str:
+        return f"GameResult(game={self.game}, winners={self.winners}, error={self.error})"
+
+
+# pylint: disable-next=too-many-locals
+def play_seeded_game(game_idx: int, seed: int, lineup: Sequence[str] | None) -> GameResult:
+    """Plays game `game_idx` of run `seed`; the result depends only on those and the lineup.
+
+    Bots draw from the global `random` module, which is reseeded for every game.
+    """
+    # The engine is imported on the first game rather than at startup, which keeps
+    # `--help` and argument errors fast.
+    # pylint: disable=import-outside-toplevel
+    from briscola5.application.record import silenced
+    from briscola5.bots.simulator import deal_seeded, generate_random_configuration, play_game
+    from briscola5.domain.state import Phase
+
+    # pylint: enable=import-outside-toplevel
+
+    game_seed = seed * 1_000_003 + game_idx
+    random.seed(game_seed)
+    if lineup is None:
+        bots, bot_types, _ = generate_random_configuration()
+        names = tuple(bot_types[i] for i in range(PLAYER_COUNT))
+    else:
+        names = tuple(lineup)
+        bots = {i: BOT_TYPES[name](player_id=i) for i, name in enumerate(names)}
+
+    dealer = game_idx % PLAYER_COUNT
+    result = GameResult(game_idx, dealer, names)
+    service = deal_seeded(dealer, random.Random(game_seed))
+    try:
+        with silenced():
+            play_game(service, bots)
+            if service.state.phase == Phase.GAME_OVER:
+                service.end_game()
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        result.error = f"{type(e).__name__}: {e}"
+        return result
+
+    state = service.state
+    result.caller = state.call.caller_player
+    result.partner = state.call.partner_player_internal
+    result.target = state.call.target_points
+    points = state.team_points_if_known()
+    result.team_points = points[0] if points is not None else None
+    result.caller_team_won = state.call.caller_team_won
+    result.winners = tuple(sorted(state.winning_players() or ()))
+    if result.caller_team_won is None:
+        result.error = f"GameNotFinished: phase {state.phase.value}"
+    return result
+
+
+def play_batch(
+    start: int, count: int, seed: int, lineup: Sequence[str] | None
+) -> list[GameResult]:
+    """Worker entry point; restores the caller's global random state afterwards."""
+    saved = random.getstate()
+    try:
+        return [play_seeded_game(i, seed, lineup) for i in range(start, start + count)]
+    finally:
+        random.setstate(saved)
+
+
+def iter_results(
+    num_games: int,
+    workers: int = 1,
+    seed: int = 0,
+    lineup: Sequence[str] | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[GameResult]:
+    """Streams results in game order.
+
+    With several workers at most `2 * workers` batches are in flight, so memory stays
+    constant however many games are requested.
+    """
+    batches = (
+        (start, min(batch_size, num_games - start)) for start in range(0, num_games, batch_size)
+    )
+    jobs = ((start, count, seed, lineup) for start, count in batches)
+    yield from _stream_batches(play_batch, jobs, workers)
+
+
+def _stream_batches(
+    worker: Callable[..., list[_T]], jobs: Iterable[tuple], workers: int
+) -> Iterator[_T]:
+    """Runs `worker(*job)` for each job, in order, keeping at most `2 * workers` in flight.
+
+    The process pool is only imported when it is needed: it is the slowest part of
+    the runner's startup.
+    """
+    if workers <= 1:
+        for job in jobs:
+            yield from worker(*job)
+        return
+
+    # pylint: disable-next=import-outside-toplevel
+    from concurrent.futures import Future, ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque[Future] = deque()
+        for job in jobs:
+            pending.append(pool.submit(worker, *job))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def seat_rotations(lineup: Sequence[str]) -> list[tuple[str, ...]]:
+    return [
+        tuple(lineup[(seat - shift) % PLAYER_COUNT] for seat in range(PLAYER_COUNT))
+        for shift in range(PLAYER_COUNT)
+    ]
+
+
+def lineup_permutations(lineup: Sequence[str]) -> list[tuple[str, ...]]:
+    """Distinct seatings of the lineup (10 for two Greedy and three Random bots)."""
+    return sorted(set(itertools.permutations(lineup)))
+
+
+DUPLICATE_MODES = {"rotations": seat_rotations, "permutations": lineup_permutations}
+
+
+def play_duplicate_batch(
+    start: int, count: int, seed: int, lineup: Sequence[str], mode: str
+) -> list[list[GameResult]]:
+    """Worker entry point: every deal in the batch replayed under each seating of `mode`.
+
+    All games of a deal share the deck, the dealer and the bots' random stream, so
+    their differences come from the seating alone.
+    """
+    seatings = DUPLICATE_MODES[mode](lineup)
+    saved = random.getstate()
+    try:
+        return [
+            [play_seeded_game(deal, seed, seating) for seating in seatings]
+            for deal in range(start, start + count)
+        ]
+    finally:
+        random.setstate(saved)
+
+
+# pylint: disable=too-many-arguments, too-many-positional-arguments
+def iter_duplicate_results(
+    num_deals: int,
+    lineup: Sequence[str],
+    mode: str = "rotations",
+    workers: int = 1,
+    seed: int = 0,
+    batch_size: int = 32,
+) -> Iterator[list[GameResult]]:
+    """Streams the results of each deal, as a list with one entry per seating."""
+    batches = (
+        (start, min(batch_size, num_deals - start)) for start in range(0, num_deals, batch_size)
+    )
+    jobs = ((start, count, seed, lineup, mode) for start, count in batches)
+    yield from _stream_batches(play_duplicate_batch, jobs, workers)
+
+
+class DuplicateSummary:
+    """Per-bot win rates where each deal counts once, with the standard error over deals.
+
+    Within a deal a bot's rate is its winning seats over its scored seats across all
+    seatings, so the luck of the cards largely cancels out between bots.
+    """
+
+    def __init__(self) -> None:
+        self.deal_rates: dict[str, list[float]] = {}
+
+    def add(self, results: Sequence[GameResult]) -> None:
+        seats: dict[str, int] = {}
+        wins: dict[str, int] = {}
+        for result in results:
+            if result.error is not None:
+                continue
+            for seat, name in enumerate(result.lineup):
+                seats[name] = seats.get(name, 0) + 1
+                wins[name] = wins.get(name, 0) + (seat in result.winners)
+        for name, count in seats.items():
+            self.deal_rates.setdefault(name, []).append(wins[name] / count)
+
+    def rates(self) -> dict[str, tuple[float, float]]:
+        """Bot name -> (mean win rate, standard error)."""
+        import statistics  # pylint: disable=import-outside-toplevel
+
+        summary = {}
+        for name, rates in sorted(self.deal_rates.items()):
+            mean = statistics.fmean(rates)
+            error = statistics.stdev(rates) / len(rates) ** 0.5 if len(rates) > 1 else 0.0
+            summary[name] = (mean, error)
+        return summary
+
+
+class JsonLinesWriter:
+    def __init__(self, stream: TextIO) -> None:
+        self.stream = stream
+
+    def write(self, result: GameResult) -> None:
+        self.stream.write(json.dumps(result.as_dict()) + "\n")
+
+
+class CsvWriter:
+    def __init__(self, stream: TextIO) -> None:
+        self.writer = csv.writer(stream)
+        self.writer.writerow(GameResult.__slots__)
+
+    def write(self, result: GameResult) -> None:
+        row = result.as_dict()
+        row["lineup"] = "|".join(result.lineup)
+        row["winners"] = "|".join(map(str, result.winners))
+        self.writer.writerow(["" if value is None else value for value in row.values()])
+
+
+def _or(value: int | None, default: int = -1) -> int:
+    return default if value is None else value
+
+
+class BinaryWriter:
+    """Fixed-size little-endian records after a magic/version/bot-name header.
+
+    Error messages are reduced to a flag; use JSON output to keep them.
+    """
+
+    def __init__(self, stream: BinaryIO) -> None:
+        self.stream = stream
+        names = bot_names()
+        header = json.dumps(names).encode("utf-8")
+        stream.write(BINARY_MAGIC + struct.pack("<BH", BINARY_VERSION, len(header)) + header)
+        self._codes = {name: i for i, name in enumerate(names)}
+
+    def write(self, result: GameResult) -> None:
+        won = -1 if result.caller_team_won is None else int(result.caller_team_won)
+        self.stream.write(
+            _BINARY_RECORD.pack(
+                result.game,
+                result.dealer,
+                *(self._codes[name] for name in result.lineup),
+                _or(result.caller),
+                _or(result.partner),
+                _or(result.target),
+                _or(result.team_points),
+                won,
+                sum(1 << seat for seat in result.winners),
+                result.error is not None,
+            )
+        )
+
+
+def read_binary_results(stream: BinaryIO) -> Iterator[GameResult]:
+    """Streams GameResults back from a BinaryWriter file."""
+    header = stream.read(len(BINARY_MAGIC) + 3)
+    if header[:4] != BINARY_MAGIC:
+        raise ValueError("Not a briscola5 simulation results stream")
+    version, names_length = struct.unpack("<BH", header[4:])
+    if version != BINARY_VERSION:
+        raise ValueError(f"Unsupported results version {version}")
+    names = json.loads(stream.read(names_length))
+    while chunk := stream.read(_BINARY_RECORD.size):
+        fields = _BINARY_RECORD.unpack(chunk)
+        result = GameResult(fields[0], fields[1], tuple(names[c] for c in fields[2:7]))
+        caller, partner, target, points, won, winners, error = fields[7:]
+        result.caller = None if caller < 0 else caller
+        result.partner = None if partner < 0 else partner
+        result.target = None if target < 0 else target
+        result.team_points = None if points < 0 else points
+        result.caller_team_won = None if won < 0 else bool(won)
+        result.winners = tuple(s for s in range(PLAYER_COUNT) if winners >> s & 1)
+        result.error = "error" if error else None
+        yield result
+
+
+WRITERS = {"json": JsonLinesWriter, "csv": CsvWriter, "binary": BinaryWriter}
+
+
+class ProgressReporter:
+    """Rate-limited progress line on stderr (at most one update per `interval` seconds)."""
+
+    def __init__(self, total: int, stream: TextIO, interval: float = 1.0) -> None:
+        self.total = total
+        self.stream = stream
+        self.interval = interval
+        self.started = time.monotonic()
+        self._next = self.started + interval
+
+    def update(self, done: int, errors: int, force: bool = False) -> None:
+        now = time.monotonic()
+        if now < self._next and not force:
+            return
+        self._next = now + self.interval
+        rate = done / max(now - self.started, 1e-9)
+        self.stream.write(f"\r{done}/{self.total} games, {rate:.0f} games/s, {errors} errors")
+        if force:
+            self.stream.write("\n")
+        self.stream.flush()
+
+
+def run(
+    results: Iterable[GameResult],
+    writer,
+    progress: ProgressReporter | None = None,
+    telemetry: Telemetry | None = None,
+) -> tuple[int, int]:
+    """Writes every result as it arrives; returns (games, errors)."""
+    done = errors = 0
+    for result in results:
+        writer.write(result)
+        done += 1
+        errors += result.error is not None
+        if progress is not None:
+            progress.update(done, errors)
+        if telemetry is not None:
+            telemetry.record(result)
+            telemetry.tick()
+    if progress is not None:
+        progress.update(done, errors, force=True)
+    if telemetry is not None:
+        telemetry.tick(force=True)
+    return done, errors
+
+
+def _paired(deals: Iterable[list[GameResult]], summary: DuplicateSummary) -> Iterator[GameResult]:
+    for results in deals:
+        summary.add(results)
+        yield from results
+
+
+def _lineup(text: str) -> list[str]:
+    names = [name.strip() for name in text.split(",")]
+    if len(names) != PLAYER_COUNT or any(name not in BOT_TYPES for name in names):
+        raise argparse.ArgumentTypeError(
+            f"expected {PLAYER_COUNT} comma-separated names from {', '.join(bot_names())}"
+        )
+    return names
+
+
+def batch_size_for(lineup: Sequence[str] | None) -> int:
+    """Games per worker task: lineups costlier than five GreedyBots get smaller batches.
+
+    Batches then take roughly the same time whatever the bots, which keeps the pool
+    balanced and progress steady. Results do not depend on the batch size.
+    """
+    if lineup is None:
+        return DEFAULT_BATCH_SIZE
+    cost = BOT_TYPES.lineup_cost(lineup)
+    return max(min(int(DEFAULT_BATCH_SIZE * PLAYER_COUNT / cost), DEFAULT_BATCH_SIZE), 1)
+
+
+def _results_for(
+    args: argparse.Namespace,
+) -> tuple[Iterable[GameResult], int, DuplicateSummary | None]:
+    """The result stream for the parsed options, its length and the duplicate summary."""
+    batch_size = args.batch_size or batch_size_for(args.lineup)
+    if args.duplicate is None:
+        results = iter_results(
+            args.games, args.workers, args.seed, args.lineup, batch_size=batch_size
+        )
+        return results, args.games, None
+    duplicates = DuplicateSummary()
+    deals = iter_duplicate_results(
+        args.games,
+        args.lineup,
+        args.duplicate,
+        args.workers,
+        args.seed,
+        batch_size=max(batch_size // PLAYER_COUNT, 1),
+    )
+    total = args.games * len(DUPLICATE_MODES[args.duplicate](args.lineup))
+    return _paired(deals, duplicates), total, duplicates
+
+
+# pylint: disable-next=too-many-locals
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="briscola5-sim", description="Headless bot-vs-bot Briscola in 5 simulator."
+    )
+    parser.add_argument("-n", "--games", type=int, default=1000)
+    parser.add_argument("-w", "--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--lineup",
+        type=_lineup,
+        default=None,
+        help="bot per seat, e.g. Greedy,Random,Greedy,Random,Random (default: random per game)",
+    )
+    parser.add_argument("-f", "--format", choices=sorted(WRITERS), default="json")
+    parser.add_argument("-o", "--output", default="-", help="output file ('-' for stdout)")
+    parser.add_argument(
+        "--duplicate",
+        choices=sorted(DUPLICATE_MODES),
+        help="replay each deal under every seating of --lineup; -n counts deals",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, help="games per worker task (default: from the bots' cost)"
+    )
+    parser.add_argument("--list-bots", action="store_true", help="list registered bots and exit")
+    parser.add_argument("--no-progress", action="store_true")
+    parser.add_argument("--telemetry-file", help="JSON file rewritten with live telemetry")
+    parser.add_argument(
+        "--telemetry-port", type=int, help="serve live telemetry as JSON on localhost:PORT"
+    )
+    parser.add_argument("--telemetry-interval", type=float, default=1.0)
+    args = parser.parse_args(argv)
+    if args.list_bots:
+        for info in BOT_TYPES.by_cost():
+            print(
+                f"{info.name:<12} cost {info.decision_cost:<5g} "
+                f"batch={'yes' if info.batch_capable else 'no':<4}"
+                f"deterministic={'yes' if info.deterministic else 'no'}"
+            )
+        return
+    if args.duplicate is not None and args.lineup is None:
+        parser.error("--duplicate requires --lineup")
+
+    binary = args.format == "binary"
+    with contextlib.ExitStack() as stack:
+        stream: IO
+        if args.output == "-":
+            stream = sys.stdout.buffer if binary else sys.stdout
+        elif binary:
+            stream = stack.enter_context(open(args.output, "wb"))
+        else:
+            stream = stack.enter_context(open(args.output, "w", encoding="utf-8", newline=""))
+
+        results, total, duplicates = _results_for(args)
+        progress = None if args.no_progress else ProgressReporter(total, sys.stderr)
+        telemetry = None
+        if args.telemetry_file is not None or args.telemetry_port is not None:
+            # pylint: disable-next=import-outside-toplevel
+            from briscola5.bots.telemetry import Telemetry, TelemetryFile, TelemetryServer
+
+            telemetry = Telemetry(total, args.telemetry_interval)
+            if args.telemetry_file is not None:
+                telemetry.sinks.append(TelemetryFile(args.telemetry_file))
+            if args.telemetry_port is not None:
+                server = TelemetryServer(telemetry, port=args.telemetry_port)
+                stack.callback(server.close)
+        try:
+            run(results, WRITERS[args.format](stream), progress, telemetry)
+            stream.flush()
+            if duplicates is not None:
+                for name, (rate, error) in duplicates.rates().items():
+                    sys.stderr.write(f"{name}: duplicate win rate {rate:.4f} +/- {error:.4f}\n")
+        except BrokenPipeError:
+            # The reader (e.g. `head`) went away: stop quietly, as the Python docs advise.
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import Callable, Sequence
+
+import numpy as np
+
+from briscola5.bots.runner import GameResult, bot_names, play_batch
+from briscola5.domain.rules import BID_BUCKET_WIDTH, MIN_BID, NUM_BID_BUCKETS, PLAYER_COUNT
+
+BOT_NAMES = bot_names()
+DEFAULT_TRACKED_BOT = "Greedy"
+
+
+def field_layout(widths: dict[str, int]) -> dict[str, tuple[int, int]]:
+    """(offset, width) of each named field, packed one after another in order."""
+    layout, offset = {}, 0
+    for name, width in widths.items():
+        layout[name] = (offset, width)
+        offset += width
+    return layout
+
+
+LAYOUT = field_layout(
+    {
+        "games": 1,
+        "errors": 1,
+        "seat_wins": PLAYER_COUNT,
+        "bot_player_wins": len(BOT_NAMES),
+        "bot_game_wins": len(BOT_NAMES) + 1,  # last column: tie
+        "lineup_games": PLAYER_COUNT + 1,  # by number of seats running the tracked bot
+        "bid_games": NUM_BID_BUCKETS,
+        "bid_wins": NUM_BID_BUCKETS,
+    }
+)
+NUM_COUNTERS = sum(width for _, width in LAYOUT.values())
+_BOT_CODES = {name: i for i, name in enumerate(BOT_NAMES)}
+
+
+def bid_bucket(target: int) -> int:
+    return min(max((target - MIN_BID) // BID_BUCKET_WIDTH, 0), NUM_BID_BUCKETS - 1)
+
+
+class SharedCounters:
+    """Striped int64 counters in `multiprocessing.shared_memory`, one row per worker.
+
+    Each worker only writes its own row, so increments need no lock; readers sum the
+    rows at any time to get live totals, which are exact once the writers stop.
+    The process that created the block should call `unlink()` when done.
+    `lineup_games` counts games by how many seats ran the `tracked` bot.
+    """
+
+    __slots__ = ("shm", "counts", "tracked", "_owner")
+
+    def __init__(
+        self,
+        shm: shared_memory.SharedMemory,
+        rows: int,
+        owner: bool,
+        tracked: str = DEFAULT_TRACKED_BOT,
+    ) -> None:
+        self.shm = shm
+        self.counts: np.ndarray = np.ndarray((rows, NUM_COUNTERS), dtype=np.int64, buffer=shm.buf)
+        self.tracked = tracked
+        self._owner = owner
+
+    @classmethod
+    def create(cls, rows: int, tracked: str = DEFAULT_TRACKED_BOT) -> SharedCounters:
+        if tracked not in _BOT_CODES:
+            raise ValueError(f"Unknown bot {tracked!r}")
+        shm = shared_memory.SharedMemory(create=True, size=rows * NUM_COUNTERS * 8)
+        counters = cls(shm, rows, owner=True, tracked=tracked)
+        counters.counts[:] = 0
+        return counters
+
+    @classmethod
+    def attach(cls, name: str, rows: int, tracked: str = DEFAULT_TRACKED_BOT) -> SharedCounters:
+        return cls(shared_memory.SharedMemory(name=name), rows, owner=False, tracked=tracked)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def record(self, row: int, result: GameResult) -> None:
+        """Adds one game to `row`; errored games only count towards games/errors."""
+        counts = self.counts[row]
+        counts[LAYOUT["games"][0]] += 1
+        if result.error is not None:
+            counts[LAYOUT["errors"][0]] += 1
+            return
+
+        codes = [_BOT_CODES[name] for name in result.lineup]
+        counts[LAYOUT["lineup_games"][0] + result.lineup.count(self.tracked)] += 1
+        winner_codes = [codes[seat] for seat in result.winners]
+        for seat, code in zip(result.winners, winner_codes):
+            counts[LAYOUT["seat_wins"][0] + seat] += 1
+            counts[LAYOUT["bot_player_wins"][0] + code] += 1
+
+        per_bot = [winner_codes.count(code) for code in range(len(BOT_NAMES))]
+        best = max(per_bot)
+        column = per_bot.index(best) if per_bot.count(best) == 1 else len(BOT_NAMES)
+        counts[LAYOUT["bot_game_wins"][0] + column] += 1
+
+        if result.target is not None:
+            bucket = bid_bucket(result.target)
+            counts[LAYOUT["bid_games"][0] + bucket] += 1
+            counts[LAYOUT["bid_wins"][0] + bucket] += bool(result.caller_team_won)
+
+    def totals(self) -> np.ndarray:
+        totals: np.ndarray = self.counts.sum(axis=0)
+        return totals
+
+    def summary(self) -> dict:
+        """Totals split into named lists, e.g. `summary()["seat_wins"][2]`."""
+        totals = self.totals().tolist()
+        return {name: totals[start : start + width] for name, (start, width) in LAYOUT.items()}
+
+    def close(self) -> None:
+        del self.counts
+        self.shm.close()
+
+    def unlink(self) -> None:
+        self.close()
+        if self._owner:
+            self.shm.unlink()
+
+
+_WORKER: tuple[SharedCounters, int] | None = None
+
+
+def _init_worker(name: str, rows: int, tracked: str, slots: multiprocessing.Queue) -> None:
+    global _WORKER  # pylint: disable=global-statement
+    _WORKER = (SharedCounters.attach(name, rows, tracked), slots.get())
+
+
+def count_batch(start: int, count: int, seed: int, lineup: Sequence[str] | None) -> int:
+    """Worker entry point: plays a runner batch and records it into this worker's row."""
+    if _WORKER is None:
+        raise RuntimeError("count_batch only runs in the worker processes of simulate_counts")
+    counters, row = _WORKER
+    for result in play_batch(start, count, seed, lineup):
+        counters.record(row, result)
+    return count
+
+
+# pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
+def simulate_counts(
+    num_games: int,
+    workers: int = 1,
+    seed: int = 0,
+    lineup: Sequence[str] | None = None,
+    batch_size: int = 256,
+    on_progress: Callable[[np.ndarray], None] | None = None,
+    poll_interval: float = 0.5,
+    tracked: str = DEFAULT_TRACKED_BOT,
+) -> dict:
+    """Plays the same games as `runner.iter_results` but only aggregates counters.
+
+    Workers send back nothing but a batch size; `on_progress` receives the live totals
+    about every `poll_interval` seconds; `lineup_games` counts the seats of `tracked`.
+    Returns `SharedCounters.summary()`.
+    """
+    counters = SharedCounters.create(max(workers, 1), tracked)
+    try:
+        batches = [
+            (start, min(batch_size, num_games - start))
+            for start in range(0, num_games, batch_size)
+        ]
+        if workers <= 1:
+            last = time.monotonic()
+            for start, count in batches:
+                for result in play_batch(start, count, seed, lineup):
+                    counters.record(0, result)
+                if on_progress is not None and time.monotonic() - last >= poll_interval:
+                    last = time.monotonic()
+                    on_progress(counters.totals())
+        else:
+            slots: multiprocessing.Queue = multiprocessing.Queue()
+            for row in range(workers):
+                slots.put(row)
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(counters.name, workers, tracked, slots),
+            ) as pool:
+                pending = {pool.submit(count_batch, *batch, seed, lineup) for batch in batches}
+                while pending:
+                    done, pending = wait(pending, poll_interval, FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                    if on_progress is not None:
+                        on_progress(counters.totals())
+        if on_progress is not None:
+            on_progress(counters.totals())
+        return counters.summary()
+    finally:
+        counters.unlink()
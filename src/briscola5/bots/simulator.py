@@ -1,14 +1,23 @@
+from __future__ import annotations
+
 import os
 import random
 import sys
 from collections import defaultdict
-from typing import DefaultDict, Dict, List
+from typing import TYPE_CHECKING, DefaultDict, Dict, Iterator
 
 from briscola5.application.game_service import GameService
+from briscola5.application.record import ActionKind, GameRecord, silenced
 from briscola5.bots.base import BaseBot
-from briscola5.bots.greedy_bot import GreedyBot
-from briscola5.bots.random_bot import RandomBot
+from briscola5.bots.registry import BOT_REGISTRY
+from briscola5.domain.card import Card, card_index, full_deck
 from briscola5.domain.state import Phase
+from briscola5.domain.view import Observation, PlayerView
+
+if TYPE_CHECKING:
+    from briscola5.bots.telemetry import Telemetry
+
+BOT_TYPES = BOT_REGISTRY
 
 
 def generate_random_configuration() -> tuple[Dict[int, BaseBot], Dict[int, str], int]:
@@ -22,17 +31,150 @@ def generate_random_configuration() -> tuple[Dict[int, BaseBot], Dict[int, str],
     bot_types: Dict[int, str] = {}
 
     for player_id, bot_type in enumerate(bot_list):
-        if bot_type == "Random":
-            bots[player_id] = RandomBot(player_id=player_id)
-        else:
-            bots[player_id] = GreedyBot(player_id=player_id)
+        bots[player_id] = BOT_TYPES[bot_type](player_id=player_id)
         bot_types[player_id] = bot_type
 
     return bots, bot_types, num_greedy
 
 
-# pylint: disable=too-many-locals, too-many-nested-blocks, too-many-branches, too-many-statements
-def game(num_games: int = 1000, show_prints: bool = True) -> None:
+def _play_auction(
+    service: GameService,
+    bots: Dict[int, BaseBot],
+    seen: Dict[int, Observation],
+    record: GameRecord | None,
+):
+    while service.state.phase == Phase.AUCTION:
+        curr_player = service.state.turn.current_player
+        bid = bots[curr_player].make_bid(seen[curr_player])
+        accepted = service.auction_phase(curr_player, bid)
+        if record is None:
+            continue
+        if bid is None:
+            if service.state.auction.active_players_count() == len(bots):
+                # Everybody passed and the service dealt again: restart the record.
+                record.deck = GameRecord.from_service(service).deck
+                record.actions.clear()
+            else:
+                record.append(ActionKind.PASS, curr_player)
+        elif accepted:
+            record.append(ActionKind.BID, curr_player, bid)
+
+
+def _play_dead_trick(
+    service: GameService,
+    bots: Dict[int, BaseBot],
+    seen: Dict[int, Observation],
+    record: GameRecord | None,
+) -> None:
+    while service.state.phase == Phase.DEAD_TRICK_PLAY:
+        curr_player = service.state.turn.current_player
+        bot = bots[curr_player]
+        hand = service.state.hands[curr_player]
+
+        card_index_in_hand = bot.choose_discard(seen[curr_player])
+        card = hand[card_index_in_hand]
+        success = service.play_card(curr_player, card_index_in_hand)
+
+        if not success:
+            fallback_indices = sorted(
+                [i for i in range(len(hand)) if i != card_index_in_hand],
+                key=lambda idx, h=hand: h[idx].points,  # type: ignore[misc]
+            )
+            for fallback_idx in fallback_indices:
+                card = hand[fallback_idx]
+                if service.play_card(curr_player, fallback_idx):
+                    success = True
+                    break
+
+            if not success:
+                raise RuntimeError(f"P{curr_player} non ha carte valide per lo scarto.")
+
+        if record is not None:
+            record.append(ActionKind.DISCARD, curr_player, card_index(card))
+
+
+def play_game(
+    service: GameService,
+    bots: Dict[int, BaseBot],
+    record: GameRecord | None = None,
+    sandboxed: bool = False,
+) -> None:
+    """Drives an already dealt game until GAME_OVER, optionally logging actions to `record`.
+
+    With `sandboxed`, each bot is shown a PlayerView of its seat instead of the state.
+    """
+    seen: Dict[int, Observation] = {
+        seat: PlayerView(service.state, seat) if sandboxed else service.state for seat in bots
+    }
+    _play_auction(service, bots, seen, record)
+    _play_dead_trick(service, bots, seen, record)
+
+    if service.state.phase == Phase.DEAD_TRICK_CALL:
+        caller_id = service.state.call.caller_player
+        if caller_id is None:
+            return
+        suit, rank = bots[caller_id].declare_trump_and_card(seen[caller_id])
+        if service.make_call(suit, rank) and record is not None:
+            record.append(ActionKind.CALL, caller_id, card_index(Card(suit, rank)))
+
+    max_turns = 100
+    turns_played = 0
+    while service.state.phase == Phase.TRICK_PLAY and turns_played < max_turns:
+        curr_player = service.state.turn.current_player
+        card_index_in_hand = bots[curr_player].play_card(seen[curr_player])
+        if record is not None:
+            card = service.state.hands[curr_player][card_index_in_hand]
+            record.append(ActionKind.PLAY, curr_player, card_index(card))
+        service.normal_trick_rounds(card_index_in_hand, curr_player)
+        turns_played += 1
+
+
+def deal_seeded(dealer_id: int, rng: random.Random) -> GameService:
+    """Returns a silently set-up service dealt from a deck shuffled with `rng`."""
+    deck = full_deck()
+    rng.shuffle(deck)
+    service = GameService()
+    with silenced():
+        service.setup_game(dealer_id, deck=deck)
+    return service
+
+
+def play_recorded(service: GameService, bots: Dict[int, BaseBot]) -> GameRecord | None:
+    """Plays `service` out silently and returns its record; None if the engine gets stuck."""
+    record = GameRecord.from_service(service)
+    with silenced():
+        try:
+            play_game(service, bots, record)
+        except RuntimeError:
+            return None
+    return record
+
+
+def split_evenly(total: int, parts: int) -> list[int]:
+    """Splits `total` games into `parts` worker shares differing by at most one."""
+    return [total // parts + (1 if i < total % parts else 0) for i in range(parts)]
+
+
+def simulate_records(num_games: int) -> Iterator[GameRecord]:
+    """Plays random bot lineups silently and yields one GameRecord per finished game."""
+    for game_idx in range(num_games):
+        service = GameService()
+        bots, _, _ = generate_random_configuration()
+        with silenced():
+            service.setup_game(dealer_id=game_idx % 5)
+            record = GameRecord.from_service(service)
+            try:
+                play_game(service, bots, record)
+            except RuntimeError:
+                continue
+        if service.state.phase == Phase.GAME_OVER:
+            yield record
+
+
+# pylint: disable=too-many-locals, too-many-branches, too-many-statements
+def game(
+    num_games: int = 1000, show_prints: bool = True, telemetry: Telemetry | None = None
+) -> None:
     print("=" * 40)
     print(f"Bot VS Bot ({num_games} partite)")
     print("=" * 40)
@@ -46,6 +188,7 @@ def game(num_games: int = 1000, show_prints: bool = True) -> None:
 
     for game_idx in range(num_games):
         service = GameService()
+        lineup: list[str] = []
 
         if not show_prints:
             # pylint: disable=consider-using-with
@@ -56,67 +199,19 @@ def game(num_games: int = 1000, show_prints: bool = True) -> None:
         try:
             service.setup_game(dealer_id=game_idx % 5)
             bots, bot_types, num_greedy = generate_random_configuration()
+            lineup = [bot_types[i] for i in range(len(bot_types))]
             config_stats[num_greedy] += 1
 
-            while service.state.phase == Phase.AUCTION:
-                curr_player = service.state.turn.current_player
-                bid = bots[curr_player].make_bid(service.state)
-                service.auction_phase(curr_player, bid)
-
-            while service.state.phase == Phase.DEAD_TRICK_PLAY:
-                curr_player = service.state.turn.current_player
-                bot = bots[curr_player]
-
-                card_index = bot.choose_discard(service.state)
-                success = service.play_card(curr_player, card_index)
-
-                if not success:
-                    hand = service.state.hands[curr_player]
-                    fallback_indices = sorted(
-                        [i for i in range(len(hand)) if i != card_index],
-                        key=lambda idx, h=hand: h[idx].points,  # type: ignore[misc]
-                    )
-                    for fallback_idx in fallback_indices:
-                        if service.play_card(curr_player, fallback_idx):
-                            success = True
-                            break
-
-                    if not success:
-                        raise RuntimeError(f"P{curr_player} non ha carte valide per lo scarto.")
-
-            if service.state.phase == Phase.DEAD_TRICK_CALL:
-                caller_id = service.state.call.caller_player
-                if caller_id is None:
-                    continue
-                suit, rank = bots[caller_id].declare_trump_and_card(service.state)
-                service.make_call(suit, rank)
-
-            max_turns = 100
-            turns_played = 0
-            while service.state.phase == Phase.TRICK_PLAY and turns_played < max_turns:
-                curr_player = service.state.turn.current_player
-                card_index = bots[curr_player].play_card(service.state)
-                service.normal_trick_rounds(card_index, curr_player)
-                turns_played += 1
+            play_game(service, bots)
 
             service.end_game()
 
-            caller = service.state.call.caller_player
-            partner = service.state.call.partner_player_internal
-
-            if caller is None:
+            winners = service.state.winning_players()
+            if telemetry is not None:
+                telemetry.observe(lineup, winners, None, service.state.call.caller_team_won)
+            if winners is None:
                 continue
 
-            team_a: List[int] = [caller]
-            if partner is not None:
-                team_a.append(partner)
-
-            winners: List[int] = (
-                team_a
-                if service.state.call.caller_team_won
-                else [p for p in range(5) if p not in team_a]
-            )
-
             for w in winners:
                 win_counts[w] += 1
                 bot_type_player_wins[bot_types[w]] += 1
@@ -134,10 +229,17 @@ def game(num_games: int = 1000, show_prints: bool = True) -> None:
         except Exception as e:  # pylint: disable=broad-exception-caught
             sys.stdout = original_stdout
             print(f"Errore alla partita {game_idx}: {e}")
+            if telemetry is not None:
+                telemetry.observe(lineup, None, type(e).__name__)
             continue
         finally:
             if not show_prints:
                 sys.stdout = original_stdout
+            if telemetry is not None:
+                telemetry.tick()
+
+    if telemetry is not None:
+        telemetry.tick(force=True)
 
     print("\nStatistiche configurazioni: ")
     for g in sorted(config_stats.keys()):
@@ -160,4 +262,6 @@ def game(num_games: int = 1000, show_prints: bool = True) -> None:
 
 
 if __name__ == "__main__":
-    game(num_games=1000, show_prints=True)
+    from briscola5.bots.runner import main  # pylint: disable=cyclic-import
+
+    main()
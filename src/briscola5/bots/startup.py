@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Modules an entry point should only import once the run actually needs them.
+DEFERRED_MODULES = (
+    "concurrent.futures.process",
+    "multiprocessing",
+    "http.server",
+    "importlib.metadata",
+    "statistics",
+    "briscola5.bots.simulator",
+    "briscola5.bots.telemetry",
+    "briscola5.bots.greedy_bot",
+    "briscola5.bots.random_bot",
+)
+
+COMMANDS = {
+    "runner-import": ["-c", "import briscola5.bots.runner"],
+    "runner-help": ["-m", "briscola5.bots.runner", "--help"],
+    "cli-import": ["-c", "import briscola5.cli.base_cli"],
+}
+
+
+def _environment() -> dict[str, str]:
+    env = dict(os.environ)
+    src = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+    return env
+
+
+def measure_startup(args: list[str], repeats: int = 10) -> float:
+    """Median wall time in milliseconds of `python <args>` in a fresh interpreter."""
+    env = _environment()
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], env=env, check=True, stdout=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def loaded_modules(module: str) -> list[str]:
+    """Which `DEFERRED_MODULES` importing `module` pulls in (empty when lazy)."""
+    code = (
+        f"import sys, {module}\n"
+        f"print('\\n'.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], env=_environment(), check=True, capture_output=True
+    ).stdout
+    return output.decode().split()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Time the startup of the entry points.")
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument(
+        "--budget", type=float, default=50.0, help="milliseconds on top of the bare interpreter"
+    )
+    args = parser.parse_args(argv)
+
+    baseline = measure_startup(["-c", "pass"], args.repeats)
+    print(f"{'interpreter':<14} {baseline:7.1f} ms")
+    over_budget = False
+    for name, command in COMMANDS.items():
+        elapsed = measure_startup(command, args.repeats)
+        over_budget |= elapsed - baseline > args.budget
+        print(
+            f"{name:<14} {elapsed:7.1f} ms  (+{elapsed - baseline:.1f} ms over the interpreter)"
+        )
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, DefaultDict, Sequence
+
+from briscola5.domain.state import PLAYER_COUNT
+
+if TYPE_CHECKING:
+    from briscola5.bots.runner import GameResult
+
+
+def wilson_interval(successes: int, trials: int, z: float = 1.96) -> tuple[float, float]:
+    """Wilson score interval for a binomial proportion (95% for the default z)."""
+    if trials == 0:
+        return 0.0, 1.0
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(centre - margin, 0.0), min(centre + margin, 1.0)
+
+
+def _rate(wins: int, trials: int) -> dict:
+    return {
+        "wins": wins,
+        "trials": trials,
+        "rate": wins / trials if trials else None,
+        "ci95": list(wilson_interval(wins, trials)),
+    }
+
+
+class Telemetry:  # pylint: disable=too-many-instance-attributes
+    """Running throughput, error and win-rate counters for a simulation run.
+
+    `observe` only bumps counters. `tick` builds a snapshot at most once per
+    `interval` seconds and hands it to the sinks (file writer, HTTP endpoint), so
+    calling it after every game costs one clock read in the common case.
+    """
+
+    __slots__ = (
+        "total",
+        "interval",
+        "started",
+        "games",
+        "errors",
+        "seat_trials",
+        "seat_wins",
+        "bot_trials",
+        "bot_wins",
+        "caller_games",
+        "caller_wins",
+        "latest",
+        "sinks",
+        "_next",
+        "_last_games",
+        "_last_time",
+    )
+
+    def __init__(self, total: int | None = None, interval: float = 1.0) -> None:
+        self.total = total
+        self.interval = interval
+        self.started = time.monotonic()
+        self.games = 0
+        self.errors: DefaultDict[str, int] = defaultdict(int)
+        self.seat_trials = [0] * PLAYER_COUNT
+        self.seat_wins = [0] * PLAYER_COUNT
+        self.bot_trials: DefaultDict[str, int] = defaultdict(int)
+        self.bot_wins: DefaultDict[str, int] = defaultdict(int)
+        self.caller_games = 0
+        self.caller_wins = 0
+        self.latest: dict = {}
+        self.sinks: list[Callable[[dict], None]] = []
+        self._next = self.started
+        self._last_games = 0
+        self._last_time = self.started
+
+    def observe(
+        self,
+        lineup: Sequence[str],
+        winners: Sequence[int] | None,
+        error: str | None = None,
+        caller_team_won: bool | None = None,
+    ) -> None:
+        """Counts one game; `error` is an exception type name, `winners` None if unscored."""
+        self.games += 1
+        if error is not None:
+            self.errors[error] += 1
+            return
+        if winners is None:
+            return
+        for seat, name in enumerate(lineup):
+            won = seat in winners
+            self.seat_trials[seat] += 1
+            self.seat_wins[seat] += won
+            self.bot_trials[name] += 1
+            self.bot_wins[name] += won
+        if caller_team_won is not None:
+            self.caller_games += 1
+            self.caller_wins += caller_team_won
+
+    def record(self, result: GameResult) -> None:
+        error = None if result.error is None else result.error.split(":", 1)[0]
+        self.observe(result.lineup, result.winners, error, result.caller_team_won)
+
+    def snapshot(self) -> dict:
+        now = time.monotonic()
+        elapsed = now - self.started
+        rate = self.games / elapsed if elapsed > 0 else 0.0
+        recent_span = now - self._last_time
+        recent = (self.games - self._last_games) / recent_span if recent_span > 0 else rate
+        self._last_games, self._last_time = self.games, now
+        eta = None
+        if self.total is not None and rate > 0:
+            eta = max(self.total - self.games, 0) / rate
+        return {
+            "time": time.time(),
+            "elapsed_seconds": elapsed,
+            "games": self.games,
+            "total": self.total,
+            "games_per_second": rate,
+            "recent_games_per_second": recent,
+            "eta_seconds": eta,
+            "errors": sum(self.errors.values()),
+            "errors_by_type": dict(self.errors),
+            "bot_win_rates": {
+                name: _rate(self.bot_wins[name], trials)
+                for name, trials in sorted(self.bot_trials.items())
+            },
+            "seat_win_rates": [
+                _rate(wins, trials) for wins, trials in zip(self.seat_wins, self.seat_trials)
+            ],
+            "caller_win_rate": _rate(self.caller_wins, self.caller_games),
+        }
+
+    def tick(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if now < self._next and not force:
+            return
+        self._next = now + self.interval
+        self.latest = self.snapshot()
+        for sink in self.sinks:
+            sink(self.latest)
+
+
+class TelemetryFile:
+    """Sink that atomically rewrites `path` with the latest snapshot as JSON."""
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self.path = Path(path)
+
+    def __call__(self, snapshot: dict) -> None:
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(snapshot), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+class TelemetryServer:
+    """Serves the latest snapshot as JSON on `http://host:port/` from a daemon thread.
+
+    Binds to localhost by default; port 0 picks a free port (see `port`).
+    """
+
+    def __init__(self, telemetry: Telemetry, host: str = "127.0.0.1", port: int = 0) -> None:
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # pylint: disable=invalid-name
+                if self.path not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = json.dumps(telemetry.latest).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+                # pylint: disable=redefined-builtin
+                return
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def port(self) -> int:
+        return int(self.server.server_address[1])
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self._thread.join()
+
+    def __enter__(self) -> TelemetryServer:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -2,8 +2,7 @@ import os
 from typing import Any
 
 from briscola5.application.game_service import GameService
-from briscola5.bots.greedy_bot import GreedyBot
-from briscola5.bots.random_bot import RandomBot
+from briscola5.bots.registry import BOT_REGISTRY
 from briscola5.domain.card import Rank, Suit
 from briscola5.domain.color_cli import Col
 from briscola5.domain.state import Phase
@@ -26,22 +25,27 @@ class CLI:
 
     def setup_bots(self):
         print(f"\n{Col.YELLOW}--- CHOOSE YOUR OPPONENTS ---{Col.RESET}")
-        print(f"  {Col.GREEN}1.{Col.RESET} 4 x RandomBot {Col.CYAN}(Random Moves){Col.RESET}")
-        print(f"  {Col.GREEN}2.{Col.RESET} 4 x GreedyBot {Col.CYAN}(Strategy){Col.RESET}\n")
-
+        levels = BOT_REGISTRY.by_cost()
+        for level, info in enumerate(levels, start=1):
+            print(f"  {Col.GREEN}{level}.{Col.RESET} 4 x {info.name}Bot")
+        print()
+
+        options = [str(level) for level in range(1, len(levels) + 1)]
+        listed = " or ".join(
+            [", ".join(options[:-1]), options[-1]] if len(options) > 1 else options
+        )
         while True:
-            choice = input(f"Choose {Col.GREEN}1{Col.RESET} or {Col.GREEN}2{Col.RESET}: ").strip()
-            if choice in ["1", "2"]:
+            choice = input(f"Choose {Col.GREEN}{listed}{Col.RESET}: ").strip()
+            if choice in options:
                 break
-            print(f"{Col.RED}[!] Invalid input. Choose 1 or 2.{Col.RESET}")
+            print(f"{Col.RED}[!] Invalid input. Choose {listed}.{Col.RESET}")
 
-        bot_class: type[Any]
-        if choice == "1":
-            bot_class = RandomBot
-            print(f"\n{Col.GREEN}[+] You chose Level 1: Playing with 4 RandomBots.{Col.RESET}")
-        else:
-            bot_class = GreedyBot
-            print(f"\n{Col.GREEN}[+] You chose Level 2: Playing with 4 GreedyBots.{Col.RESET}")
+        info = levels[int(choice) - 1]
+        bot_class = BOT_REGISTRY[info.name]
+        print(
+            f"\n{Col.GREEN}[+] You chose Level {choice}: "
+            f"Playing with 4 {info.name}Bots.{Col.RESET}"
+        )
 
         for i in range(5):
             if i != self.human_id:
@@ -52,8 +56,10 @@ class CLI:
     def _handle_human_bid(self, minimum: int, current: int):
         self.display_hand()
         while True:
+            highest = self.service.rules.max_bid
             prompt = (
-                f"{Col.YELLOW}> Your turn! Enter a bid ({minimum}-120) or 'pass': {Col.RESET}"
+                f"{Col.YELLOW}> Your turn! Enter a bid ({minimum}-{highest}) "
+                f"or 'pass': {Col.RESET}"
             )
             choice = input(prompt).strip().lower()
 
@@ -63,11 +69,11 @@ class CLI:
                 break
             if choice.isdigit():
                 bid_val = int(choice)
-                if 71 <= bid_val <= 120 and (current == 0 or bid_val > current):
+                if minimum <= bid_val <= highest and (current == 0 or bid_val > current):
                     self.service.auction_phase(self.human_id, bid_val)
                     print(f"{Col.GREEN}You offered: {bid_val}{Col.RESET}")
                     break
-                print(f"{Col.RED}[!] Offer must be between {minimum} and 120.{Col.RESET}")
+                print(f"{Col.RED}[!] Offer must be between {minimum} and {highest}.{Col.RESET}")
             else:
                 print(f"{Col.RED}[!] Unrecognized input.{Col.RESET}")
 
@@ -79,7 +85,8 @@ class CLI:
             curr_bid = self.service.state.auction.last_bid or 0
 
             if curr_p == self.human_id:
-                self._handle_human_bid(max(71, curr_bid + 1), curr_bid)
+                rules = self.service.rules
+                self._handle_human_bid(max(rules.min_bid, curr_bid + 1), curr_bid)
             else:
                 bot = self.bots[curr_p]
                 bid = bot.make_bid(self.service.state)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from enum import Enum
+from typing import Iterable
 
 
 class Suit(str, Enum):
@@ -50,12 +51,19 @@ POINTS: dict[Rank, int] = {
 }
 
 
+_SUIT_ORDER = {suit: i for i, suit in enumerate(Suit)}
+_RANK_ORDER = {rank: i for i, rank in enumerate(Rank)}
+
+
 class Card:
-    __slots__ = ("_suit", "_rank")
+    # `_index` is the card's position in `full_deck()`, kept so that hashing and
+    # `card_index` do not have to hash the (suit, rank) pair on every lookup.
+    __slots__ = ("_suit", "_rank", "_index")
 
     def __init__(self, suit: Suit, rank: Rank) -> None:
         self._suit = suit
         self._rank = rank
+        self._index = _SUIT_ORDER[suit] * len(Rank) + _RANK_ORDER[rank]
 
     @property
     def suit(self) -> Suit:
@@ -79,10 +87,10 @@ class Card:
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Card):
             return False
-        return self._suit == other._suit and self._rank == other._rank
+        return self._index == other._index
 
     def __hash__(self) -> int:
-        return hash((self._suit, self._rank))
+        return self._index
 
 
 def full_deck() -> list[Card]:
@@ -92,3 +100,29 @@ def full_deck() -> list[Card]:
 def assert_is_valid_deck(deck: list[Card]) -> None:
     if set(deck) != set(full_deck()):
         raise ValueError("Deck is not a valid 40-card Sicilian deck")
+
+
+DECK_SIZE = 40
+
+_DECK: tuple[Card, ...] = tuple(full_deck())
+
+
+def card_index(card: Card) -> int:
+    """Stable 0..39 index of a card, following the `full_deck()` order."""
+    return card._index  # pylint: disable=protected-access
+
+
+def card_from_index(index: int) -> Card:
+    return _DECK[index]
+
+
+def cards_to_mask(cards: Iterable[Card]) -> int:
+    """Packs a set of cards into a 40-bit integer mask (bit i = `card_from_index(i)`)."""
+    mask = 0
+    for card in cards:
+        mask |= 1 << card._index  # pylint: disable=protected-access
+    return mask
+
+
+def mask_to_cards(mask: int) -> list[Card]:
+    return [_DECK[i] for i in range(DECK_SIZE) if mask >> i & 1]
@@ -16,3 +16,7 @@ class AuctionError(GameError):
 
 class MoveError(GameError):
     """Raised for invalid moves (e.g., illegal card played)."""
+
+
+class HiddenInformationError(GameError):
+    """Raised when a player view is asked for information its seat may not see."""
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from .card import DECK_SIZE, Card
+
+PLAYER_COUNT = 5
+MAX_TOTAL_POINTS = 120
+MIN_BID = 71
+# Width of the bid ranges that statistics group targets into (71-75, 76-80, ...).
+BID_BUCKET_WIDTH = 5
+NUM_BID_BUCKETS = (MAX_TOTAL_POINTS - MIN_BID) // BID_BUCKET_WIDTH + 1
+
+
+class RuleSet:
+    """Variant parameters, compiled into lookup tables when the rule set is built.
+
+    The engine only indexes these tables, so a variant costs nothing per move:
+    - bids must lie in `min_bid..max_bid` and beat the previous bid;
+    - a dead-trick discard is legal while target plus discarded points stay within
+      `dead_trick_cap`, which may not be below `max_bid` (None lifts the cap);
+    - the called card may not be in the caller's hand, nor (unless
+      `call_discarded_card`) among the dead-trick discards.
+    """
+
+    __slots__ = (
+        "min_bid",
+        "max_bid",
+        "hand_size",
+        "dead_trick_cap",
+        "call_discarded_card",
+        "discard_allowance",
+        "_discard_call_mask",
+    )
+
+    def __init__(
+        self,
+        *,
+        min_bid: int = MIN_BID,
+        max_bid: int = MAX_TOTAL_POINTS,
+        dead_trick_cap: int | None = MAX_TOTAL_POINTS,
+        call_discarded_card: bool = False,
+    ) -> None:
+        if not 0 < min_bid <= max_bid <= MAX_TOTAL_POINTS:
+            raise ValueError(f"Invalid bid bounds {min_bid}..{max_bid}")
+        if dead_trick_cap is not None and dead_trick_cap < max_bid:
+            # A winning bid above the cap would leave no legal discard at all.
+            raise ValueError(f"dead_trick_cap {dead_trick_cap} is below max_bid {max_bid}")
+        self.min_bid = min_bid
+        self.max_bid = max_bid
+        self.hand_size = DECK_SIZE // PLAYER_COUNT
+        self.dead_trick_cap = dead_trick_cap
+        self.call_discarded_card = call_discarded_card
+
+        # Points that may still be discarded in the dead trick, indexed by target.
+        cap = MAX_TOTAL_POINTS * 2 if dead_trick_cap is None else dead_trick_cap
+        self.discard_allowance = tuple(cap - target for target in range(MAX_TOTAL_POINTS + 1))
+        self._discard_call_mask = 0 if call_discarded_card else (1 << DECK_SIZE) - 1
+
+    def opening_bid(self, last_bid: int | None) -> int:
+        """Lowest bid that is currently allowed (may exceed `max_bid` when none is)."""
+        return self.min_bid if last_bid is None else max(last_bid + 1, self.min_bid)
+
+    def is_valid_bid(self, offer: int, last_bid: int | None) -> bool:
+        return self.opening_bid(last_bid) <= offer <= self.max_bid
+
+    def is_legal_discard(self, target: int, discarded_points: int, card: Card) -> bool:
+        return card.points <= self.discard_allowance[target] - discarded_points
+
+    def forbidden_calls(self, caller_hand_mask: int, dead_trick_mask: int) -> int:
+        """40-bit mask of cards that may not be called."""
+        return caller_hand_mask | dead_trick_mask & self._discard_call_mask
+
+    def __repr__(self) -> str:
+        return (
+            f"RuleSet(min_bid={self.min_bid}, max_bid={self.max_bid}, "
+            f"dead_trick_cap={self.dead_trick_cap}, "
+            f"call_discarded_card={self.call_discarded_card})"
+        )
+
+
+STANDARD_RULES = RuleSet()
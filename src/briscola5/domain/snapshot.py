@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import random
+from typing import NamedTuple
+
+from .card import DECK_SIZE, Card, Suit, card_from_index, card_index, cards_to_mask, mask_to_cards
+from .rules import MAX_TOTAL_POINTS, PLAYER_COUNT, STANDARD_RULES, RuleSet
+from .state import GameState, Phase
+from .trick import PlayedCard
+
+PHASES: tuple[Phase, ...] = tuple(Phase)
+SUITS: tuple[Suit, ...] = tuple(Suit)
+PHASE_INDEX = {phase: i for i, phase in enumerate(PHASES)}
+SUIT_INDEX = {suit: i for i, suit in enumerate(SUITS)}
+NONE = -1
+MAX_TRICKS = 8
+
+
+def _opt(value: int | None) -> int:
+    return NONE if value is None else value
+
+
+def _unopt(value: int) -> int | None:
+    return None if value == NONE else value
+
+
+class Snapshot(NamedTuple):
+    """Immutable, hashable image of a GameState built only from ints.
+
+    Hands are 40-bit masks (see `cards_to_mask`), so the order of cards inside a hand
+    is not kept: `to_state` returns hands sorted in deck order. Trick entries pack
+    `player << 6 | card index` in play order. Absent values are `NONE` (-1).
+    """
+
+    phase: int
+    current_player: int
+    dealer: int
+    hands: tuple[int, ...]
+    trick: tuple[int, ...]
+    trick_index: int
+    last_bid: int
+    last_bidder: int
+    passed: int
+    caller: int
+    target: int
+    trump: int
+    called: int
+    partner: int
+    partner_revealed: bool
+    caller_team_won: int
+    points: tuple[int, ...]
+    won: tuple[int, ...]
+
+    @classmethod
+    def from_state(cls, state: GameState) -> Snapshot:
+        call, auction = state.call, state.auction
+        won = NONE if call.caller_team_won is None else int(call.caller_team_won)
+        return cls(
+            phase=PHASE_INDEX[state.phase],
+            current_player=state.turn.current_player,
+            dealer=state.turn.dealer_player,
+            hands=tuple(cards_to_mask(hand) for hand in state.hands),
+            trick=tuple(pc.player_id << 6 | card_index(pc.card) for pc in state.trick.played),
+            trick_index=state.trick.index,
+            last_bid=_opt(auction.last_bid),
+            last_bidder=_opt(auction.last_bidder),
+            passed=sum(1 << seat for seat, passed in enumerate(auction.passed) if passed),
+            caller=_opt(call.caller_player),
+            target=_opt(call.target_points),
+            trump=NONE if call.trump_suit is None else SUIT_INDEX[call.trump_suit],
+            called=NONE if call.called_card is None else card_index(call.called_card),
+            partner=_opt(call.partner_player_internal),
+            partner_revealed=call.partner_revealed,
+            caller_team_won=won,
+            points=tuple(state.score.player_points),
+            won=tuple(cards_to_mask(cards) for cards in state.score.won_cards),
+        )
+
+    def to_state(self, rules: RuleSet = STANDARD_RULES) -> GameState:
+        """Rebuilds a GameState; the rule set is not part of the snapshot."""
+        state = GameState(rules)
+        state.phase = PHASES[self.phase]
+        state.turn.current_player = self.current_player
+        state.turn.dealer_player = self.dealer
+        state.hands = [mask_to_cards(mask) for mask in self.hands]
+        state.trick.played = [
+            PlayedCard(player_id=entry >> 6, card=card_from_index(entry & 0x3F))
+            for entry in self.trick
+        ]
+        state.trick.index = self.trick_index
+
+        auction = state.auction
+        auction.start_player = (self.dealer + 1) % PLAYER_COUNT
+        auction.current_player = self.current_player
+        auction.last_bid = _unopt(self.last_bid)
+        auction.last_bidder = _unopt(self.last_bidder)
+        auction.passed = [bool(self.passed >> seat & 1) for seat in range(PLAYER_COUNT)]
+
+        call = state.call
+        call.caller_player = _unopt(self.caller)
+        call.target_points = _unopt(self.target)
+        call.trump_suit = None if self.trump == NONE else SUITS[self.trump]
+        call.called_card = None if self.called == NONE else card_from_index(self.called)
+        call.partner_player_internal = _unopt(self.partner)
+        call.partner_revealed = self.partner_revealed
+        call.caller_team_won = (
+            None if self.caller_team_won == NONE else bool(self.caller_team_won)
+        )
+        state.score.player_points = list(self.points)
+        state.score.won_cards = [mask_to_cards(mask) for mask in self.won]
+        return state
+
+
+class Zobrist:  # pylint: disable=too-many-instance-attributes
+    """Stable 64-bit Zobrist keys for snapshots, with O(1) updates for card play.
+
+    The random tables come from a fixed seed, so keys are identical across processes
+    and runs and can be stored in shared or persisted transposition tables.
+    """
+
+    def __init__(self, seed: int = 0x5EED_B5) -> None:
+        rng = random.Random(seed)
+
+        def table(size: int) -> list[int]:
+            return [rng.getrandbits(64) for _ in range(size)]
+
+        self.hand = [table(DECK_SIZE) for _ in range(PLAYER_COUNT)]
+        self.trick = [table(DECK_SIZE) for _ in range(PLAYER_COUNT)]
+        self.phase = table(len(PHASES))
+        self.turn = table(PLAYER_COUNT)
+        self.dealer = table(PLAYER_COUNT)
+        self.trick_index = table(MAX_TRICKS + 1)
+        self.last_bid = table(MAX_TOTAL_POINTS + 2)
+        self.last_bidder = table(PLAYER_COUNT + 1)
+        self.passed = table(PLAYER_COUNT)
+        self.caller = table(PLAYER_COUNT + 1)
+        self.target = table(MAX_TOTAL_POINTS + 2)
+        self.trump = table(len(SUITS) + 1)
+        self.called = table(DECK_SIZE + 1)
+        self.partner = table(PLAYER_COUNT + 1)
+        self.partner_revealed = rng.getrandbits(64)
+        self.caller_team_won = table(3)
+        self.points = [table(MAX_TOTAL_POINTS + 1) for _ in range(PLAYER_COUNT)]
+
+    def key(self, snapshot: Snapshot) -> int:
+        """Full key computation; optional fields use slot NONE (the last table entry).
+
+        `won` is left out: which cards were collected does not change how the game
+        continues once the points are known, so such positions share a key.
+        """
+        key = self.phase[snapshot.phase] ^ self.turn[snapshot.current_player]
+        key ^= self.dealer[snapshot.dealer] ^ self.trick_index[snapshot.trick_index]
+        for seat, mask in enumerate(snapshot.hands):
+            hand_keys = self.hand[seat]
+            while mask:
+                low = mask & -mask
+                key ^= hand_keys[low.bit_length() - 1]
+                mask ^= low
+        for entry in snapshot.trick:
+            key ^= self.trick[entry >> 6][entry & 0x3F]
+        key ^= self.last_bid[snapshot.last_bid] ^ self.last_bidder[snapshot.last_bidder]
+        for seat in range(PLAYER_COUNT):
+            if snapshot.passed >> seat & 1:
+                key ^= self.passed[seat]
+        key ^= self.caller[snapshot.caller] ^ self.target[snapshot.target]
+        key ^= self.trump[snapshot.trump] ^ self.called[snapshot.called]
+        key ^= self.partner[snapshot.partner] ^ self.caller_team_won[snapshot.caller_team_won]
+        if snapshot.partner_revealed:
+            key ^= self.partner_revealed
+        for seat, points in enumerate(snapshot.points):
+            key ^= self.points[seat][points]
+        return key
+
+    def play_card(self, key: int, player_id: int, card: Card, next_player: int) -> int:
+        """Key after `player_id` moves `card` from hand to the trick and the turn passes."""
+        idx = card_index(card)
+        key ^= self.hand[player_id][idx] ^ self.trick[player_id][idx]
+        return key ^ self.turn[player_id] ^ self.turn[next_player]
+
+    def collect_trick(
+        self, key: int, played: list[PlayedCard], winner: int, old_points: int, new_points: int
+    ) -> int:
+        """Key after a complete trick leaves the table and its points go to `winner`.
+
+        Callers also apply `set_turn` and advance `trick_index` as the engine does.
+        """
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+        for pc in played:
+            key ^= self.trick[pc.player_id][card_index(pc.card)]
+        return key ^ self.points[winner][old_points] ^ self.points[winner][new_points]
+
+    def set_turn(self, key: int, old_player: int, new_player: int) -> int:
+        return key ^ self.turn[old_player] ^ self.turn[new_player]
+
+    def set_trick_index(self, key: int, old_index: int, new_index: int) -> int:
+        return key ^ self.trick_index[old_index] ^ self.trick_index[new_index]
+
+
+ZOBRIST = Zobrist()
+
+
+def state_key(state: GameState) -> int:
+    """Stable 64-bit key of a live state (snapshot plus full Zobrist computation)."""
+    return ZOBRIST.key(Snapshot.from_state(state))
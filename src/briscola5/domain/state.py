@@ -3,10 +3,11 @@ from __future__ import annotations
 from enum import Enum
 from typing import Optional
 
-from .card import Card, Suit
+from .card import DECK_SIZE, Card, Suit, cards_to_mask
+from .rules import PLAYER_COUNT, STANDARD_RULES, RuleSet
 from .trick import PlayedCard
 
-PLAYER_COUNT = 5
+_ALL_CARDS = (1 << DECK_SIZE) - 1
 
 
 class Phase(str, Enum):
@@ -88,6 +89,11 @@ class CallState:
         self.partner_revealed: bool = False
         self.caller_team_won: Optional[bool] = None
 
+    @property
+    def revealed_partner(self) -> Optional[int]:
+        """The partner once publicly revealed, else None."""
+        return self.partner_player_internal if self.partner_revealed else None
+
 
 class ScoreState:
     __slots__ = ("won_cards", "player_points")
@@ -105,7 +111,7 @@ class TurnState:
         self.dealer_player: int = 0
 
 
-class GameState:
+class GameState:  # pylint: disable=too-many-instance-attributes
     __slots__ = (
         "phase",
         "hands",
@@ -114,9 +120,10 @@ class GameState:
         "call",
         "score",
         "turn",
+        "rules",
     )
 
-    def __init__(self) -> None:
+    def __init__(self, rules: RuleSet = STANDARD_RULES) -> None:
         self.phase: Phase = Phase.AUCTION
 
         self.turn: TurnState = TurnState()
@@ -126,6 +133,7 @@ class GameState:
         self.trick: TrickState = TrickState()
         self.call: CallState = CallState()
         self.score: ScoreState = ScoreState(player_count=PLAYER_COUNT)
+        self.rules: RuleSet = rules
 
     def is_game_over(self) -> bool:
         return self.phase == Phase.GAME_OVER
@@ -138,9 +146,34 @@ class GameState:
         self.assert_player_id(player_id)
         return len(self.hands[player_id])
 
+    @property
+    def hand_sizes(self) -> tuple[int, ...]:
+        return tuple(len(hand) for hand in self.hands)
+
+    def played_mask(self) -> int:
+        """Cards no longer in any hand (earlier tricks and the table), as a card mask."""
+        held = 0
+        for hand in self.hands:
+            held |= cards_to_mask(hand)
+        return _ALL_CARDS & ~held
+
     def current_trick_is_complete(self) -> bool:
         return self.trick.is_complete()
 
+    def dead_trick_points(self) -> Optional[int]:
+        """Target points plus the points already discarded in the dead trick."""
+        if self.call.target_points is None:
+            return None
+        return self.call.target_points + sum(pc.card.points for pc in self.trick.played)
+
+    def is_legal_discard(self, card: Card) -> bool:
+        """A dead-trick discard may not push target plus discarded points over the cap."""
+        target = self.call.target_points
+        if target is None:
+            return False
+        discarded = sum(pc.card.points for pc in self.trick.played)
+        return self.rules.is_legal_discard(target, discarded, card)
+
     def team_points_if_known(self) -> Optional[tuple[int, int]]:
         """
         Returns (caller_team_points, others_points) if partner is known internally.
@@ -155,6 +188,19 @@ class GameState:
         others = sum(self.score.player_points) - caller_team
         return caller_team, others
 
+    def winning_players(self) -> Optional[list[int]]:
+        """Seats on the winning side once the game has been scored, else None."""
+        caller = self.call.caller_player
+        if caller is None or self.call.caller_team_won is None:
+            return None
+        team = [caller]
+        partner = self.call.partner_player_internal
+        if partner is not None and partner != caller:
+            team.append(partner)
+        if self.call.caller_team_won:
+            return team
+        return [p for p in range(PLAYER_COUNT) if p not in team]
+
     def __repr__(self) -> str:
         return (
             "GameState("
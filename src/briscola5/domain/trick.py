@@ -23,7 +23,11 @@ def trick_points(played: Sequence[PlayedCard]) -> int:
 def resolve_trick(played: Sequence[PlayedCard], trump_suit: Suit | None) -> int:
     if len(played) != 5:
         raise ValueError(f"Expected 5 played cards, got {len(played)}")
+    return current_winner(played, trump_suit)
 
+
+def current_winner(played: Sequence[PlayedCard], trump_suit: Suit | None) -> int:
+    """Player holding a (possibly unfinished, non-empty) trick so far."""
     lead_suit = played[0].card.suit
 
     if trump_suit is not None and any(pc.card.suit == trump_suit for pc in played):
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+from typing import Iterator, Optional, Sequence, Union
+
+from .card import DECK_SIZE, Card, Suit, cards_to_mask
+from .errors import HiddenInformationError
+from .rules import PLAYER_COUNT, RuleSet
+from .state import GameState, Phase
+from .trick import PlayedCard
+
+_ALL_CARDS = (1 << DECK_SIZE) - 1
+
+
+class _HandsView(Sequence[Sequence[Card]]):
+    """`state.hands` as one seat sees it: its own hand, and only the size of the others."""
+
+    __slots__ = ("_view",)
+
+    def __init__(self, view: PlayerView) -> None:
+        self._view = view
+
+    def __getitem__(self, seat: int) -> Sequence[Card]:  # type: ignore[override]
+        view = self._view
+        if seat != view.seat:
+            raise HiddenInformationError(f"Player {view.seat} cannot see the hand of {seat}")
+        return view.hand
+
+    def __len__(self) -> int:
+        return PLAYER_COUNT
+
+    def __iter__(self) -> Iterator[Sequence[Card]]:
+        raise HiddenInformationError("Only the own hand of a PlayerView can be read")
+
+
+class AuctionView:
+    __slots__ = ("_state",)
+
+    def __init__(self, state: GameState) -> None:
+        self._state = state
+
+    @property
+    def start_player(self) -> int:
+        return self._state.auction.start_player
+
+    @property
+    def current_player(self) -> int:
+        return self._state.auction.current_player
+
+    @property
+    def last_bid(self) -> Optional[int]:
+        return self._state.auction.last_bid
+
+    @property
+    def last_bidder(self) -> Optional[int]:
+        return self._state.auction.last_bidder
+
+    @property
+    def passed(self) -> tuple[bool, ...]:
+        return tuple(self._state.auction.passed)
+
+    def is_player_active(self, player_id: int) -> bool:
+        return self._state.auction.is_player_active(player_id)
+
+    def active_players_count(self) -> int:
+        return self._state.auction.active_players_count()
+
+
+class TrickView:
+    __slots__ = ("_state", "_view")
+
+    def __init__(self, state: GameState, view: PlayerView) -> None:
+        self._state = state
+        self._view = view
+
+    @property
+    def played(self) -> tuple[PlayedCard, ...]:
+        return self._view.played
+
+    @property
+    def index(self) -> int:
+        return self._state.trick.index
+
+    def is_complete(self) -> bool:
+        return self._state.trick.is_complete()
+
+
+class CallView:
+    """The call as a seat knows it: the partner only once revealed, or to the partner."""
+
+    __slots__ = ("_state", "_seat")
+
+    def __init__(self, state: GameState, seat: int) -> None:
+        self._state = state
+        self._seat = seat
+
+    @property
+    def caller_player(self) -> Optional[int]:
+        return self._state.call.caller_player
+
+    @property
+    def target_points(self) -> Optional[int]:
+        return self._state.call.target_points
+
+    @property
+    def trump_suit(self) -> Optional[Suit]:
+        return self._state.call.trump_suit
+
+    @property
+    def called_card(self) -> Optional[Card]:
+        return self._state.call.called_card
+
+    @property
+    def partner_revealed(self) -> bool:
+        return self._state.call.partner_revealed
+
+    @property
+    def revealed_partner(self) -> Optional[int]:
+        return self._state.call.revealed_partner
+
+    @property
+    def partner_player(self) -> Optional[int]:
+        call = self._state.call
+        if call.partner_revealed or call.partner_player_internal == self._seat:
+            return call.partner_player_internal
+        return None
+
+    @property
+    def caller_team_won(self) -> Optional[bool]:
+        return self._state.call.caller_team_won
+
+
+class ScoreView:
+    __slots__ = ("_state",)
+
+    def __init__(self, state: GameState) -> None:
+        self._state = state
+
+    @property
+    def player_points(self) -> tuple[int, ...]:
+        return tuple(self._state.score.player_points)
+
+    @property
+    def won_cards(self) -> tuple[tuple[Card, ...], ...]:
+        return tuple(tuple(cards) for cards in self._state.score.won_cards)
+
+
+class PlayerView:  # pylint: disable=too-many-instance-attributes
+    """Read-only view of a live GameState restricted to what `seat` may know.
+
+    Nothing is copied up front: scalars are read from the state on access, and the
+    own hand, the trick and the card masks are built on first use and rebuilt only
+    once the part of the state they come from has changed. The public attributes do
+    not expose other seats' hands or the partner (until revealed), which guards
+    against accidental peeking only: the live state stays reachable through the
+    private `_state` attributes. Untrusted bots belong in `bots.pool.BotPool`, whose
+    workers only ever receive what the seat knows. The attribute layout follows
+    GameState, so bots written against the state read a view the same way.
+    """
+
+    __slots__ = (
+        "seat",
+        "hands",
+        "call",
+        "auction",
+        "score",
+        "trick",
+        "_state",
+        "_hand_source",
+        "_hand_size",
+        "_hand",
+        "_hand_mask",
+        "_trick_key",
+        "_played",
+        "_played_key",
+        "_played_mask",
+    )
+
+    def __init__(self, state: GameState, seat: int) -> None:
+        state.assert_player_id(seat)
+        self._state = state
+        self.seat = seat
+        self.hands = _HandsView(self)
+        self.auction = AuctionView(state)
+        self.trick = TrickView(state, self)
+        self.call = CallView(state, seat)
+        self.score = ScoreView(state)
+        self._hand_source: list[Card] | None = None
+        self._hand_size = -1
+        self._hand: tuple[Card, ...] = ()
+        self._hand_mask = 0
+        self._trick_key: tuple[Phase, int, int] | None = None
+        self._played: tuple[PlayedCard, ...] = ()
+        self._played_key: tuple[int, int] | None = None
+        self._played_mask = 0
+
+    def _refresh_hand(self) -> None:
+        # Hands only shrink within a deal and are replaced by a new list on a re-deal.
+        hand = self._state.hands[self.seat]
+        if hand is not self._hand_source or len(hand) != self._hand_size:
+            self._hand_source = hand
+            self._hand_size = len(hand)
+            self._hand = tuple(hand)
+            self._hand_mask = cards_to_mask(hand)
+
+    @property
+    def hand(self) -> tuple[Card, ...]:
+        self._refresh_hand()
+        return self._hand
+
+    @property
+    def hand_mask(self) -> int:
+        self._refresh_hand()
+        return self._hand_mask
+
+    @property
+    def hand_sizes(self) -> tuple[int, ...]:
+        return tuple(len(hand) for hand in self._state.hands)
+
+    @property
+    def played(self) -> tuple[PlayedCard, ...]:
+        trick = self._state.trick
+        key = (self._state.phase, trick.index, len(trick.played))
+        if key != self._trick_key:
+            self._trick_key = key
+            self._played = tuple(trick.played)
+        return self._played
+
+    def played_mask(self) -> int:
+        """Cards no longer in any hand, like `GameState.played_mask`: public knowledge."""
+        # Every move takes exactly one card out of a hand, and a re-deal swaps the hand.
+        key = (sum(len(hand) for hand in self._state.hands), self.hand_mask)
+        if key != self._played_key:
+            self._played_key = key
+            self._played_mask = self._state.played_mask()
+        return self._played_mask
+
+    @property
+    def unseen_mask(self) -> int:
+        """Cards held by the other seats."""
+        return _ALL_CARDS & ~(self.played_mask() | self.hand_mask)
+
+    @property
+    def phase(self) -> Phase:
+        return self._state.phase
+
+    @property
+    def rules(self) -> RuleSet:
+        return self._state.rules
+
+    @property
+    def current_player(self) -> int:
+        return self._state.turn.current_player
+
+    @property
+    def dealer_player(self) -> int:
+        return self._state.turn.dealer_player
+
+    def is_game_over(self) -> bool:
+        return self._state.is_game_over()
+
+    def is_legal_discard(self, card: Card) -> bool:
+        return self._state.is_legal_discard(card)
+
+    def team_points_if_known(self) -> Optional[tuple[int, int]]:
+        """Team points once this seat knows the partner, like GameState's query."""
+        if self.call.partner_player is None:
+            return None
+        return self._state.team_points_if_known()
+
+    def __repr__(self) -> str:
+        return f"PlayerView(seat={self.seat}, phase={self._state.phase}, hand={list(self.hand)})"
+
+
+# What bots are shown: the whole state for trusted in-process bots, or a PlayerView.
+Observation = Union[GameState, PlayerView]
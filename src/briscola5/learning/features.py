@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from briscola5.application.record import ActionKind, GameRecord, decode_action, replay
+from briscola5.domain.card import DECK_SIZE, card_index, cards_to_mask
+from briscola5.domain.rules import MAX_TOTAL_POINTS, MIN_BID
+from briscola5.domain.snapshot import PHASE_INDEX, PHASES, SUIT_INDEX, SUITS
+from briscola5.domain.state import PLAYER_COUNT, Phase
+from briscola5.domain.view import Observation
+
+# Feature layout: (offset, width) of every block in an encoded row.
+HAND = (0, DECK_SIZE)
+SEEN = (HAND[0] + HAND[1], DECK_SIZE)
+TRICK = (SEEN[0] + SEEN[1], PLAYER_COUNT * DECK_SIZE)
+TRUMP = (TRICK[0] + TRICK[1], len(SUITS))
+CALLED = (TRUMP[0] + TRUMP[1], DECK_SIZE)
+BID = (CALLED[0] + CALLED[1], 1)
+CALLER = (BID[0] + BID[1], PLAYER_COUNT)
+PARTNER_REVEALED = (CALLER[0] + CALLER[1], 1)
+PARTNER = (PARTNER_REVEALED[0] + PARTNER_REVEALED[1], PLAYER_COUNT)
+PASSED = (PARTNER[0] + PARTNER[1], PLAYER_COUNT)
+PHASE = (PASSED[0] + PASSED[1], len(PHASES))
+TRICK_INDEX = (PHASE[0] + PHASE[1], 1)
+FEATURE_SIZE = TRICK_INDEX[0] + TRICK_INDEX[1]
+
+# Action space shared by all decisions: a card (discard/play), a called card, a bid or a pass.
+# Bids from MIN_BID up are encoded; rule sets allowing lower opening bids are rejected.
+CARD_ACTIONS = 0
+CALL_ACTIONS = CARD_ACTIONS + DECK_SIZE
+BID_ACTIONS = CALL_ACTIONS + DECK_SIZE
+PASS_ACTION = BID_ACTIONS + MAX_TOTAL_POINTS - MIN_BID + 1
+ACTION_SIZE = PASS_ACTION + 1
+
+_CARD_BITS = np.arange(DECK_SIZE, dtype=np.int64)
+_ALL_CARDS = (1 << DECK_SIZE) - 1
+
+
+def _relative(seat: int, player_id: int) -> int:
+    return (seat - player_id) % PLAYER_COUNT
+
+
+def encode_state(state: Observation, player_id: int, out: np.ndarray) -> None:
+    """Writes the observation of `player_id` into the 1-D float32 row `out` in place.
+
+    Seats are encoded relative to `player_id`, so offset 0 is always the observer.
+    Only public information and the observer's own hand are encoded.
+    """
+    out.fill(0.0)
+    for card in state.hands[player_id]:
+        out[HAND[0] + card_index(card)] = 1.0
+
+    # Cards no longer in any hand have been played; those not on the table are history.
+    history = state.played_mask()
+    for pc in state.trick.played:
+        idx = card_index(pc.card)
+        history &= ~(1 << idx)
+        out[TRICK[0] + _relative(pc.player_id, player_id) * DECK_SIZE + idx] = 1.0
+    out[SEEN[0] : SEEN[0] + DECK_SIZE] = np.int64(history) >> _CARD_BITS & 1
+
+    call = state.call
+    if call.trump_suit is not None:
+        out[TRUMP[0] + SUIT_INDEX[call.trump_suit]] = 1.0
+    if call.called_card is not None:
+        out[CALLED[0] + card_index(call.called_card)] = 1.0
+    bid = call.target_points if call.target_points is not None else state.auction.last_bid
+    if bid is not None:
+        out[BID[0]] = bid / MAX_TOTAL_POINTS
+    if call.caller_player is not None:
+        out[CALLER[0] + _relative(call.caller_player, player_id)] = 1.0
+    if call.revealed_partner is not None:
+        out[PARTNER_REVEALED[0]] = 1.0
+        out[PARTNER[0] + _relative(call.revealed_partner, player_id)] = 1.0
+    for seat, passed in enumerate(state.auction.passed):
+        if passed:
+            out[PASSED[0] + _relative(seat, player_id)] = 1.0
+    out[PHASE[0] + PHASE_INDEX[state.phase]] = 1.0
+    out[TRICK_INDEX[0]] = state.trick.index / 8
+
+
+def action_to_index(kind: ActionKind, value: int) -> int:
+    """Maps a recorded action to its slot in the `ACTION_SIZE` action space."""
+    if kind is ActionKind.PASS:
+        return PASS_ACTION
+    if kind is ActionKind.BID:
+        if value < MIN_BID:
+            raise ValueError(
+                f"Bid {value} is below the encoded range {MIN_BID}..{MAX_TOTAL_POINTS}"
+            )
+        return BID_ACTIONS + value - MIN_BID
+    if kind is ActionKind.CALL:
+        return CALL_ACTIONS + value
+    return CARD_ACTIONS + value
+
+
+def encode_legal_actions(state: Observation, player_id: int, out: np.ndarray) -> None:
+    """Writes the legal-action mask of `player_id` into the 1-D bool row `out` in place.
+
+    Mirrors GameService under `state.rules`: bids must beat the last one within the
+    rule set's bounds, dead-trick discards obey its cap, the called card is any card
+    the rule set does not forbid, and any card in hand may be played in a normal trick.
+    """
+    rules = state.rules
+    if rules.min_bid < MIN_BID:
+        raise ValueError(f"Bids below {MIN_BID} do not fit the action space: {rules}")
+    out.fill(False)
+    hand = state.hands[player_id]
+    if state.phase is Phase.AUCTION:
+        lowest = rules.opening_bid(state.auction.last_bid)
+        out[BID_ACTIONS + lowest - MIN_BID : BID_ACTIONS + rules.max_bid - MIN_BID + 1] = True
+        out[PASS_ACTION] = True
+    elif state.phase is Phase.DEAD_TRICK_PLAY:
+        for card in hand:
+            if state.is_legal_discard(card):
+                out[CARD_ACTIONS + card_index(card)] = True
+    elif state.phase is Phase.DEAD_TRICK_CALL:
+        dead_trick = cards_to_mask(pc.card for pc in state.trick.played)
+        allowed = _ALL_CARDS & ~rules.forbidden_calls(cards_to_mask(hand), dead_trick)
+        out[CALL_ACTIONS : CALL_ACTIONS + DECK_SIZE] = np.int64(allowed) >> _CARD_BITS & 1
+    elif state.phase is Phase.TRICK_PLAY:
+        for card in hand:
+            out[CARD_ACTIONS + card_index(card)] = True
+
+
+class FeatureChunk:
+    """Preallocated block of samples; `size` rows of each array are valid."""
+
+    __slots__ = ("features", "actions", "players", "size")
+
+    def __init__(self, capacity: int) -> None:
+        self.features = np.zeros((capacity, FEATURE_SIZE), dtype=np.float32)
+        self.actions = np.zeros(capacity, dtype=np.int16)
+        self.players = np.zeros(capacity, dtype=np.int8)
+        self.size = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.features.shape[0]
+
+    def is_full(self) -> bool:
+        return self.size == self.capacity
+
+    def add(self, state: Observation, player_id: int, action_index: int) -> None:
+        row = self.size
+        encode_state(state, player_id, self.features[row])
+        self.actions[row] = action_index
+        self.players[row] = player_id
+        self.size = row + 1
+
+
+def iter_feature_chunks(
+    records: Iterable[GameRecord], chunk_size: int = 4096
+) -> Iterator[FeatureChunk]:
+    """Streams every decision of `records` as (observation, action) samples.
+
+    A single FeatureChunk is reused: each yielded chunk is overwritten once the
+    generator is advanced, so consume or copy it first. The last chunk may be partial.
+    """
+    chunk = FeatureChunk(chunk_size)
+    for record in records:
+        for service, action in replay(record):
+            kind, player_id, value = decode_action(action)
+            chunk.add(service.state, player_id, action_to_index(kind, value))
+            if chunk.is_full():
+                yield chunk
+                chunk.size = 0
+    if chunk.size:
+        yield chunk
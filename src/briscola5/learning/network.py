@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from os import PathLike
+from typing import Sequence
+
+import numpy as np
+
+from briscola5.domain.view import Observation
+from briscola5.learning.features import (
+    ACTION_SIZE,
+    FEATURE_SIZE,
+    encode_legal_actions,
+    encode_state,
+)
+
+HIDDEN_SIZES = (256, 128)
+NO_LEGAL_ACTION = -1
+
+
+class PolicyValueNetwork:
+    """ReLU MLP trunk with a policy head over the action space and a tanh value head.
+
+    Parameters are float32 arrays named `hidden_w{i}`/`hidden_b{i}`, `policy_w`/`policy_b`
+    and `value_w`/`value_b`, which is also the layout of the `.npz` weight files.
+    """
+
+    def __init__(self, params: dict[str, np.ndarray]) -> None:
+        self.params = {
+            name: np.asarray(value, dtype=np.float32) for name, value in params.items()
+        }
+        self.depth = sum(1 for name in self.params if name.startswith("hidden_w"))
+        width = FEATURE_SIZE
+        for i in range(self.depth):
+            width = self._check_layer(f"hidden_w{i}", f"hidden_b{i}", width)
+        self._check_layer("policy_w", "policy_b", width, ACTION_SIZE)
+        self._check_layer("value_w", "value_b", width, 1)
+
+    def _check_layer(self, w_name: str, b_name: str, fan_in: int, fan_out: int = 0) -> int:
+        weights, bias = self.params[w_name], self.params[b_name]
+        if weights.shape[0] != fan_in or (fan_out and weights.shape[1] != fan_out):
+            raise ValueError(
+                f"Layer {w_name} has shape {weights.shape}, expected fan-in {fan_in}"
+            )
+        if bias.shape != (weights.shape[1],):
+            raise ValueError(f"Bias {b_name} has shape {bias.shape}")
+        return int(weights.shape[1])
+
+    @classmethod
+    def initialise(
+        cls, hidden_sizes: Sequence[int] = HIDDEN_SIZES, seed: int | None = None
+    ) -> PolicyValueNetwork:
+        """He-initialised weights, zero biases and a near-uniform initial policy."""
+        rng = np.random.default_rng(seed)
+        params: dict[str, np.ndarray] = {}
+        fan_in = FEATURE_SIZE
+        for i, width in enumerate(hidden_sizes):
+            params[f"hidden_w{i}"] = rng.normal(0.0, np.sqrt(2.0 / fan_in), (fan_in, width))
+            params[f"hidden_b{i}"] = np.zeros(width)
+            fan_in = width
+        params["policy_w"] = rng.normal(0.0, 0.01, (fan_in, ACTION_SIZE))
+        params["policy_b"] = np.zeros(ACTION_SIZE)
+        params["value_w"] = rng.normal(0.0, 0.01, (fan_in, 1))
+        params["value_b"] = np.zeros(1)
+        return cls(params)
+
+    @classmethod
+    def load(cls, path: str | PathLike) -> PolicyValueNetwork:
+        with np.load(path) as data:
+            return cls({name: data[name] for name in data.files})
+
+    def save(self, path: str | PathLike) -> None:
+        np.savez(path, **self.params)  # type: ignore[arg-type]
+
+    def forward(self, features: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Returns (policy logits of shape (N, ACTION_SIZE), values of shape (N,))."""
+        x = features
+        for i in range(self.depth):
+            x = x @ self.params[f"hidden_w{i}"]
+            x += self.params[f"hidden_b{i}"]
+            np.maximum(x, 0.0, out=x)
+        logits = x @ self.params["policy_w"]
+        logits += self.params["policy_b"]
+        values = np.tanh(x @ self.params["value_w"] + self.params["value_b"])
+        return logits, values[:, 0]
+
+
+class NetworkPolicy:
+    """Batched, masked action selection shared by every bot (and table) using one network.
+
+    Observation and mask buffers are preallocated and grown on demand, so a batch
+    of decisions costs one encoding pass plus a single forward pass.
+    """
+
+    def __init__(
+        self, network: PolicyValueNetwork, sample: bool = False, seed: int | None = None
+    ) -> None:
+        self.network = network
+        self.sample = sample
+        self.rng = np.random.default_rng(seed)
+        self._features = np.zeros((0, FEATURE_SIZE), dtype=np.float32)
+        self._masks = np.zeros((0, ACTION_SIZE), dtype=bool)
+
+    def _reserve(self, size: int) -> None:
+        if self._features.shape[0] < size:
+            capacity = max(size, 2 * self._features.shape[0])
+            self._features = np.zeros((capacity, FEATURE_SIZE), dtype=np.float32)
+            self._masks = np.zeros((capacity, ACTION_SIZE), dtype=bool)
+
+    def act_batch(
+        self, states: Sequence[Observation], player_ids: Sequence[int]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Chooses one legal action index per (state, seat) and returns it with the value.
+
+        Rows with no legal action get `NO_LEGAL_ACTION`.
+        """
+        size = len(states)
+        self._reserve(size)
+        features, masks = self._features[:size], self._masks[:size]
+        for row, (state, player_id) in enumerate(zip(states, player_ids)):
+            encode_state(state, player_id, features[row])
+            encode_legal_actions(state, player_id, masks[row])
+
+        logits, values = self.network.forward(features)
+        np.copyto(logits, -np.inf, where=~masks)
+        legal = masks.any(axis=1)
+        logits[~legal] = 0.0
+        if self.sample:
+            logits -= logits.max(axis=1, keepdims=True)
+            cumulative = np.cumsum(np.exp(logits), axis=1)
+            draws = self.rng.random(size) * cumulative[:, -1]
+            actions = (cumulative <= draws[:, None]).sum(axis=1)
+        else:
+            actions = logits.argmax(axis=1)
+        actions[~legal] = NO_LEGAL_ACTION
+        return actions, values
+
+    def last_observation(self, row: int = 0) -> np.ndarray:
+        """Encoded observation of `row` in the most recent batch (a view, not a copy)."""
+        observation: np.ndarray = self._features[row]
+        return observation
+
+    def act(self, state: Observation, player_id: int) -> int:
+        actions, _ = self.act_batch([state], [player_id])
+        return int(actions[0])
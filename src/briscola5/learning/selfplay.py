@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+import json
+import os
+import random
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from briscola5.application.record import silenced
+from briscola5.bots.base import BaseBot
+from briscola5.bots.greedy_bot import GreedyBot
+from briscola5.bots.network_bot import NetworkBot
+from briscola5.bots.simulator import deal_seeded, play_game, split_evenly
+from briscola5.domain.state import PLAYER_COUNT, Phase
+from briscola5.domain.view import Observation
+from briscola5.learning.features import FEATURE_SIZE
+from briscola5.learning.network import NO_LEGAL_ACTION, NetworkPolicy, PolicyValueNetwork
+from briscola5.learning.training import train_step
+
+
+class ReplayBuffer:
+    """Fixed-capacity ring of (observation, action, return) samples memory-mapped on disk.
+
+    The arrays live in `.npy` files under `directory` and the write position in
+    `meta.json`, so a buffer reopened with the same capacity resumes where it stopped.
+    """
+
+    def __init__(self, directory: str | os.PathLike, capacity: int) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.capacity = capacity
+        self.position = 0
+        self.size = 0
+
+        meta_path = self.directory / "meta.json"
+        mode = "w+"
+        if meta_path.exists():
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            if meta["capacity"] == capacity:
+                mode = "r+"
+                self.position, self.size = meta["position"], meta["size"]
+        self.features = self._open("features", mode, (capacity, FEATURE_SIZE), np.float32)
+        self.actions = self._open("actions", mode, (capacity,), np.int16)
+        self.returns = self._open("returns", mode, (capacity,), np.float32)
+
+    def _open(self, name: str, mode: str, shape: tuple[int, ...], dtype: type) -> np.memmap:
+        path = self.directory / f"{name}.npy"
+        if mode == "r+":
+            return open_memmap(path, mode="r+")
+        return open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def append(self, features: np.ndarray, actions: np.ndarray, returns: np.ndarray) -> None:
+        """Writes samples at the ring head, overwriting the oldest ones when full."""
+        count = len(actions)
+        if count > self.capacity:
+            features, actions, returns = (
+                features[-self.capacity :],
+                actions[-self.capacity :],
+                returns[-self.capacity :],
+            )
+            count = self.capacity
+        start = self.position
+        first = min(count, self.capacity - start)
+        for target, source in (
+            (self.features, features),
+            (self.actions, actions),
+            (self.returns, returns),
+        ):
+            target[start : start + first] = source[:first]
+            target[: count - first] = source[first:count]
+        self.position = (start + count) % self.capacity
+        self.size = min(self.size + count, self.capacity)
+
+    def sample(
+        self, batch_size: int, rng: np.random.Generator
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        idx = rng.integers(0, self.size, batch_size)
+        return self.features[idx], self.actions[idx], self.returns[idx]
+
+    def flush(self) -> None:
+        self.features.flush()
+        self.actions.flush()
+        self.returns.flush()
+        meta = {"capacity": self.capacity, "position": self.position, "size": self.size}
+        tmp = self.directory / "meta.json.tmp"
+        tmp.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(tmp, self.directory / "meta.json")
+
+
+class _RecordingBot(NetworkBot):
+    """NetworkBot that keeps every (observation, action) it produces."""
+
+    def __init__(self, player_id: int, policy: NetworkPolicy, steps: list) -> None:
+        super().__init__(player_id, policy)
+        self.steps = steps
+
+    def _act(self, state: Observation) -> int:
+        action = super()._act(state)
+        if action != NO_LEGAL_ACTION:
+            self.steps.append((self.policy.last_observation().copy(), action, self.player_id))
+        return action
+
+
+def _play_silently(bots: dict[int, BaseBot], dealer: int, rng: random.Random) -> list[int] | None:
+    """Deals from `rng`, plays to the end and returns the winning seats (None if void)."""
+    service = deal_seeded(dealer, rng)
+    with silenced():
+        try:
+            play_game(service, bots)
+        except RuntimeError:
+            return None
+        if service.state.phase != Phase.GAME_OVER:
+            return None
+        service.end_game()
+    return service.state.winning_players()
+
+
+def play_selfplay_games(
+    weights_path: str, num_games: int, seed: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Worker entry point: plays `num_games` with all five seats sampling from one network.
+
+    Every decision becomes a sample whose return is +1 if the acting seat ended on
+    the winning side and -1 otherwise.
+    """
+    policy = NetworkPolicy(PolicyValueNetwork.load(weights_path), sample=True, seed=seed)
+    rng = random.Random(seed)
+    features: list[np.ndarray] = []
+    actions: list[int] = []
+    returns: list[float] = []
+
+    for game_idx in range(num_games):
+        steps: list = []
+        bots: dict[int, BaseBot] = {
+            i: _RecordingBot(i, policy, steps) for i in range(PLAYER_COUNT)
+        }
+        winners = _play_silently(bots, game_idx % PLAYER_COUNT, rng)
+        if winners is None:
+            continue
+        for observation, action, player_id in steps:
+            features.append(observation)
+            actions.append(action)
+            returns.append(1.0 if player_id in winners else -1.0)
+
+    if not features:
+        return (
+            np.zeros((0, FEATURE_SIZE), dtype=np.float32),
+            np.zeros(0, dtype=np.int16),
+            np.zeros(0, dtype=np.float32),
+        )
+    return (
+        np.stack(features),
+        np.asarray(actions, dtype=np.int16),
+        np.asarray(returns, dtype=np.float32),
+    )
+
+
+def gating_score(weights_path: str, num_games: int, seed: int) -> tuple[int, int]:
+    """Worker entry point: one network seat against four GreedyBots, rotating the seat.
+
+    Deals depend only on `seed`, so two checkpoints scored with the same seed face
+    identical cards. Returns (games won by the network seat, games scored).
+    """
+    policy = NetworkPolicy(PolicyValueNetwork.load(weights_path))
+    rng = random.Random(seed)
+    won = scored = 0
+    for game_idx in range(num_games):
+        seat = game_idx % PLAYER_COUNT
+        bots: dict[int, BaseBot] = {i: GreedyBot(i) for i in range(PLAYER_COUNT)}
+        bots[seat] = NetworkBot(seat, policy)
+        winners = _play_silently(bots, game_idx % PLAYER_COUNT, rng)
+        if winners is not None:
+            scored += 1
+            won += seat in winners
+    return won, scored
+
+
+# pylint: disable=too-many-instance-attributes, too-many-arguments
+class SelfPlayConfig:
+    __slots__ = (
+        "workdir",
+        "workers",
+        "games_per_iteration",
+        "buffer_capacity",
+        "train_steps",
+        "batch_size",
+        "learning_rate",
+        "gate_every",
+        "gate_games",
+        "promote_margin",
+        "hidden_sizes",
+        "seed",
+    )
+
+    def __init__(
+        self,
+        workdir: str | os.PathLike,
+        *,
+        workers: int | None = None,
+        games_per_iteration: int = 200,
+        buffer_capacity: int = 1_000_000,
+        train_steps: int = 200,
+        batch_size: int = 256,
+        learning_rate: float = 1e-3,
+        gate_every: int = 5,
+        gate_games: int = 500,
+        promote_margin: float = 0.01,
+        hidden_sizes: Sequence[int] = (256, 128),
+        seed: int = 0,
+    ) -> None:
+        self.workdir = Path(workdir)
+        self.workers = workers or os.cpu_count() or 1
+        self.games_per_iteration = games_per_iteration
+        self.buffer_capacity = buffer_capacity
+        self.train_steps = train_steps
+        self.batch_size = batch_size
+        self.learning_rate = learning_rate
+        self.gate_every = gate_every
+        self.gate_games = gate_games
+        self.promote_margin = promote_margin
+        self.hidden_sizes = tuple(hidden_sizes)
+        self.seed = seed
+
+
+# pylint: disable=too-many-instance-attributes
+class SelfPlayTrainer:
+    """Unattended self-play loop: generate games, fit, and gate checkpoints against Greedy.
+
+    Self-play always uses `best.npz`; training updates `candidate.npz`, which replaces
+    the best checkpoint only when it beats GreedyBot by `promote_margin` more often
+    than the best one does on the same deals. Progress is appended to `selfplay.log`
+    as JSON lines, and a restarted trainer resumes from the files in `workdir`.
+    """
+
+    def __init__(self, config: SelfPlayConfig) -> None:
+        self.config = config
+        config.workdir.mkdir(parents=True, exist_ok=True)
+        self.best_path = config.workdir / "best.npz"
+        self.candidate_path = config.workdir / "candidate.npz"
+        if not self.best_path.exists():
+            network = PolicyValueNetwork.initialise(config.hidden_sizes, seed=config.seed)
+            network.save(self.best_path)
+        if not self.candidate_path.exists():
+            shutil.copyfile(self.best_path, self.candidate_path)
+        self.candidate = PolicyValueNetwork.load(self.candidate_path)
+        self.buffer = ReplayBuffer(config.workdir / "replay", config.buffer_capacity)
+        self._state_path = config.workdir / "trainer.json"
+        self.iteration = 0
+        if self._state_path.exists():
+            state = json.loads(self._state_path.read_text(encoding="utf-8"))
+            self.iteration = state["iteration"]
+        self.rng = np.random.default_rng([config.seed, self.iteration])
+
+    def _log(self, **entry: object) -> None:
+        entry["time"] = time.time()
+        with open(self.config.workdir / "selfplay.log", "a", encoding="utf-8") as log:
+            log.write(json.dumps(entry) + "\n")
+
+    def _seed(self, offset: int) -> int:
+        return self.config.seed * 1_000_003 + self.iteration * 1_009 + offset
+
+    def generate(self, pool: ProcessPoolExecutor) -> int:
+        shares = split_evenly(self.config.games_per_iteration, self.config.workers)
+        futures = [
+            pool.submit(play_selfplay_games, str(self.best_path), games, self._seed(i))
+            for i, games in enumerate(shares)
+            if games
+        ]
+        added = 0
+        for future in futures:
+            features, actions, returns = future.result()
+            self.buffer.append(features, actions, returns)
+            added += len(actions)
+        self.buffer.flush()
+        return added
+
+    def fit(self) -> tuple[float, float]:
+        policy_loss = value_loss = 0.0
+        for _ in range(self.config.train_steps):
+            batch = self.buffer.sample(self.config.batch_size, self.rng)
+            policy_loss, value_loss = train_step(
+                self.candidate, *batch, learning_rate=self.config.learning_rate
+            )
+        self.candidate.save(self.candidate_path)
+        return policy_loss, value_loss
+
+    def _score(self, pool: ProcessPoolExecutor, path: Path, seed: int) -> float:
+        shares = split_evenly(self.config.gate_games, self.config.workers)
+        futures = [
+            pool.submit(gating_score, str(path), games, seed + i)
+            for i, games in enumerate(shares)
+            if games
+        ]
+        won = scored = 0
+        for future in futures:
+            w, s = future.result()
+            won += w
+            scored += s
+        return won / scored if scored else 0.0
+
+    def gate(self, pool: ProcessPoolExecutor) -> bool:
+        seed = self._seed(10_000)
+        best = self._score(pool, self.best_path, seed)
+        candidate = self._score(pool, self.candidate_path, seed)
+        promoted = candidate >= best + self.config.promote_margin
+        if promoted:
+            shutil.copyfile(self.candidate_path, self.best_path)
+        self._log(
+            event="gate",
+            iteration=self.iteration,
+            best=best,
+            candidate=candidate,
+            promoted=promoted,
+        )
+        return promoted
+
+    def run(self, iterations: int) -> None:
+        with ProcessPoolExecutor(max_workers=self.config.workers) as pool:
+            for _ in range(iterations):
+                self.iteration += 1
+                added = self.generate(pool)
+                policy_loss, value_loss = self.fit() if len(self.buffer) else (0.0, 0.0)
+                self._log(
+                    event="train",
+                    iteration=self.iteration,
+                    samples=added,
+                    buffer=len(self.buffer),
+                    policy_loss=policy_loss,
+                    value_loss=value_loss,
+                )
+                if self.iteration % self.config.gate_every == 0:
+                    self.gate(pool)
+                self._state_path.write_text(
+                    json.dumps({"iteration": self.iteration}), encoding="utf-8"
+                )
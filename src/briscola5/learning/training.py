@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import numpy as np
+
+from briscola5.learning.network import PolicyValueNetwork
+
+
+# pylint: disable=too-many-locals, too-many-arguments, too-many-positional-arguments
+def train_step(
+    network: PolicyValueNetwork,
+    features: np.ndarray,
+    actions: np.ndarray,
+    returns: np.ndarray,
+    learning_rate: float = 1e-3,
+    value_weight: float = 1.0,
+    max_grad_norm: float = 1.0,
+) -> tuple[float, float]:
+    """One SGD step on a batch, updating `network.params` in place.
+
+    The policy head is trained with a policy gradient using the value head as a
+    baseline, `-(R - V) * log pi(a)`, and the value head with `(V - R) ** 2`.
+    Gradients are clipped to a global L2 norm of `max_grad_norm`.
+    Returns the (policy loss, value loss) measured before the update.
+    """
+    params = network.params
+    size = features.shape[0]
+    rows = np.arange(size)
+
+    activations = [features]
+    x = features
+    for i in range(network.depth):
+        x = np.maximum(x @ params[f"hidden_w{i}"] + params[f"hidden_b{i}"], 0.0)
+        activations.append(x)
+
+    logits = x @ params["policy_w"] + params["policy_b"]
+    logits -= logits.max(axis=1, keepdims=True)
+    probs = np.exp(logits)
+    probs /= probs.sum(axis=1, keepdims=True)
+    values = np.tanh(x @ params["value_w"] + params["value_b"])[:, 0]
+
+    advantage = returns - values
+    policy_loss = float(-(advantage * np.log(probs[rows, actions] + 1e-12)).mean())
+    value_loss = float(((values - returns) ** 2).mean())
+
+    d_logits = probs
+    d_logits[rows, actions] -= 1.0
+    d_logits *= (advantage / size)[:, None]
+    d_values = (value_weight * 2.0 * (values - returns) * (1.0 - values**2) / size)[:, None]
+
+    grads = {
+        "policy_w": x.T @ d_logits,
+        "policy_b": d_logits.sum(axis=0),
+        "value_w": x.T @ d_values,
+        "value_b": d_values.sum(axis=0),
+    }
+    dx = d_logits @ params["policy_w"].T + d_values @ params["value_w"].T
+    for i in reversed(range(network.depth)):
+        dx *= activations[i + 1] > 0
+        grads[f"hidden_w{i}"] = activations[i].T @ dx
+        grads[f"hidden_b{i}"] = dx.sum(axis=0)
+        if i:
+            dx = dx @ params[f"hidden_w{i}"].T
+
+    norm = np.sqrt(sum(float((grad**2).sum()) for grad in grads.values()))
+    scale = learning_rate * min(1.0, max_grad_norm / (norm + 1e-12))
+    for name, grad in grads.items():
+        params[name] -= (scale * grad).astype(np.float32)
+    return policy_loss, value_loss
@@ -0,0 +1,56 @@
+from briscola5.analysis.bid_table import (
+    MIN_BID,
+    NUM_CLASSES,
+    BidTable,
+    estimate_bid_table,
+    hand_class,
+    main,
+    rollout_histograms,
+)
+from briscola5.domain.card import Card, Rank, Suit
+
+
+def _histograms(cls, points_counts):
+    histograms = [[0] * 121 for _ in range(NUM_CLASSES)]
+    for points, count in points_counts.items():
+        histograms[cls][points] = count
+    return histograms
+
+
+def test_hand_class_is_monotonic_in_strength():
+    weak = [Card(Suit.ORO, Rank.DUE), Card(Suit.COPPE, Rank.QUATTRO)]
+    strong = [Card(s, r) for s in (Suit.ORO, Suit.COPPE) for r in (Rank.ASSO, Rank.TRE)]
+    assert 0 <= hand_class(weak) < hand_class(strong) < NUM_CLASSES
+
+
+def test_bid_table_probabilities_and_limits():
+    table = BidTable(_histograms(4, {60: 20, 80: 50, 100: 30}), confidence=0.75, min_samples=10)
+
+    assert table.probability(4, MIN_BID) == 0.8
+    assert table.probability(4, 81) == 0.3
+    assert table.max_bid(4) == 80
+    assert table.max_bid(5) is None
+    assert not table.is_calibrated(5)
+
+
+def test_bid_table_save_load(tmp_path):
+    path = tmp_path / "table.json"
+    BidTable(_histograms(2, {90: 60}), confidence=0.5).save(path)
+
+    loaded = BidTable.load(path)
+    assert loaded.max_bid(2) == 90
+    assert BidTable.load(path, confidence=1.01).max_bid(2) is None
+
+
+def test_rollouts_are_seeded_and_counted():
+    histograms = rollout_histograms(10, seed=3)
+    assert rollout_histograms(10, seed=3) == histograms
+    assert 0 < sum(map(sum, histograms)) <= 10
+
+
+def test_estimate_and_cli(tmp_path, capsys):
+    table = estimate_bid_table(6, workers=2, seed=1)
+    assert sum(table.samples) <= 6
+
+    main([str(tmp_path / "table.json"), "--deals", "4", "--workers", "1"])
+    assert "deals, max bid" in capsys.readouterr().out
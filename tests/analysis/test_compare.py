@@ -0,0 +1,75 @@
+import pytest
+
+from briscola5.analysis import compare
+from briscola5.analysis.compare import (
+    BETTER,
+    INCONCLUSIVE,
+    NOT_BETTER,
+    SPRT,
+    compare_bots,
+    lineup_for,
+    main,
+    play_pairs,
+    seat_under_test,
+)
+from briscola5.domain.rules import PLAYER_COUNT
+
+
+def test_sprt_decides_on_discordant_pairs_only():
+    test = SPRT(delta=0.25, alpha=0.1, beta=0.1)
+    for _ in range(50):
+        assert test.update(True, True) is None
+    decisions = [test.update(True, False) for _ in range(20)]
+
+    assert test.ties == 50
+    assert decisions[-1] == BETTER
+    assert decisions.index(BETTER) < 19
+
+    losing = SPRT(delta=0.25, alpha=0.1, beta=0.1)
+    for _ in range(20):
+        decision = losing.update(False, True)
+    assert decision == NOT_BETTER
+    with pytest.raises(ValueError):
+        SPRT(delta=0.5)
+
+
+def test_pairs_share_deals():
+    assert lineup_for("Random", 2, "Greedy") == ("Greedy", "Greedy", "Random", "Greedy", "Greedy")
+    # Identical bots on identical deals can never disagree.
+    pairs = play_pairs(0, 10, 3, ("Greedy", "Greedy"), "Greedy")
+    assert all(pair is None or pair[0] == pair[1] for pair in pairs)
+
+
+def test_seat_under_test_visits_every_position_relative_to_the_dealer():
+    offsets = [(seat_under_test(deal) - deal) % PLAYER_COUNT for deal in range(25)]
+    assert sorted(offsets) == sorted(list(range(PLAYER_COUNT)) * PLAYER_COUNT)
+    assert any(seat_under_test(deal) != deal % PLAYER_COUNT for deal in range(PLAYER_COUNT))
+
+
+def test_compare_bots_stops_when_every_pair_is_voided(monkeypatch):
+    monkeypatch.setattr(compare, "play_pairs", lambda start, count, *args: [None] * count)
+
+    summary = compare_bots("Greedy", "Random", max_voided_run=30, batch_size=8)
+    assert summary["decision"] == INCONCLUSIVE
+    assert (summary["pairs"], summary["voided_pairs"]) == (0, 30)
+
+
+def test_compare_bots_is_reproducible_and_bounded():
+    serial = compare_bots("Greedy", "Random", max_pairs=40, seed=1, batch_size=10)
+    parallel = compare_bots("Greedy", "Random", max_pairs=40, seed=1, batch_size=10, workers=2)
+
+    assert serial == parallel
+    assert serial["pairs"] <= 40
+    assert serial["decision"] in (BETTER, NOT_BETTER, INCONCLUSIVE)
+    assert serial["a_only_wins"] + serial["b_only_wins"] + serial["ties"] == serial["pairs"]
+
+    same = compare_bots("Greedy", "Greedy", max_pairs=20)
+    assert same["decision"] == INCONCLUSIVE
+    with pytest.raises(ValueError):
+        compare_bots("Greedy", "Nobody")
+
+
+def test_main_prints_decision(capsys):
+    main(["Greedy", "Random", "--max-pairs", "10", "--delta", "0.3"])
+
+    assert "Greedy vs Random:" in capsys.readouterr().out
@@ -0,0 +1,57 @@
+import random
+
+from briscola5.analysis.dead_trick import (
+    HAND_SIZE,
+    DeadTrickPosition,
+    analyze,
+    greedy_option,
+    main,
+    rollout_batch,
+)
+from briscola5.domain.card import DECK_SIZE, card_index, full_deck
+
+
+def _position(seed: int = 1) -> DeadTrickPosition:
+    deck = full_deck()
+    random.Random(seed).shuffle(deck)
+    return DeadTrickPosition([card_index(card) for card in deck], 0, 1, 75)
+
+
+def test_options_and_worlds_respect_what_the_caller_knows() -> None:
+    position = _position()
+    hand = position.deck[HAND_SIZE : 2 * HAND_SIZE]
+    assert position.discards and set(position.discards) <= set(hand)
+    options = position.options()
+    for discard, call in options:
+        dead_trick = position.discards[discard]
+        assert dead_trick[1] == discard
+        assert call not in dead_trick and (call == discard or call not in hand)
+    assert greedy_option(position) in options
+
+    discard = next(iter(position.discards))
+    world = position.world(discard, random.Random(0))
+    assert sorted(world) == list(range(DECK_SIZE))
+    assert tuple(world[HAND_SIZE : 2 * HAND_SIZE]) == hand
+    for seat, card in enumerate(position.discards[discard]):
+        assert card in world[seat * HAND_SIZE : (seat + 1) * HAND_SIZE]
+    points = position.rollout(options[0], world)
+    assert points is None or 0 <= points <= 120
+
+
+def test_rollouts_are_reproducible_and_pruned_options_drop_out(capsys) -> None:
+    position = _position()
+    options = position.options()[:6]
+    batch = rollout_batch(position, options, 0, 3, seed=5)
+    assert batch == rollout_batch(position, options, 0, 3, seed=5)
+    assert all(games <= 3 and squares >= total for games, total, squares in batch)
+
+    results = analyze(position, worlds_per_round=4, rounds=3, workers=1, options=options)
+    assert sorted(s.option for s in results) == sorted(options)
+    alive = [s for s in results if s.pruned_round is None]
+    assert alive and results[: len(alive)] == alive
+    assert all(s.count <= 12 for s in results)
+    assert [s.mean for s in alive] == sorted((s.mean for s in alive), reverse=True)
+
+    main(["--seed", "1", "--worlds", "2", "--rounds", "1", "--workers", "1", "--top", "3"])
+    out = capsys.readouterr().out
+    assert "Caller P1 bid 71" in out and " 3. discard" in out
@@ -0,0 +1,12 @@
+from briscola5.analysis.footprint import IDLE_BUDGET, measure, positions
+
+
+def test_positions_stop_after_the_requested_actions():
+    dealt, later = positions(2, 0), positions(2, 60)
+    assert all(service.state.phase.value == "auction" for service in dealt)
+    assert all(service.state.phase.value != "auction" for service in later)
+
+
+def test_compact_tables_stay_under_budget():
+    sizes = measure(count=50, moves=60)
+    assert sizes["compact"] < IDLE_BUDGET < sizes["service"]
@@ -0,0 +1,103 @@
+import io
+import os
+
+import pytest
+
+from briscola5.analysis.golden import (
+    Outcome,
+    ServiceEngine,
+    differential_test,
+    first_divergence,
+    generate_corpus,
+    load_engine,
+    main,
+    outcome,
+    random_record,
+    read_corpus,
+    shrink,
+    verify_corpus,
+    write_corpus,
+)
+from briscola5.application.game_service import GameService
+from briscola5.application.record import ActionKind, decode_action
+from briscola5.domain.state import Phase
+
+CORPUS = os.path.join(os.path.dirname(__file__), "golden_games.bin")
+
+
+class _LateTrickBonus(GameService):
+    """Scores one extra point for the fifth trick, like a refactor gone wrong."""
+
+    def _finish_normal_trick(self):
+        if self.state.trick.index == 5:
+            self.state.score.player_points[self.state.turn.current_player] += 1
+        super()._finish_normal_trick()
+
+
+def test_golden_corpus_matches_the_engine() -> None:
+    assert not verify_corpus(CORPUS)
+    assert verify_corpus(CORPUS, _LateTrickBonus)
+
+
+def test_records_are_deterministic_and_reach_game_over() -> None:
+    record = random_record(7, noise=0.2)
+    assert random_record(7, noise=0.2) == record
+    assert len(record.actions) > len(random_record(7).actions)
+    expected = outcome(ServiceEngine(), record)
+    assert outcome(ServiceEngine(), record) == expected
+    assert sum(expected.points) == 120
+    assert Outcome.unpack(expected.pack()) == expected
+
+
+def test_noise_includes_auction_actions_out_of_phase() -> None:
+    engine = ServiceEngine()
+    record = random_record(7, noise=0.2)
+    engine.setup(record.dealer, record.deck)
+    late = 0
+    for action in record.actions:
+        if engine.service.state.phase is not Phase.AUCTION:
+            late += decode_action(action)[0] in (ActionKind.BID, ActionKind.PASS)
+        engine.apply(action)
+    assert late
+
+
+def test_corpus_round_trip(tmp_path) -> None:
+    path = tmp_path / "corpus.bin"
+    generate_corpus(path, 5, seed=3)
+    with open(path, "rb") as file:
+        games = list(read_corpus(file))
+    assert len(games) == 5
+    buffer = io.BytesIO()
+    write_corpus(buffer, games)
+    assert buffer.getvalue() == path.read_bytes()
+    with pytest.raises(ValueError):
+        list(read_corpus(io.BytesIO(b"XXXX" + bytes(4))))
+
+
+def test_divergence_is_found_and_shrunk() -> None:
+    assert load_engine("briscola5.application.game_service:GameService")().snapshot()
+    played, clean = differential_test(GameService, 20, batch_size=8)
+    assert (played, clean) == (20, None)
+
+    played, record = differential_test(_LateTrickBonus, 20, batch_size=8)
+    assert record is not None and played >= 1
+    buggy = load_engine(_LateTrickBonus)
+    index = first_divergence(buggy, record)
+    assert index == len(record.actions)
+    # The fifth trick must be completed: everything before its last card is needed.
+    engine = ServiceEngine()
+    engine.setup(record.dealer, record.deck)
+    for action in record.actions[:-1]:
+        assert engine.apply(action)
+    assert engine.service.state.phase is Phase.TRICK_PLAY
+    assert len(shrink(buggy, record).actions) == len(record.actions)
+
+
+def test_cli(tmp_path, capsys) -> None:
+    path = str(tmp_path / "corpus.bin")
+    main(["generate", path, "--games", "3"])
+    main(["verify", path])
+    main(["diff", "tests.analysis.test_golden:_LateTrickBonus", "--games", "5", "--workers", "2"])
+    out = capsys.readouterr().out
+    assert "3 golden games" in out and "0 games differ" in out
+    assert "minimal reproduction" in out
@@ -0,0 +1,65 @@
+import math
+
+import numpy as np
+import pytest
+
+from briscola5.analysis.hand_strength import (
+    NUM_BID_BUCKETS,
+    estimate_hand_strengths,
+    evaluate_trump_suits,
+    hands_to_masks,
+    main,
+    max_bids,
+    play_strengths,
+    random_deals,
+    summarize_deals,
+)
+from briscola5.bots.greedy_bot import estimate_hand_strength, evaluate_trump_suit, max_bid
+from briscola5.domain.card import DECK_SIZE, Suit, card_from_index, cards_to_mask
+
+
+def test_vectorized_evaluation_matches_the_scalar_functions():
+    deals = random_deals(300, np.random.default_rng(3))
+    assert deals.shape == (300, 5, 8)
+    assert all(sorted(deal.ravel()) == list(range(DECK_SIZE)) for deal in deals)
+
+    hands = deals.reshape(-1, 8)
+    masks = hands_to_masks(hands)
+    strengths = estimate_hand_strengths(hands)
+    trumps = evaluate_trump_suits(masks)
+    bids = max_bids(strengths)
+    assert np.array_equal(estimate_hand_strengths(masks), strengths)
+    assert np.array_equal(estimate_hand_strengths(masks.astype(np.int64)), strengths)
+    assert np.array_equal(evaluate_trump_suits(masks.astype(np.int64)), trumps)
+    for i, indices in enumerate(hands):
+        hand = [card_from_index(int(index)) for index in indices]
+        assert int(masks[i]) == cards_to_mask(hand)
+        assert strengths[i] == estimate_hand_strength(hand)
+        assert list(trumps[i]) == [evaluate_trump_suit(hand, suit) for suit in Suit]
+        assert bids[i] == max_bid(strengths[i])
+
+
+def test_summaries_and_correlations(capsys):
+    summary = summarize_deals(1000, seed=1, chunk=300)
+    assert summary.total == 5000 and summary.counts.shape[0] == NUM_BID_BUCKETS
+    assert np.isclose(summary.bucket_shares().sum(), 1.0)
+    assert 30 < summary.mean() < 65 and summary.std() > 0
+    assert summary.total == summarize_deals(1000, seed=1, chunk=1000).total
+
+    played = play_strengths(30, seed=2)
+    assert played.strengths.shape == (len(played.callers), 5)
+    assert (played.points.sum(axis=1) == 120).all()
+    assert -1 <= played.seat_correlation() <= 1 and -1 <= played.caller_correlation() <= 1
+    assert played.by_target().total == len(played.callers)
+
+    main(["--deals", "100", "--chunk", "40", "--games", "10"])
+    assert "500 hands" in capsys.readouterr().out
+
+
+def test_empty_summary_is_nan():
+    summary = summarize_deals(0)
+    assert summary.total == 0
+    assert math.isnan(summary.mean()) and math.isnan(summary.std())
+    assert np.isnan(summary.bucket_shares()).all()
+    with pytest.raises(SystemExit):
+        main(["--deals", "0"])
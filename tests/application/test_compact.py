@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from briscola5.application.compact import CompactTable, TableStore
+from briscola5.application.record import GameRecord, replay, silenced
+from briscola5.bots.greedy_bot import GreedyBot
+from briscola5.bots.simulator import deal_seeded, play_game
+from briscola5.domain.rules import RuleSet
+from briscola5.domain.snapshot import Snapshot
+
+
+def _record(seed: int) -> GameRecord:
+    while True:
+        service = deal_seeded(seed % 5, random.Random(seed))
+        record = GameRecord.from_service(service)
+        with silenced():
+            try:
+                play_game(service, {seat: GreedyBot(seat) for seat in range(5)}, record)
+                return record
+            except RuntimeError:
+                seed += 1
+
+
+def test_every_position_round_trips():
+    for position, _ in replay(_record(3)):
+        table = CompactTable.from_service(position)
+        restored = table.service()
+        assert restored.deck == position.deck
+        assert restored.state.hands == position.state.hands
+        assert Snapshot.from_state(restored.state) == Snapshot.from_state(position.state)
+        assert CompactTable.from_service(restored) == table
+        assert 107 <= len(table) <= 152
+
+
+def _trick(service):
+    return [(pc.player_id, pc.card) for pc in service.state.trick.played]
+
+
+def test_trick_entries_of_every_seat_fit():
+    seen = set()
+    for position, _ in replay(_record(7)):
+        assert _trick(CompactTable.from_service(position).service()) == _trick(position)
+        seen.update(player for player, _ in _trick(position))
+    assert seen == set(range(5))
+
+
+def test_rules_travel_with_the_table():
+    rules = RuleSet(min_bid=61)
+    with silenced():
+        service = deal_seeded(0, random.Random(0))
+    service.state.rules = rules
+    table = CompactTable.from_service(service)
+    assert table.service().rules is rules
+    assert table != CompactTable(table.record)
+    assert hash(table) == hash(CompactTable(table.record))
+
+
+def test_store_repacks_only_after_success():
+    store = TableStore()
+    with silenced():
+        store.add("t1", deal_seeded(1, random.Random(1)))
+    assert "t1" in store and len(store) == 1
+    before = store.get("t1")
+
+    with pytest.raises(RuntimeError), store.open("t1") as service:
+        service.state.auction.last_bid = 90
+        raise RuntimeError("move failed")
+    assert store.get("t1") == before
+
+    with silenced(), store.open("t1") as service:
+        service.auction_phase(service.state.turn.current_player, 80)
+    assert store.get("t1").service().state.auction.last_bid == 80
+
+    store.remove("t1")
+    assert "t1" not in store
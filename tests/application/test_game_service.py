@@ -3,7 +3,8 @@ from __future__ import annotations
 from unittest.mock import patch
 
 from briscola5.application.game_service import GameService
-from briscola5.domain.card import Card, Rank, Suit
+from briscola5.domain.card import Card, Rank, Suit, full_deck
+from briscola5.domain.rules import RuleSet
 from briscola5.domain.state import Phase
 
 
@@ -79,6 +80,50 @@ class TestGameService:
         assert service.state.phase == Phase.AUCTION
         assert len(service.state.hands[0]) == 8
 
+    def test_auction_restart_accepts_new_bids(self):
+        service = GameService()
+        service.setup_game(dealer_id=0)
+
+        for p_id in [1, 2, 3, 4, 0]:
+            service.auction_phase(p_id, None)
+        service.auction_phase(1, 80)
+
+        assert service.state.auction.last_bidder == 1
+        assert service.state.turn.current_player == 2
+
+    def test_setup_game_deals_supplied_deck(self):
+        service = GameService()
+        deck = list(reversed(full_deck()))
+
+        service.setup_game(dealer_id=2, deck=deck)
+
+        assert service.state.hands[0] == deck[:8]
+        assert service.state.hands[4] == deck[32:]
+        assert service.state.turn.current_player == 3
+
+    def test_bids_follow_the_rule_set(self):
+        service = GameService(RuleSet(min_bid=61, max_bid=90))
+        service.setup_game(dealer_id=0, deck=full_deck())
+
+        service.auction_phase(player_id=1, offer=91)
+        assert service.state.auction.last_bid is None
+        service.auction_phase(player_id=1, offer=61)
+        assert service.state.auction.last_bid == 61
+        assert service.state.rules.max_bid == 90
+
+    def test_called_card_may_be_a_discard_when_allowed(self):
+        service = GameService(RuleSet(call_discarded_card=True))
+        service.setup_game(dealer_id=4, deck=full_deck())
+        service.auction_phase(0, 80)
+        for player in range(1, 5):
+            service.auction_phase(player, None)
+        for player in range(5):
+            service.play_card(player, len(service.state.hands[player]) - 1)
+        discarded = service.state.trick.played[1].card
+
+        assert service.make_call(discarded.suit, discarded.rank)
+        assert service.state.call.partner_player_internal == 1
+
     def test_error_branches_coverage(self, capsys):
         service = GameService()
         service.setup_game(dealer_id=0)
@@ -0,0 +1,147 @@
+import random
+
+import pytest
+
+from briscola5.application.compact import CompactTable
+from briscola5.application.game_service import GameService
+from briscola5.application.persistence import DurableTables, iter_entries, read_frames
+from briscola5.application.record import ActionKind, GameRecord, encode_action, silenced
+from briscola5.bots.greedy_bot import GreedyBot
+from briscola5.bots.simulator import deal_seeded, play_game
+from briscola5.domain.card import card_from_index
+from briscola5.domain.rules import RuleSet
+
+
+def _records(count: int) -> list[GameRecord]:
+    records, seed = [], 0
+    while len(records) < count:
+        service = deal_seeded(seed % 5, random.Random(seed))
+        record = GameRecord.from_service(service)
+        seed += 1
+        with silenced():
+            try:
+                play_game(service, {seat: GreedyBot(seat) for seat in range(5)}, record)
+            except RuntimeError:
+                continue
+        records.append(record)
+    return records
+
+
+def _dealt(record: GameRecord, rules: RuleSet | None = None) -> GameService:
+    service = GameService() if rules is None else GameService(rules)
+    with silenced():
+        service.setup_game(record.dealer, deck=[card_from_index(i) for i in record.deck])
+    return service
+
+
+def _tables(db: DurableTables) -> dict:
+    return {table_id: table.record for table_id, table in db.store.items()}
+
+
+@pytest.fixture(name="records", scope="module")
+def fixture_records():
+    return _records(6)
+
+
+def test_committed_actions_survive_a_restart(tmp_path, records):
+    db = DurableTables(tmp_path, sync=False)
+    for table_id, record in enumerate(records):
+        db.create(table_id, _dealt(record))
+    for step in range(40):
+        for table_id, record in enumerate(records):
+            assert db.apply(table_id, record.actions[step])
+    db.commit()
+    expected = _tables(db)
+    db.close()
+
+    restored = DurableTables(tmp_path, sync=False)
+    assert _tables(restored) == expected
+    assert restored.recovery_stats["entries"] == len(records) * 41
+    restored.close()
+
+
+def test_torn_group_commit_is_dropped(tmp_path, records):
+    db = DurableTables(tmp_path, sync=False)
+    db.create(7, _dealt(records[0]))
+    db.apply(7, records[0].actions[0])
+    db.commit()
+    expected = _tables(db)
+    db.apply(7, records[0].actions[1])
+    db.commit()
+    db.close()
+
+    log = tmp_path / "wal-00000001.log"
+    log.write_bytes(log.read_bytes()[:-3])
+    frames = list(read_frames(log))
+    assert [[kind for kind, _, _ in iter_entries(frame)] for frame in frames] == [[1, 0]]
+
+    restored = DurableTables(tmp_path, sync=False)
+    assert _tables(restored) == expected
+    restored.apply(7, records[0].actions[1])
+    restored.close()
+    assert DurableTables(tmp_path, sync=False).store.get(7).service().state.auction.last_bid
+
+
+def test_rejected_bid_is_not_logged(tmp_path, records):
+    db = DurableTables(tmp_path, sync=False)
+    db.create(2, _dealt(records[0]))
+    first = (records[0].dealer + 1) % 5
+    assert not db.apply(2, encode_action(ActionKind.BID, (first + 1) % 5, 80))
+    assert not db.apply(2, encode_action(ActionKind.BID, first, 50))
+    assert db.log.pending == 1
+    db.close()
+
+    restored = DurableTables(tmp_path, sync=False)
+    assert restored.recovery_stats["entries"] == 1
+    assert restored.store.get(2).service().state.auction.last_bid is None
+    restored.close()
+
+
+def test_checkpoint_bounds_the_replayed_log(tmp_path, records):
+    db = DurableTables(tmp_path, group_size=4, snapshot_every=50, sync=False)
+    rules = RuleSet(min_bid=61, dead_trick_cap=None)
+    for table_id, record in enumerate(records):
+        db.create(table_id, _dealt(record, rules if table_id == 0 else None))
+    for step in range(30):
+        for table_id, record in enumerate(records):
+            db.apply(table_id, record.actions[step])
+        db.commit()
+    db.close_table(5)
+    expected = _tables(db)
+    db.close()
+
+    assert len(list(tmp_path.glob("snapshot-*.bin"))) == 1
+    restored = DurableTables(tmp_path, sync=False)
+    assert _tables(restored) == expected
+    assert restored.recovery_stats["entries"] < 50
+    assert restored.store.get(0).rules.min_bid == 61
+    assert restored.store.get(0).rules.dead_trick_cap is None
+    restored.close()
+
+
+def test_redeal_after_all_pass_is_logged(tmp_path, records):
+    saved = random.getstate()
+    random.seed(41)
+    try:
+        db = DurableTables(tmp_path, sync=False)
+        db.create(1, _dealt(records[0]))
+        deck_before = db.store.get(1).service().deck
+        first = (records[0].dealer + 1) % 5
+        for offset in range(5):
+            db.apply(1, encode_action(ActionKind.PASS, (first + offset) % 5))
+        assert db.store.get(1).service().deck != deck_before
+        expected = _tables(db)
+        db.close()
+    finally:
+        random.setstate(saved)
+
+    restored = DurableTables(tmp_path, sync=False)
+    assert _tables(restored) == expected
+    assert isinstance(restored.store.get(1), CompactTable)
+    restored.close()
+
+
+def test_corrupt_snapshot_is_refused(tmp_path):
+    (tmp_path / "snapshot-00000003.bin").write_bytes(b"B5SN\0\0\0\0garbage")
+    with pytest.raises(ValueError, match="Corrupt"):
+        DurableTables(tmp_path)
@@ -0,0 +1,67 @@
+from briscola5.application.game_service import GameService
+from briscola5.application.record import (
+    ActionKind,
+    apply_action,
+    encode_action,
+    replay,
+    silenced,
+)
+from briscola5.bots.simulator import simulate_records
+from briscola5.domain.card import card_index, full_deck
+from briscola5.domain.snapshot import Snapshot
+from briscola5.domain.state import Phase
+
+
+def _service() -> GameService:
+    service = GameService()
+    with silenced():
+        service.setup_game(0, deck=full_deck())
+        service.auction_phase(1, 80)
+    return service
+
+
+def test_rejected_auction_actions_return_false() -> None:
+    service = _service()
+    before = (service.state.auction.last_bid, service.state.turn.current_player)
+    with silenced():
+        assert not apply_action(service, encode_action(ActionKind.BID, 4, 90))
+        assert not apply_action(service, encode_action(ActionKind.BID, 2, 75))
+        assert not apply_action(service, encode_action(ActionKind.PASS, 3))
+    assert (service.state.auction.last_bid, service.state.turn.current_player) == before
+    assert not any(service.state.auction.passed)
+
+
+def test_accepted_auction_actions_return_true() -> None:
+    service = _service()
+    with silenced():
+        assert apply_action(service, encode_action(ActionKind.BID, 2, 85))
+        assert apply_action(service, encode_action(ActionKind.PASS, 3))
+    assert service.state.auction.last_bidder == 2
+    assert service.state.auction.passed[3]
+
+
+def test_out_of_phase_actions_are_rejected() -> None:
+    record = next(simulate_records(1))
+    checked = set()
+    for service, _ in replay(record):
+        state = service.state
+        phase = state.phase
+        if phase in checked or phase not in (Phase.DEAD_TRICK_PLAY, Phase.TRICK_PLAY):
+            continue
+        checked.add(phase)
+        seat = state.turn.current_player
+        card = card_index(state.hands[seat][0])
+        wrong_kind = ActionKind.PLAY if phase is Phase.DEAD_TRICK_PLAY else ActionKind.DISCARD
+        before = Snapshot.from_state(state)
+        with silenced():
+            assert not apply_action(service, encode_action(ActionKind.BID, seat, 119))
+            assert not apply_action(service, encode_action(ActionKind.PASS, seat))
+            assert not apply_action(
+                service, encode_action(ActionKind.PASS, state.call.caller_player)
+            )
+            assert not apply_action(service, encode_action(wrong_kind, seat, card))
+            assert not apply_action(service, encode_action(ActionKind.CALL, seat, card))
+            assert not apply_action(service, encode_action(ActionKind.PLAY, 7, card))
+            assert not apply_action(service, encode_action(ActionKind.PLAY, seat, 63))
+        assert Snapshot.from_state(state) == before
+    assert len(checked) == 2
@@ -0,0 +1,122 @@
+import random
+
+from briscola5.application.game_service import GameService
+from briscola5.application.record import ActionKind, GameRecord, encode_action, silenced
+from briscola5.application.spectator import EventKind, TableFeed, decode_events
+from briscola5.bots.greedy_bot import GreedyBot
+from briscola5.bots.simulator import deal_seeded, play_game
+from briscola5.domain.card import card_from_index, card_index
+
+
+def _record() -> GameRecord:
+    seed = 0
+    while True:
+        service = deal_seeded(seed % 5, random.Random(seed))
+        record = GameRecord.from_service(service)
+        with silenced():
+            try:
+                play_game(service, {seat: GreedyBot(seat) for seat in range(5)}, record)
+                return record
+            except RuntimeError:
+                seed += 1
+
+
+def _feed(record: GameRecord) -> TableFeed:
+    service = GameService()
+    with silenced():
+        service.setup_game(record.dealer, deck=[card_from_index(i) for i in record.deck])
+    return TableFeed(service)
+
+
+def _events(subscription) -> list:
+    return [event for message in subscription.poll() for event in decode_events(message)]
+
+
+def test_seats_only_see_their_own_hand():
+    record = _record()
+    feed = _feed(record)
+    public, seat = feed.subscribe(), feed.subscribe(3)
+    hand = [card_index(card) for card in feed.service.state.hands[3]]
+    with silenced():
+        for action in record.actions:
+            assert feed.apply(action)
+            feed.flush()
+
+    events = _events(public)
+    assert events[0] == (EventKind.DEAL, record.dealer, 0)
+    assert all(kind is not EventKind.HAND for kind, _, _ in events)
+    assert sum(kind is EventKind.PLAY for kind, _, _ in events) == 40
+    tricks = [value for kind, _, value in events if kind is EventKind.TRICK]
+    assert len(tricks) == 8 and sum(tricks) == 120
+    assert events[-1][0] is EventKind.OVER
+
+    own = [(s, value) for kind, s, value in _events(seat) if kind is EventKind.HAND]
+    assert own == [(3, value) for value in hand]
+
+
+def test_spectators_share_one_message_per_flush():
+    record = _record()
+    feed = _feed(record)
+    spectators = [feed.subscribe() for _ in range(200)]
+    player = feed.subscribe(2)
+    feed.flush()
+    with silenced():
+        for action in record.actions[:10]:
+            feed.apply(action)
+    feed.flush()
+    messages = [spectator.poll()[-1] for spectator in spectators] + [player.poll()[-1]]
+    assert all(message is messages[0] for message in messages)
+    assert len(decode_events(messages[0])) == 10
+    assert feed.views == (-1, 2)
+
+
+def test_late_subscriber_gets_the_filtered_history():
+    record = _record()
+    feed = _feed(record)
+    with silenced():
+        for action in record.actions[:20]:
+            feed.apply(action)
+    feed.flush()
+    history = _events(feed.subscribe(1))
+    assert [kind for kind, _, _ in history].count(EventKind.HAND) == 8
+    assert {seat for kind, seat, _ in history if kind is EventKind.HAND} == {1}
+    assert len(history) == 1 + 8 + 20
+
+
+def test_rejected_bids_and_passes_emit_nothing():
+    feed = _feed(_record())
+    public = feed.subscribe()
+    first = feed.service.state.turn.current_player
+    with silenced():
+        assert feed.apply(encode_action(ActionKind.BID, first, 80))
+        assert not feed.apply(encode_action(ActionKind.BID, first, 90))
+        assert not feed.apply(encode_action(ActionKind.BID, (first + 1) % 5, 50))
+        assert not feed.apply(encode_action(ActionKind.PASS, (first + 2) % 5))
+    feed.flush()
+    assert [(kind, seat, value) for kind, seat, value in _events(public)][1:] == [
+        (EventKind.BID, first, 80)
+    ]
+
+
+def test_rejected_actions_emit_nothing_and_redeals_are_streamed():
+    record = _record()
+    feed = _feed(record)
+    seat = feed.subscribe(0)
+    first = (record.dealer + 1) % 5
+    foreign = card_index(feed.service.state.hands[1][0])
+    with silenced():
+        assert not feed.apply(encode_action(ActionKind.PLAY, 0, foreign))
+    feed.flush()
+    assert len(_events(seat)) == 1 + 8
+
+    saved = random.getstate()
+    random.seed(5)
+    try:
+        with silenced():
+            for offset in range(5):
+                assert feed.apply(encode_action(ActionKind.PASS, (first + offset) % 5))
+    finally:
+        random.setstate(saved)
+    feed.flush()
+    kinds = [kind for kind, _, _ in _events(seat)]
+    assert kinds == [EventKind.PASS] * 5 + [EventKind.DEAL] + [EventKind.HAND] * 8
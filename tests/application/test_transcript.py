@@ -0,0 +1,75 @@
+import contextlib
+import io
+import random
+
+from briscola5.application.record import GameRecord, read_records, replay
+from briscola5.application.transcript import (
+    TranscriptParser,
+    convert,
+    game_boundaries,
+    main,
+    parse_transcript,
+)
+from briscola5.bots.greedy_bot import GreedyBot
+from briscola5.bots.simulator import deal_seeded, play_game
+
+
+def _transcript(games: int) -> tuple[str, list[GameRecord]]:
+    """Colored console output of seeded games, as `play_game` prints it."""
+    out = io.StringIO()
+    records = []
+    seed = 0
+    with contextlib.redirect_stdout(out):
+        print("Bot VS Bot (noise before the first game)")
+        while len(records) < games:
+            service = deal_seeded(seed % 5, random.Random(seed))
+            print("\x1b[1m--- Start Game ---\x1b[0m")  # deal_seeded sets up silently
+            print(f"\x1b[1mGame Setup Complete. Dealer: {seed % 5}\x1b[0m")
+            record = GameRecord.from_service(service)
+            seed += 1
+            try:
+                play_game(service, {s: GreedyBot(s) for s in range(5)}, record)
+            except RuntimeError:
+                continue
+            if service.state.phase.value == "game_over":
+                service.end_game()
+                records.append(record)
+    return out.getvalue(), records
+
+
+def _unfinished(text: str) -> int:
+    return text.count("--- Start Game ---") - text.count("FINAL RESULTS")
+
+
+def test_parsed_games_replay_the_recorded_actions() -> None:
+    text, records = _transcript(6)
+    parser = TranscriptParser()
+    parsed = list(parse_transcript(io.StringIO(text), parser))
+    assert parser.games == len(parsed) == len(records)
+    assert parser.incomplete == _unfinished(text)
+    for original, copy in zip(records, parsed):
+        assert copy.dealer == original.dealer and copy.actions == original.actions
+        assert sorted(copy.deck) == sorted(original.deck)
+        for start in range(0, 40, 8):
+            assert set(copy.deck[start : start + 8]) == set(original.deck[start : start + 8])
+        positions = list(replay(copy))  # raises if any action is rejected
+        assert len(positions) == len(original.actions)
+
+
+def test_parallel_conversion_matches_a_single_worker(tmp_path, capsys) -> None:
+    text, records = _transcript(8)
+    path = tmp_path / "run.log"
+    path.write_text(text, encoding="utf-8")
+    offsets = game_boundaries(path, 3)
+    assert offsets[0] == 0 and offsets[-1] == len(text.encode()) and len(offsets) == 4
+    for offset in offsets[1:-1]:
+        assert b"--- Start Game ---" in path.read_bytes()[offset:].split(b"\n", 1)[0]
+
+    assert convert(path, tmp_path / "one.bin") == convert(path, tmp_path / "three.bin", 3)
+    assert (tmp_path / "one.bin").read_bytes() == (tmp_path / "three.bin").read_bytes()
+    with open(tmp_path / "three.bin", "rb") as file:
+        assert [r.actions for r in read_records(file)] == [r.actions for r in records]
+    assert not list(tmp_path.glob("*.part*"))
+
+    main([str(path), str(tmp_path / "cli.bin"), "--workers", "2"])
+    assert "8 games written" in capsys.readouterr().out
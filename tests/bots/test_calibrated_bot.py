@@ -0,0 +1,40 @@
+from briscola5.analysis.bid_table import NUM_CLASSES, BidTable, hand_class
+from briscola5.bots.calibrated_bot import CalibratedBidBot
+from briscola5.bots.greedy_bot import GreedyBot
+from briscola5.domain.card import Card, Rank, Suit
+from briscola5.domain.state import GameState
+
+
+def _state():
+    state = GameState()
+    state.hands[2] = [
+        Card(Suit.ORO, Rank.ASSO),
+        Card(Suit.ORO, Rank.TRE),
+        Card(Suit.COPPE, Rank.RE),
+        Card(Suit.SPADE, Rank.TRE),
+    ]
+    return state
+
+
+def _table(cls, points, count):
+    histograms = [[0] * 121 for _ in range(NUM_CLASSES)]
+    histograms[cls][points] = count
+    return BidTable(histograms, min_samples=10)
+
+
+def test_bids_up_to_calibrated_limit():
+    state = _state()
+    bot = CalibratedBidBot(2, _table(hand_class(state.hands[2]), 85, 100))
+
+    assert bot.make_bid(state) == 71
+    state.auction.last_bid = 84
+    assert bot.make_bid(state) == 85
+    state.auction.last_bid = 85
+    assert bot.make_bid(state) is None
+
+
+def test_uncalibrated_class_falls_back_to_greedy():
+    state = _state()
+    bot = CalibratedBidBot(2, _table(hand_class(state.hands[2]), 85, 3))
+
+    assert bot.make_bid(state) == GreedyBot(2).make_bid(state)
@@ -0,0 +1,128 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from briscola5.bots import eval_cache
+from briscola5.bots.eval_cache import (
+    DepthPreferredEvalCache,
+    EvalCache,
+    LruEvalCache,
+    SharedEvalCache,
+    configure_process_cache,
+    make_eval_cache,
+    process_cache,
+)
+
+
+def test_incomplete_cache_cannot_be_created() -> None:
+    class NoStorage(EvalCache):
+        def put(self, key: int, value: float, depth: int = 0) -> None:
+            pass
+
+    with pytest.raises(TypeError):
+        NoStorage(4)  # type: ignore[abstract]
+
+
+def test_lru_evicts_least_recently_used() -> None:
+    cache = LruEvalCache(2)
+    cache.put(1, 0.5)
+    cache.put(2, -0.5)
+    assert cache.get(1) == 0.5
+    cache.put(3, 1.0)
+
+    assert cache.get(2) is None
+    assert cache.get(1) == 0.5
+    assert cache.get(3) == 1.0
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.hit_rate == pytest.approx(3 / 4)
+
+
+def test_lru_keeps_deeper_result_and_filters_by_depth() -> None:
+    cache = LruEvalCache(4)
+    cache.put(7, 1.0, depth=3)
+    cache.put(7, 2.0, depth=1)
+
+    assert cache.get(7) == 1.0
+    assert cache.get(7, min_depth=4) is None
+
+
+def test_depth_preferred_replacement() -> None:
+    cache = DepthPreferredEvalCache(4)
+    cache.put(1, 1.0, depth=5)
+    cache.put(5, 2.0, depth=2)  # same slot, shallower: dropped
+    assert cache.get(1) == 1.0
+    assert cache.get(5) is None
+
+    cache.put(5, 3.0, depth=6)
+    assert cache.get(5) == 3.0
+    assert cache.get(1) is None
+    assert cache.evictions == 1
+    assert len(cache) == 1
+
+    cache.clear()
+    assert len(cache) == 0 and cache.hits == 0
+
+
+def test_stats_report_memory_and_policy() -> None:
+    cache = make_eval_cache(8, "depth")
+    cache.put(3, 0.25)
+    stats = cache.stats()
+
+    assert stats["policy"] == "depth"
+    assert stats["entries"] == 1
+    assert stats["memory_bytes"] > 0
+    assert make_eval_cache(8).memory_bytes() > 0
+    with pytest.raises(ValueError):
+        make_eval_cache(8, "fifo")
+    with pytest.raises(ValueError):
+        LruEvalCache(0)
+
+
+def test_process_cache_is_a_singleton(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(eval_cache, "_PROCESS_CACHE", None)
+    assert process_cache() is process_cache()
+
+    configured = configure_process_cache(16, "depth")
+    assert process_cache() is configured
+    assert configured.policy == "depth"
+
+
+def test_shared_cache_round_trip_and_checks() -> None:
+    cache = SharedEvalCache.create(16)
+    try:
+        big_key = (1 << 64) - 3
+        cache.put(big_key, -0.75, depth=4)
+        assert cache.get(big_key) == -0.75
+        assert cache.get(big_key, min_depth=5) is None
+        assert cache.get(big_key + 16 - (1 << 64)) is None  # same slot, other key
+
+        cache.put(13, 0.5, depth=0)  # same slot, shallower: dropped
+        assert cache.get(big_key) == -0.75
+        assert len(cache) == 1
+        assert cache.memory_bytes() >= 16 * 17
+
+        with pytest.raises(ValueError):
+            cache.put(1, 0.0, depth=300)
+        cache.clear()
+        assert len(cache) == 0
+    finally:
+        cache.unlink()
+
+
+def _worker_put(key: int) -> float | None:
+    cache = process_cache()
+    cache.put(key, key / 10, depth=1)
+    return cache.get(key)
+
+
+def test_shared_cache_is_visible_across_processes() -> None:
+    cache = SharedEvalCache.create(64)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=2, initializer=configure_process_cache, initargs=(0, "", cache.name)
+        ) as pool:
+            assert list(pool.map(_worker_put, range(1, 9))) == [k / 10 for k in range(1, 9)]
+        assert [cache.get(k) for k in range(1, 9)] == [k / 10 for k in range(1, 9)]
+    finally:
+        cache.unlink()
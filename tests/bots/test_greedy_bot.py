@@ -1,4 +1,4 @@
-from briscola5.bots.greedy_bot import GreedyBot
+from briscola5.bots.greedy_bot import GreedyBot, choose_bid, max_bid
 from briscola5.domain.card import Card, Rank, Suit
 from briscola5.domain.state import GameState, PlayedCard
 
@@ -42,6 +42,18 @@ def test_make_bid_over_120_returns_none():
     assert bid is None
 
 
+def test_bid_helpers_follow_the_given_limits():
+    hand = [Card(Suit.ORO, rank) for rank in (Rank.ASSO, Rank.TRE, Rank.RE, Rank.CAVALLO)]
+    hand += [Card(Suit.COPPE, Rank.ASSO), Card(Suit.SPADE, Rank.ASSO)]
+
+    assert max_bid(0.0) == 71 and max_bid(100.0) == 120
+    assert max_bid(0.0, 61, 90) == 61 and max_bid(100.0, 61, 90) == 90
+    assert choose_bid(hand, 0, 1.0) == 71
+    assert choose_bid(hand, 0, 1.0, lowest=61, highest=90) == 61
+    assert choose_bid(hand, 89, 1.2, lowest=61, highest=90) == 90
+    assert choose_bid(hand, 90, 1.2, lowest=61, highest=90) is None
+
+
 def test_choose_discard_naked_high_card():
     bot = GreedyBot(player_id=2)
     state = GameState()
@@ -0,0 +1,37 @@
+import random
+
+import pytest
+
+from briscola5.application.game_service import GameService
+from briscola5.bots.network_bot import NetworkBot
+from briscola5.bots.simulator import play_game
+from briscola5.domain.card import full_deck
+from briscola5.domain.state import GameState, Phase
+from briscola5.learning.network import NetworkPolicy, PolicyValueNetwork
+
+
+def test_network_bots_play_a_full_game(tmp_path):
+    path = tmp_path / "weights.npz"
+    PolicyValueNetwork.initialise(hidden_sizes=(32,), seed=0).save(path)
+    bots = {0: NetworkBot.from_weights(0, path)}
+    shared = NetworkPolicy(PolicyValueNetwork.load(path), sample=True, seed=3)
+    bots.update({i: NetworkBot(i, shared) for i in range(1, 5)})
+
+    deck = full_deck()
+    random.Random(0).shuffle(deck)
+    service = GameService()
+    service.setup_game(dealer_id=0, deck=deck)
+    play_game(service, bots)
+
+    assert service.state.phase == Phase.GAME_OVER
+    assert sum(service.state.score.player_points) == 120
+
+
+def test_call_without_legal_card_raises():
+    bot = NetworkBot(0, NetworkPolicy(PolicyValueNetwork.initialise(hidden_sizes=(8,), seed=0)))
+    state = GameState()
+    state.phase = Phase.DEAD_TRICK_CALL
+    state.hands[0] = full_deck()
+
+    with pytest.raises(RuntimeError):
+        bot.declare_trump_and_card(state)
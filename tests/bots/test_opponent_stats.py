@@ -0,0 +1,77 @@
+import random
+
+import numpy as np
+import pytest
+
+from briscola5.application.record import ActionKind, GameRecord, decode_action, silenced
+from briscola5.bots.greedy_bot import GreedyBot
+from briscola5.bots.opponent_stats import LAYOUT, OpponentStats, jump_bin
+from briscola5.bots.simulator import deal_seeded, play_game
+
+NAMES = ["ann", "bob", "cid", "dee", "eve"]
+
+
+def _record() -> GameRecord:
+    seed = 0
+    while True:
+        service = deal_seeded(seed % 5, random.Random(seed))
+        record = GameRecord.from_service(service)
+        with silenced():
+            try:
+                play_game(service, {s: GreedyBot(s) for s in range(5)}, record)
+                return record
+            except RuntimeError:
+                seed += 1
+
+
+def test_game_actions_land_in_the_right_histograms() -> None:
+    record = _record()
+    stats = OpponentStats()
+    stats.record_game(record, NAMES)
+
+    actions = [decode_action(action) for action in record.actions]
+    for seat, name in enumerate(NAMES):
+        mine = [kind for kind, player, _ in actions if player == seat]
+        assert stats.games(name) == 1
+        assert stats.histogram(name, "auction_turns")[0] == sum(
+            kind in (ActionKind.BID, ActionKind.PASS) for kind in mine
+        )
+        assert stats.histogram(name, "bid_levels").sum() == mine.count(ActionKind.BID)
+        assert stats.histogram(name, "bid_jumps").sum() == mine.count(ActionKind.BID)
+        assert stats.histogram(name, "discard_ranks").sum() == mine.count(ActionKind.DISCARD)
+        assert stats.histogram(name, "call_ranks").sum() == mine.count(ActionKind.CALL)
+    assert sum(stats.histogram(name, "lead_ranks").sum() for name in NAMES) == 7
+    assert 0 < stats.bid_rate("ann") < 1 and stats.bid_rate("nobody") == 0.5
+    assert 0 < stats.trump_lead_rate("bob") < 1
+    assert [jump_bin(r) for r in (1, 2, 4, 5, 9, 10, 40)] == [0, 1, 1, 2, 2, 3, 3]
+
+
+def test_bounded_rows_evict_the_least_recently_updated(tmp_path) -> None:
+    path = tmp_path / "opponents.bin"
+    record = _record()
+    with OpponentStats(path, capacity=6) as stats:
+        stats.record_game(record, NAMES)
+        stats.record_game(record, ["ann", "bob", "cid", "dee", "fay"])
+        counts = stats.counts("ann")
+        assert len(stats) == 6
+        stats.record_game(record, ["ann", "bob", "cid", "dee", "gus"])
+        assert "eve" not in stats and len(stats) == 6
+        size = path.stat().st_size
+
+    with OpponentStats(path, capacity=99) as stats:
+        assert stats.capacity == 6 and path.stat().st_size == size
+        assert stats.games("ann") == 3 and stats.games("gus") == 1
+        assert np.array_equal(stats.histogram("ann", "games"), [3])
+        start, width = LAYOUT["bid_levels"]
+        assert (
+            stats.counts("ann")[start : start + width].sum()
+            >= counts[start : start + width].sum()
+        )
+        stats.record_game(record, ["hal", "bob", "cid", "dee", "gus"])
+        assert "fay" not in stats and "ann" in stats
+
+    path.write_bytes(b"XXXX" + path.read_bytes()[4:])
+    with pytest.raises(ValueError):
+        OpponentStats(path)
+    with pytest.raises(ValueError):
+        OpponentStats().record_game(record, ["x" * 40] * 5)
@@ -0,0 +1,97 @@
+import random
+
+import pytest
+
+from briscola5.application.record import ActionKind, GameRecord, decode_action, replay, silenced
+from briscola5.bots.greedy_bot import GreedyBot
+from briscola5.bots.partner_inference import (
+    PartnerTracker,
+    SupportModel,
+    partner_posterior,
+    sample_hands,
+)
+from briscola5.bots.simulator import deal_seeded, play_game
+from briscola5.domain.card import card_from_index, cards_to_mask
+from briscola5.domain.view import PlayerView
+
+
+def _record(seed: int = 0) -> GameRecord:
+    while True:
+        service = deal_seeded(seed % 5, random.Random(seed))
+        record = GameRecord.from_service(service)
+        with silenced():
+            try:
+                play_game(service, {s: GreedyBot(s) for s in range(5)}, record)
+                return record
+            except RuntimeError:
+                seed += 1
+
+
+def _holder(state) -> int:
+    """The partner, from the full state: whoever holds or has played the called card."""
+    if state.call.partner_revealed:
+        return state.call.partner_player_internal
+    for played in state.trick.played:
+        if played.card == state.call.called_card:
+            return played.player_id
+    return next(s for s in range(5) if state.call.called_card in state.hands[s])
+
+
+def test_posterior_is_consistent_and_matches_a_batch_recount() -> None:
+    model = SupportModel()
+    trackers = [PartnerTracker(seat, model) for seat in range(5)]
+    history = []
+    for service, action in replay(_record()):
+        state = service.state
+        call = state.call
+        for seat, tracker in enumerate(trackers):
+            view = PlayerView(state, seat)
+            posterior = tracker.posterior(view)
+            if call.called_card is None:
+                assert posterior is None
+                continue
+            assert sum(posterior) == pytest.approx(1.0)
+            partner = _holder(state)
+            assert posterior[partner] > 0 and posterior[call.caller_player] == 0
+            if call.partner_revealed or partner == seat:
+                assert posterior[partner] == 1.0
+            else:
+                assert posterior[seat] == 0
+            odds = [1.0] * 5
+            for player, ratio in history:
+                odds[player] *= ratio
+            assert tracker.odds == pytest.approx(odds)
+        kind, player, value = decode_action(action)
+        if kind is ActionKind.PLAY and call.called_card is not None and not call.partner_revealed:
+            card = card_from_index(value)
+            if card != call.called_card:
+                history.append((player, model(state, player, card, call.called_card)))
+        for tracker in trackers:
+            tracker.observe_action(state, action)
+    assert any(ratio != 1.0 for _, ratio in history)
+
+
+def test_sampled_hands_follow_the_posterior() -> None:
+    for service, _ in replay(_record(3)):
+        state = service.state
+        if state.call.called_card is not None and not state.call.partner_revealed:
+            break
+    seat = next(
+        s
+        for s in range(5)
+        if s != state.call.caller_player and state.call.called_card not in state.hands[s]
+    )
+    view = PlayerView(state, seat)
+    posterior = partner_posterior(view, seat)
+    rng = random.Random(0)
+    counts = [0] * 5
+    for _ in range(2000):
+        hands = sample_hands(view, seat, rng)
+        assert [len(hand) for hand in hands] == list(view.hand_sizes)
+        assert hands[seat] == list(view.hand)
+        held = cards_to_mask(card for hand in hands for card in hand)
+        assert held == view.unseen_mask | view.hand_mask
+        counts[next(s for s in range(5) if state.call.called_card in hands[s])] += 1
+    assert counts[state.call.caller_player] == 0
+    for share, count in zip(posterior, counts):
+        assert count / 2000 == pytest.approx(share, abs=0.05)
@@ -0,0 +1,93 @@
+import multiprocessing
+import random
+
+import numpy as np
+import pytest
+
+from briscola5.application.record import GameRecord, replay, silenced
+from briscola5.bots.greedy_bot import GreedyBot
+from briscola5.bots.pool import (
+    BID,
+    OBSERVATION_SIZE,
+    PLAY,
+    BotFailure,
+    BotPool,
+    BotTimeout,
+    pack_observation,
+    unpack_observation,
+)
+from briscola5.bots.simulator import deal_seeded, play_game
+from briscola5.domain.view import PlayerView
+from briscola5.learning.features import FEATURE_SIZE, encode_state
+
+
+def _game(bots) -> GameRecord:
+    seed = 0
+    while True:
+        service = deal_seeded(seed % 5, random.Random(seed))
+        record = GameRecord.from_service(service)
+        with silenced():
+            try:
+                play_game(service, bots, record)
+                return record
+            except RuntimeError:
+                seed += 1
+
+
+def test_observations_round_trip_through_the_fixed_layout() -> None:
+    buf = memoryview(bytearray(OBSERVATION_SIZE + 3))
+    expected, actual = np.zeros(FEATURE_SIZE, np.float32), np.zeros(FEATURE_SIZE, np.float32)
+    for service, _ in replay(_game({s: GreedyBot(s) for s in range(5)})):
+        for seat in range(5):
+            view = PlayerView(service.state, seat)
+            pack_observation(view, buf, 3)
+            copy = unpack_observation(buf, 3)
+            assert copy.hand == view.hand and copy.hand_sizes == view.hand_sizes
+            assert copy.call.partner_player == view.call.partner_player
+            assert copy.played_mask() == view.played_mask()
+            encode_state(view, seat, expected)
+            encode_state(copy, seat, actual)
+            assert np.array_equal(expected, actual)
+
+
+def test_pooled_bots_play_the_same_game_as_local_ones() -> None:
+    with BotPool(workers=2, depth=4) as pool:
+        remote = _game({seat: pool.bot("Greedy", seat) for seat in range(5)})
+        assert {bot.worker for bot in (pool.bot("Greedy", s) for s in range(2))} == {0, 1}
+    assert remote.actions == _game({seat: GreedyBot(seat) for seat in range(5)}).actions
+
+
+def test_failures_deadlines_and_restarts() -> None:
+    service = deal_seeded(0, random.Random(2))
+    view = PlayerView(service.state, 1)
+    with BotPool(workers=1, depth=2) as pool:
+        greedy, random_bot = pool.names.index("Greedy"), pool.names.index("Random")
+        expected = GreedyBot(1).make_bid(view)
+        assert pool.call(0, BID, greedy, view) == (-1 if expected is None else expected)
+
+        # A bot that raises fails its own call only.
+        hand, service.state.hands[1] = service.state.hands[1], []
+        with pytest.raises(BotFailure, match="IndexError"):
+            pool.call(0, PLAY, random_bot, view)
+        assert pool.restarts == 0
+        service.state.hands[1] = hand
+
+        with pytest.raises(BotTimeout):
+            pool.result(pool.submit(0, BID, greedy, view, deadline=0.0))
+        assert pool.restarts == 1
+
+        _kill_workers()
+        with pytest.raises(BotFailure):
+            pool.call(0, BID, greedy, view)
+        assert pool.restarts == 2
+        assert pool.call(0, BID, greedy, view) == (-1 if expected is None else expected)
+
+        _kill_workers()
+        assert pool.bot("Greedy", 1, fallback=GreedyBot(1)).make_bid(view) == expected
+        assert pool.restarts == 3
+
+
+def _kill_workers() -> None:
+    for child in multiprocessing.active_children():
+        child.kill()
+        child.join()
@@ -0,0 +1,57 @@
+from importlib.metadata import EntryPoint
+
+import pytest
+
+from briscola5.bots.greedy_bot import GreedyBot
+from briscola5.bots.registry import BOT_REGISTRY, ENTRY_POINT_GROUP, BotRegistry, resolve_bot
+from briscola5.bots.startup import loaded_modules
+
+
+def test_registry_imports_on_lookup_and_caches():
+    registry = BotRegistry({"Greedy": "briscola5.bots.greedy_bot:GreedyBot"})
+    assert list(registry) == ["Greedy"] and len(registry) == 1
+    assert "Greedy" in registry and "Human" not in registry
+    assert registry["Greedy"] is GreedyBot
+    assert registry["Greedy"] is registry["Greedy"]
+
+    registry.register("Greedy", "briscola5.bots.random_bot:RandomBot")
+    assert registry["Greedy"].__name__ == "RandomBot"
+
+
+def test_resolve_bot():
+    assert resolve_bot("Greedy") is GreedyBot
+    assert sorted(BOT_REGISTRY) == ["Greedy", "Random"]
+    with pytest.raises(ValueError, match="Unknown bot 'Human'"):
+        resolve_bot("Human")
+
+
+@pytest.mark.parametrize("module", ["briscola5.bots.runner", "briscola5.cli.base_cli"])
+def test_entry_points_defer_heavy_imports(module):
+    assert not loaded_modules(module)
+
+
+def test_bot_info_and_costs():
+    info = BOT_REGISTRY.info("Greedy")
+    assert (info.spec, info.deterministic, info.batch_capable) == (
+        "briscola5.bots.greedy_bot:GreedyBot",
+        True,
+        False,
+    )
+    assert [info.name for info in BOT_REGISTRY.by_cost()] == ["Random", "Greedy"]
+    assert BOT_REGISTRY.lineup_cost(["Greedy"] * 5) == pytest.approx(5.0)
+    assert "Greedy" in repr(info)
+
+
+def test_entry_points_extend_but_never_shadow():
+    registry = BotRegistry(
+        {"Greedy": "briscola5.bots.greedy_bot:GreedyBot"}, group="briscola5.tests.no-such-group"
+    )
+    assert list(registry) == ["Greedy"]
+    registry.load_entry_points(
+        [
+            EntryPoint("Greedy", "briscola5.bots.random_bot:RandomBot", ENTRY_POINT_GROUP),
+            EntryPoint("Calibrated", "briscola5.bots.calibrated_bot:CalibratedBidBot", "g"),
+        ]
+    )
+    assert registry["Greedy"] is GreedyBot
+    assert registry.info("Calibrated").deterministic
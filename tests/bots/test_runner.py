@@ -0,0 +1,156 @@
+import io
+import json
+import random
+
+import pytest
+
+from briscola5.bots.runner import (
+    DEFAULT_BATCH_SIZE,
+    BinaryWriter,
+    CsvWriter,
+    DuplicateSummary,
+    GameResult,
+    ProgressReporter,
+    batch_size_for,
+    iter_duplicate_results,
+    iter_results,
+    lineup_permutations,
+    main,
+    play_seeded_game,
+    read_binary_results,
+    run,
+    seat_rotations,
+)
+
+LINEUP = ["Greedy", "Random", "Greedy", "Random", "Greedy"]
+
+
+def test_seeded_games_are_reproducible_and_keep_global_random_state():
+    saved = random.getstate()
+    random.seed(42)
+    expected_next = random.Random(42).random()
+    try:
+        results = list(iter_results(6, seed=7, lineup=LINEUP, batch_size=4))
+
+        assert random.random() == expected_next
+        assert [r.game for r in results] == list(range(6))
+        assert results == list(iter_results(6, seed=7, lineup=LINEUP))
+        assert results[3] == play_seeded_game(3, 7, LINEUP)
+    finally:
+        random.setstate(saved)
+
+
+def test_parallel_results_match_serial_order():
+    serial = list(iter_results(10, workers=1, seed=1, batch_size=3))
+    parallel = list(iter_results(10, workers=2, seed=1, batch_size=3))
+    assert parallel == serial
+
+
+def test_finished_results_are_consistent():
+    for result in iter_results(20, seed=3, lineup=LINEUP):
+        if result.error is None:
+            assert result.caller is not None
+            assert len(result.winners) in (2, 3)
+            assert result.caller_team_won == (result.caller in result.winners)
+
+
+def test_binary_round_trip():
+    results = list(iter_results(8, seed=2))
+    stream = io.BytesIO()
+    run(results, BinaryWriter(stream))
+    stream.seek(0)
+
+    decoded = list(read_binary_results(stream))
+
+    assert [r.winners for r in decoded] == [r.winners for r in results]
+    assert [r.lineup for r in decoded] == [r.lineup for r in results]
+    assert [r.error is None for r in decoded] == [r.error is None for r in results]
+
+
+def test_csv_and_progress_output():
+    stream, progress_stream = io.StringIO(), io.StringIO()
+    progress = ProgressReporter(3, progress_stream, interval=0.0)
+
+    done, errors = run(iter_results(3, seed=0), CsvWriter(stream), progress)
+
+    lines = stream.getvalue().splitlines()
+    assert lines[0].startswith("game,dealer,lineup")
+    assert len(lines) == 4
+    assert done == 3
+    assert "3/3 games, " in progress_stream.getvalue()
+    assert f"{errors} errors" in progress_stream.getvalue()
+
+
+def test_main_writes_json_lines(tmp_path, capsys):
+    output = tmp_path / "results.jsonl"
+    main(["-n", "4", "--seed", "5", "--lineup", ",".join(LINEUP), "-o", str(output)])
+
+    rows = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [row["game"] for row in rows] == [0, 1, 2, 3]
+    assert all(row["lineup"] == LINEUP for row in rows)
+    assert "4/4 games" in capsys.readouterr().err
+
+
+def test_main_rejects_bad_lineup():
+    with pytest.raises(SystemExit):
+        main(["--lineup", "Greedy,Nobody"])
+
+
+def test_batch_size_follows_lineup_cost(capsys):
+    assert batch_size_for(None) == batch_size_for(["Greedy"] * 5) == DEFAULT_BATCH_SIZE
+    assert batch_size_for(["Random"] * 5) == DEFAULT_BATCH_SIZE
+
+    main(["--list-bots"])
+    listed = capsys.readouterr().out.splitlines()
+    assert [line.split()[0] for line in listed] == ["Random", "Greedy"]
+
+
+def test_duplicate_seatings():
+    rotations = seat_rotations(LINEUP)
+    assert len(rotations) == 5
+    assert rotations[1] == ("Greedy", "Greedy", "Random", "Greedy", "Random")
+    assert all(sorted(r) == sorted(LINEUP) for r in rotations)
+    assert len(lineup_permutations(LINEUP)) == 10
+
+
+def test_duplicate_deals_share_cards_and_match_parallel():
+    deals = list(iter_duplicate_results(4, LINEUP, "rotations", seed=3, batch_size=3))
+    parallel = list(iter_duplicate_results(4, LINEUP, "rotations", workers=2, seed=3))
+
+    assert deals == parallel
+    assert [len(results) for results in deals] == [5] * 4
+    for deal, results in enumerate(deals):
+        assert {r.game for r in results} == {deal}
+        assert {r.dealer for r in results} == {deal % 5}
+        assert [r.lineup for r in results] == seat_rotations(LINEUP)
+
+
+def test_duplicate_summary_counts_each_deal_once():
+    summary = DuplicateSummary()
+    first = GameResult(0, 0, ("Greedy", "Random", "Random", "Random", "Random"))
+    first.winners = (0, 1)
+    second = GameResult(0, 0, ("Random", "Greedy", "Random", "Random", "Random"))
+    second.winners = (0, 2)
+    failed = GameResult(0, 0, ("Random", "Random", "Greedy", "Random", "Random"))
+    failed.error = "RuntimeError: x"
+    summary.add([first, second, failed])
+    summary.add([first])
+
+    rates = summary.rates()
+    assert rates["Greedy"][0] == 0.75
+    assert rates["Random"][0] == pytest.approx((3 / 8 + 1 / 4) / 2)
+    assert rates["Greedy"][1] > 0
+
+
+def test_main_duplicate_mode(tmp_path, capsys):
+    output = tmp_path / "dup.jsonl"
+    main(
+        ["-n", "2", "--lineup", ",".join(LINEUP), "--duplicate", "permutations"]
+        + ["-o", str(output)]
+    )
+
+    rows = [json.loads(line) for line in output.read_text().splitlines()]
+    assert len(rows) == 20
+    assert "duplicate win rate" in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        main(["--duplicate", "rotations"])
@@ -0,0 +1,89 @@
+import pytest
+
+from briscola5.bots import shared_counters
+from briscola5.bots.runner import GameResult, iter_results
+from briscola5.bots.shared_counters import (
+    BOT_NAMES,
+    LAYOUT,
+    NUM_BID_BUCKETS,
+    SharedCounters,
+    bid_bucket,
+    simulate_counts,
+)
+
+
+def _result(winners: tuple[int, ...], target: int, won: bool) -> GameResult:
+    result = GameResult(0, 0, ("Greedy", "Greedy", "Random", "Random", "Random"))
+    result.winners = winners
+    result.target = target
+    result.caller_team_won = won
+    return result
+
+
+def test_bid_bucket_is_clamped() -> None:
+    assert bid_bucket(71) == 0
+    assert bid_bucket(80) == 1
+    assert bid_bucket(120) == NUM_BID_BUCKETS - 1
+    assert bid_bucket(10) == 0
+
+
+def test_record_and_summary() -> None:
+    counters = SharedCounters.create(2)
+    try:
+        counters.record(0, _result((0, 1), 85, True))
+        counters.record(1, _result((0, 2, 3), 90, False))
+        errored = GameResult(2, 0, ("Greedy",) * 5)
+        errored.error = "RuntimeError: boom"
+        counters.record(1, errored)
+
+        summary = counters.summary()
+        greedy, rnd = BOT_NAMES.index("Greedy"), BOT_NAMES.index("Random")
+        assert summary["games"] == [3]
+        assert summary["errors"] == [1]
+        assert summary["seat_wins"] == [2, 1, 1, 1, 0]
+        assert summary["bot_player_wins"][greedy] == 3
+        assert summary["bot_player_wins"][rnd] == 2
+        assert summary["bot_game_wins"][greedy] == 1
+        assert summary["bot_game_wins"][rnd] == 1
+        assert summary["lineup_games"][2] == 2
+        assert summary["bid_games"][bid_bucket(85)] == 1
+        assert sum(summary["bid_wins"]) == 1
+        assert counters.counts[0].sum() + counters.counts[1].sum() == counters.totals().sum()
+    finally:
+        counters.unlink()
+
+
+def test_lineup_games_follow_the_tracked_bot() -> None:
+    counters = SharedCounters.create(1, tracked="Random")
+    try:
+        counters.record(0, _result((0,), 85, True))
+        assert counters.summary()["lineup_games"][3] == 1
+    finally:
+        counters.unlink()
+    with pytest.raises(ValueError):
+        SharedCounters.create(1, tracked="Nobody")
+
+
+def test_count_batch_needs_a_worker() -> None:
+    with pytest.raises(RuntimeError):
+        shared_counters.count_batch(0, 1, 0, None)
+
+
+def test_parallel_counts_match_streamed_results() -> None:
+    progress: list = []
+    serial = simulate_counts(40, workers=1, seed=5, batch_size=8)
+    parallel = simulate_counts(
+        40, workers=2, seed=5, batch_size=8, on_progress=progress.append, poll_interval=0.01
+    )
+
+    assert parallel == serial
+    assert progress and progress[-1][LAYOUT["games"][0]] == 40
+
+    seat_wins = [0] * 5
+    errors = 0
+    for result in iter_results(40, seed=5, batch_size=8):
+        errors += result.error is not None
+        for seat in result.winners:
+            seat_wins[seat] += 1
+    assert serial["seat_wins"] == seat_wins
+    assert serial["errors"] == [errors]
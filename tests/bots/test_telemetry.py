@@ -0,0 +1,81 @@
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from briscola5.bots.runner import GameResult, main
+from briscola5.bots.simulator import game
+from briscola5.bots.telemetry import Telemetry, TelemetryFile, TelemetryServer, wilson_interval
+
+LINEUP = ["Greedy", "Random", "Greedy", "Random", "Random"]
+
+
+def test_wilson_interval():
+    low, high = wilson_interval(50, 100)
+    assert low == pytest.approx(0.4038, abs=1e-3)
+    assert high == pytest.approx(0.5962, abs=1e-3)
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+    assert wilson_interval(10, 10)[1] == 1.0
+
+
+def test_snapshot_counts_errors_and_win_rates():
+    telemetry = Telemetry(total=4)
+    telemetry.observe(LINEUP, [0, 2], caller_team_won=True)
+    telemetry.observe(LINEUP, [1, 3, 4], caller_team_won=False)
+    failed = GameResult(2, 2, tuple(LINEUP))
+    failed.error = "RuntimeError: no legal discard"
+    telemetry.record(failed)
+
+    snapshot = telemetry.snapshot()
+    assert snapshot["games"] == 3
+    assert snapshot["errors_by_type"] == {"RuntimeError": 1}
+    assert snapshot["bot_win_rates"]["Greedy"]["rate"] == 0.5
+    assert snapshot["bot_win_rates"]["Random"]["wins"] == 3
+    assert snapshot["seat_win_rates"][0]["trials"] == 2
+    assert snapshot["caller_win_rate"]["rate"] == 0.5
+    assert snapshot["eta_seconds"] is not None
+
+
+def test_tick_is_rate_limited_and_feeds_sinks(tmp_path):
+    received: list = []
+    telemetry = Telemetry(interval=3600)
+    telemetry.sinks.append(received.append)
+    telemetry.sinks.append(TelemetryFile(tmp_path / "live.json"))
+
+    telemetry.tick()
+    telemetry.observe(LINEUP, [0])
+    telemetry.tick()
+    assert len(received) == 1
+    telemetry.tick(force=True)
+
+    assert len(received) == 2
+    assert json.loads((tmp_path / "live.json").read_text())["games"] == 1
+
+
+def test_server_serves_latest_snapshot():
+    telemetry = Telemetry()
+    telemetry.observe(LINEUP, [0, 1])
+    telemetry.tick(force=True)
+
+    with TelemetryServer(telemetry) as server:
+        url = f"http://127.0.0.1:{server.port}"
+        with urllib.request.urlopen(f"{url}/metrics", timeout=5) as response:
+            assert json.loads(response.read())["games"] == 1
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"{url}/nope", timeout=5)
+
+
+def test_main_writes_telemetry_file(tmp_path):
+    output, live = tmp_path / "out.jsonl", tmp_path / "live.json"
+    main(["-n", "3", "--no-progress", "-o", str(output), "--telemetry-file", str(live)])
+
+    assert json.loads(live.read_text())["games"] == 3
+
+
+def test_legacy_game_reports_to_telemetry(capsys):
+    telemetry = Telemetry(total=2)
+    game(num_games=2, show_prints=False, telemetry=telemetry)
+    capsys.readouterr()
+
+    assert telemetry.latest["games"] == 2
@@ -1,13 +1,18 @@
 import pytest
 
 from briscola5.domain.card import (
+    DECK_SIZE,
     POINTS,
     TRICK_STRENGTH,
     Card,
     Rank,
     Suit,
     assert_is_valid_deck,
+    card_from_index,
+    card_index,
+    cards_to_mask,
     full_deck,
+    mask_to_cards,
 )
 
 
@@ -40,3 +45,16 @@ def test_invalid_deck_duplicates_raises() -> None:
     deck[-1] = deck[0]
     with pytest.raises(ValueError):
         assert_is_valid_deck(deck)
+
+
+def test_card_index_round_trip() -> None:
+    indices = [card_index(card) for card in full_deck()]
+    assert indices == list(range(DECK_SIZE))
+    assert all(card_from_index(i) == card for i, card in enumerate(full_deck()))
+
+
+def test_cards_to_mask_round_trip() -> None:
+    cards = [Card(Suit.ORO, Rank.ASSO), Card(Suit.BASTONI, Rank.DUE)]
+    mask = cards_to_mask(cards)
+    assert mask == (1 << 0) | (1 << 39)
+    assert mask_to_cards(mask) == cards
@@ -0,0 +1,54 @@
+import pytest
+
+from briscola5.domain.card import Card, Rank, Suit, cards_to_mask
+from briscola5.domain.rules import STANDARD_RULES, RuleSet
+from briscola5.domain.state import GameState, PlayedCard
+
+
+def test_standard_bid_bounds():
+    assert STANDARD_RULES.opening_bid(None) == 71
+    assert STANDARD_RULES.opening_bid(80) == 81
+    assert STANDARD_RULES.is_valid_bid(71, None)
+    assert not STANDARD_RULES.is_valid_bid(70, None)
+    assert not STANDARD_RULES.is_valid_bid(80, 80)
+    assert not STANDARD_RULES.is_valid_bid(121, 100)
+    assert STANDARD_RULES.hand_size == 8
+
+
+def test_variant_bid_bounds():
+    rules = RuleSet(min_bid=61, max_bid=100)
+
+    assert rules.is_valid_bid(61, None)
+    assert not rules.is_valid_bid(101, 90)
+    with pytest.raises(ValueError):
+        RuleSet(min_bid=90, max_bid=80)
+
+
+def test_dead_trick_cap_table():
+    ace = Card(Suit.ORO, Rank.ASSO)
+    assert STANDARD_RULES.is_legal_discard(109, 0, ace)
+    assert not STANDARD_RULES.is_legal_discard(110, 0, ace)
+    assert not STANDARD_RULES.is_legal_discard(100, 10, ace)
+    assert RuleSet(dead_trick_cap=None).is_legal_discard(120, 30, ace)
+    assert RuleSet(max_bid=100, dead_trick_cap=100).discard_allowance[100] == 0
+    with pytest.raises(ValueError):
+        RuleSet(dead_trick_cap=110)
+    with pytest.raises(ValueError):
+        RuleSet(min_bid=61, max_bid=90, dead_trick_cap=80)
+
+
+def test_state_uses_its_rule_set():
+    state = GameState(RuleSet(dead_trick_cap=None))
+    state.call.target_points = 120
+    state.trick.played = [PlayedCard(0, Card(Suit.COPPE, Rank.ASSO))]
+
+    assert state.is_legal_discard(Card(Suit.ORO, Rank.ASSO))
+    assert not GameState().is_legal_discard(Card(Suit.ORO, Rank.ASSO))
+
+
+def test_forbidden_calls():
+    hand = cards_to_mask([Card(Suit.ORO, Rank.ASSO)])
+    dead = cards_to_mask([Card(Suit.SPADE, Rank.TRE)])
+
+    assert STANDARD_RULES.forbidden_calls(hand, dead) == hand | dead
+    assert RuleSet(call_discarded_card=True).forbidden_calls(hand, dead) == hand
@@ -0,0 +1,87 @@
+import random
+
+from briscola5.application.record import ActionKind, decode_action, replay
+from briscola5.bots.simulator import simulate_records
+from briscola5.domain.card import Card, Rank, Suit, card_from_index
+from briscola5.domain.snapshot import ZOBRIST, Snapshot, Zobrist, state_key
+from briscola5.domain.state import PLAYER_COUNT, GameState, Phase
+from briscola5.domain.trick import PlayedCard
+
+
+def _records(count: int) -> list:
+    saved = random.getstate()
+    random.seed(31)
+    try:
+        return list(simulate_records(count))
+    finally:
+        random.setstate(saved)
+
+
+def test_initial_state_round_trip() -> None:
+    state = GameState()
+    snapshot = Snapshot.from_state(state)
+
+    assert snapshot.to_state().__repr__() == state.__repr__()
+    assert Snapshot.from_state(snapshot.to_state()) == snapshot
+    assert snapshot.hands == (0,) * PLAYER_COUNT
+
+
+def test_snapshots_are_hashable_and_immutable() -> None:
+    state = GameState()
+    state.hands[2] = [Card(Suit.COPPE, Rank.ASSO), Card(Suit.ORO, Rank.DUE)]
+    first, second = Snapshot.from_state(state), Snapshot.from_state(state)
+
+    assert first == second
+    assert len({first, second}) == 1
+    assert first.to_state().hands[2] == [Card(Suit.ORO, Rank.DUE), Card(Suit.COPPE, Rank.ASSO)]
+
+
+def test_round_trip_through_whole_games() -> None:
+    for record in _records(3):
+        for service, _ in replay(record):
+            snapshot = Snapshot.from_state(service.state)
+            restored = snapshot.to_state()
+            assert Snapshot.from_state(restored) == snapshot
+            assert restored.phase == service.state.phase
+            assert sorted(map(repr, restored.hands[0])) == sorted(
+                map(repr, service.state.hands[0])
+            )
+            assert restored.call.called_card == service.state.call.called_card
+
+
+def test_zobrist_keys_are_stable_across_instances() -> None:
+    snapshot = Snapshot.from_state(GameState())
+
+    assert Zobrist().key(snapshot) == ZOBRIST.key(snapshot)
+    assert Zobrist(seed=1).key(snapshot) != ZOBRIST.key(snapshot)
+    assert 0 <= ZOBRIST.key(snapshot) < 1 << 64
+
+
+def test_incremental_play_matches_full_key() -> None:
+    checked = 0
+    for record in _records(3):
+        for service, action in replay(record):
+            kind, player, value = decode_action(action)
+            state = service.state
+            if kind != ActionKind.PLAY or len(state.trick.played) == PLAYER_COUNT - 1:
+                continue
+            before = state_key(state)
+            card = card_from_index(value)
+            expected = ZOBRIST.play_card(before, player, card, (player + 1) % PLAYER_COUNT)
+            state.hands[player].remove(card)
+            state.trick.played.append(PlayedCard(player_id=player, card=card))
+            state.turn.current_player = (player + 1) % PLAYER_COUNT
+            assert state_key(state) == expected
+            state.hands[player].append(card)
+            state.trick.played.pop()
+            state.turn.current_player = player
+            checked += 1
+    assert checked
+
+
+def test_key_distinguishes_phases() -> None:
+    state = GameState()
+    before = state_key(state)
+    state.phase = Phase.TRICK_PLAY
+
+    assert state_key(state) != before
@@ -1,6 +1,7 @@
 import pytest
 
-from briscola5.domain.state import PLAYER_COUNT, GameState, Phase
+from briscola5.domain.card import Card, Rank, Suit
+from briscola5.domain.state import PLAYER_COUNT, GameState, Phase, PlayedCard
 
 
 def test_initial_state_defaults() -> None:
@@ -101,3 +102,28 @@ def test_repr_does_not_crash() -> None:
     state = GameState()
     text = repr(state)
     assert "GameState(" in text
+
+
+def test_is_legal_discard_respects_120_cap() -> None:
+    state = GameState()
+    assert not state.is_legal_discard(Card(Suit.ORO, Rank.DUE))
+
+    state.call.target_points = 100
+    state.trick.played = [PlayedCard(player_id=0, card=Card(Suit.COPPE, Rank.TRE))]
+
+    assert state.dead_trick_points() == 110
+    assert state.is_legal_discard(Card(Suit.ORO, Rank.TRE))
+    assert not state.is_legal_discard(Card(Suit.ORO, Rank.ASSO))
+
+
+def test_winning_players() -> None:
+    state = GameState()
+    assert state.winning_players() is None
+
+    state.call.caller_player = 1
+    state.call.partner_player_internal = 3
+    state.call.caller_team_won = False
+    assert state.winning_players() == [0, 2, 4]
+
+    state.call.caller_team_won = True
+    assert state.winning_players() == [1, 3]
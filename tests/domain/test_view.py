@@ -0,0 +1,73 @@
+import random
+
+import numpy as np
+import pytest
+
+from briscola5.application.record import GameRecord, replay, silenced
+from briscola5.bots.greedy_bot import GreedyBot
+from briscola5.bots.simulator import deal_seeded, play_game
+from briscola5.domain.card import DECK_SIZE, cards_to_mask
+from briscola5.domain.errors import HiddenInformationError
+from briscola5.domain.state import Phase
+from briscola5.domain.view import PlayerView
+from briscola5.learning.features import FEATURE_SIZE, encode_state
+
+
+def _record(sandboxed: bool) -> GameRecord:
+    seed = 0
+    while True:
+        service = deal_seeded(seed % 5, random.Random(seed))
+        record = GameRecord.from_service(service)
+        with silenced():
+            try:
+                play_game(service, {s: GreedyBot(s) for s in range(5)}, record, sandboxed)
+                return record
+            except RuntimeError:
+                seed += 1
+
+
+def test_view_hides_other_hands_and_the_unrevealed_partner() -> None:
+    record = _record(False)
+    for service, _ in replay(record):
+        state = service.state
+        for seat in range(5):
+            view = PlayerView(state, seat)
+            assert list(view.hands[seat]) == state.hands[seat]
+            assert len(view.hands) == 5
+            with pytest.raises(HiddenInformationError):
+                view.hands[(seat + 1) % 5]  # pylint: disable=expression-not-assigned
+            partner = state.call.partner_player_internal
+            if state.call.partner_revealed or partner == seat:
+                assert view.call.partner_player == partner
+            else:
+                assert view.call.partner_player is None
+            assert not hasattr(view.call, "partner_player_internal")
+            others = cards_to_mask(c for s, h in enumerate(state.hands) if s != seat for c in h)
+            assert view.unseen_mask == others
+
+
+def test_cached_parts_follow_the_live_state() -> None:
+    service = deal_seeded(0, random.Random(4))
+    view = PlayerView(service.state, 1)
+    hand = view.hand
+    assert view.hand is hand and view.played_mask() == 0
+    with pytest.raises(AttributeError):
+        view.call.trump_suit = None  # type: ignore[misc]
+
+    with silenced():
+        play_game(service, {s: GreedyBot(s) for s in range(5)})
+    assert service.state.phase is Phase.GAME_OVER
+    assert view.hand == () and view.played == ()
+    assert view.played_mask() == (1 << DECK_SIZE) - 1 and view.unseen_mask == 0
+
+
+def test_sandboxed_games_and_features_match_the_full_state() -> None:
+    record = _record(True)
+    assert record.actions == _record(False).actions
+
+    full, partial = np.zeros(FEATURE_SIZE, np.float32), np.zeros(FEATURE_SIZE, np.float32)
+    for service, _ in replay(record):
+        for seat in range(5):
+            encode_state(service.state, seat, full)
+            encode_state(PlayerView(service.state, seat), seat, partial)
+            assert np.array_equal(full, partial)
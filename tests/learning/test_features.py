@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from briscola5.application.record import ActionKind
+from briscola5.bots.simulator import simulate_records
+from briscola5.domain.card import Card, Rank, Suit, card_index
+from briscola5.domain.state import GameState, Phase, PlayedCard
+from briscola5.learning.features import (
+    ACTION_SIZE,
+    CALLER,
+    FEATURE_SIZE,
+    HAND,
+    PASS_ACTION,
+    PHASE,
+    SEEN,
+    TRICK,
+    TRUMP,
+    action_to_index,
+    encode_state,
+    iter_feature_chunks,
+)
+
+
+def test_encode_state_uses_relative_seats_and_hides_other_hands():
+    state = GameState()
+    state.phase = Phase.TRICK_PLAY
+    state.hands[2] = [Card(Suit.ORO, Rank.ASSO)]
+    state.hands[3] = [Card(Suit.COPPE, Rank.TRE)]
+    state.trick.played = [PlayedCard(player_id=4, card=Card(Suit.SPADE, Rank.RE))]
+    state.call.caller_player = 1
+    state.call.trump_suit = Suit.SPADE
+
+    row = np.full(FEATURE_SIZE, 7.0, dtype=np.float32)
+    encode_state(state, 2, row)
+
+    assert row[HAND[0] : HAND[0] + HAND[1]].sum() == 1
+    assert row[HAND[0] + card_index(Card(Suit.ORO, Rank.ASSO))] == 1
+    trick_slot = TRICK[0] + 2 * 40 + card_index(Card(Suit.SPADE, Rank.RE))
+    assert row[trick_slot] == 1
+    assert row[CALLER[0] + 4] == 1
+    assert row[TRUMP[0] + 2] == 1
+    assert row[PHASE[0] + 4] == 1
+    # Everything but the three cards still in hands or on the table counts as seen.
+    assert row[SEEN[0] : SEEN[0] + SEEN[1]].sum() == 37
+
+
+def test_action_to_index_covers_action_space():
+    assert action_to_index(ActionKind.PLAY, 39) == 39
+    assert action_to_index(ActionKind.CALL, 0) == 40
+    assert action_to_index(ActionKind.BID, 71) == 80
+    assert action_to_index(ActionKind.BID, 120) == PASS_ACTION - 1
+    assert action_to_index(ActionKind.PASS, 0) == ACTION_SIZE - 1
+    with pytest.raises(ValueError):
+        action_to_index(ActionKind.BID, 61)
+
+
+def test_iter_feature_chunks_reuses_preallocated_buffers():
+    records = list(simulate_records(5))
+    expected = sum(len(r.actions) for r in records)
+
+    total = 0
+    buffers = set()
+    for chunk in iter_feature_chunks(records, chunk_size=64):
+        buffers.add(id(chunk.features))
+        assert chunk.features.shape == (64, FEATURE_SIZE)
+        assert (chunk.actions[: chunk.size] < ACTION_SIZE).all()
+        total += chunk.size
+
+    assert total == expected
+    assert len(buffers) == 1
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+from briscola5.domain.card import Card, Rank, Suit, card_index
+from briscola5.domain.rules import RuleSet
+from briscola5.domain.state import GameState, Phase, PlayedCard
+from briscola5.learning.features import (
+    ACTION_SIZE,
+    BID_ACTIONS,
+    CALL_ACTIONS,
+    PASS_ACTION,
+    encode_legal_actions,
+)
+from briscola5.learning.network import NO_LEGAL_ACTION, NetworkPolicy, PolicyValueNetwork
+
+
+def test_save_and_load_round_trip(tmp_path):
+    network = PolicyValueNetwork.initialise(hidden_sizes=(16, 8), seed=0)
+    path = tmp_path / "weights.npz"
+    network.save(path)
+
+    loaded = PolicyValueNetwork.load(path)
+    features = np.random.default_rng(1).random((3, 348), dtype=np.float32)
+
+    logits, values = network.forward(features)
+    loaded_logits, loaded_values = loaded.forward(features)
+    assert logits.shape == (3, ACTION_SIZE)
+    assert values.shape == (3,)
+    np.testing.assert_allclose(logits, loaded_logits)
+    np.testing.assert_allclose(values, loaded_values)
+
+
+def test_rejects_mismatched_weights():
+    params = PolicyValueNetwork.initialise(hidden_sizes=(4,), seed=0).params
+    params["policy_w"] = params["policy_w"][:, :10]
+    with pytest.raises(ValueError):
+        PolicyValueNetwork(params)
+
+
+def test_legal_actions_in_auction_and_dead_trick():
+    state = GameState()
+    state.auction.last_bid = 118
+    mask = np.zeros(ACTION_SIZE, dtype=bool)
+
+    encode_legal_actions(state, 0, mask)
+    assert np.flatnonzero(mask).tolist() == [PASS_ACTION - 2, PASS_ACTION - 1, PASS_ACTION]
+
+    state.phase = Phase.DEAD_TRICK_PLAY
+    state.call.target_points = 110
+    state.hands[0] = [Card(Suit.ORO, Rank.ASSO), Card(Suit.ORO, Rank.DUE)]
+    encode_legal_actions(state, 0, mask)
+    assert np.flatnonzero(mask).tolist() == [card_index(Card(Suit.ORO, Rank.DUE))]
+
+
+def test_legal_calls_exclude_hand_and_discards():
+    state = GameState()
+    state.phase = Phase.DEAD_TRICK_CALL
+    state.hands[1] = [Card(Suit.ORO, Rank.ASSO)]
+    state.trick.played = [PlayedCard(player_id=2, card=Card(Suit.ORO, Rank.TRE))]
+    mask = np.zeros(ACTION_SIZE, dtype=bool)
+
+    encode_legal_actions(state, 1, mask)
+
+    assert mask[CALL_ACTIONS : CALL_ACTIONS + 40].sum() == 38
+    assert not mask[:CALL_ACTIONS].any()
+    assert not mask[BID_ACTIONS:].any()
+
+
+def test_legal_actions_follow_the_rule_set():
+    state = GameState(RuleSet(max_bid=90, call_discarded_card=True))
+    state.auction.last_bid = 88
+    mask = np.zeros(ACTION_SIZE, dtype=bool)
+
+    encode_legal_actions(state, 0, mask)
+    assert np.flatnonzero(mask).tolist() == [BID_ACTIONS + 18, BID_ACTIONS + 19, PASS_ACTION]
+
+    state.phase = Phase.DEAD_TRICK_CALL
+    state.hands[1] = [Card(Suit.ORO, Rank.ASSO)]
+    state.trick.played = [PlayedCard(player_id=2, card=Card(Suit.ORO, Rank.TRE))]
+    encode_legal_actions(state, 1, mask)
+    assert mask[CALL_ACTIONS + card_index(Card(Suit.ORO, Rank.TRE))]
+    assert mask[CALL_ACTIONS : CALL_ACTIONS + 40].sum() == 39
+
+    with pytest.raises(ValueError):
+        encode_legal_actions(GameState(RuleSet(min_bid=61)), 0, mask)
+
+
+def test_policy_only_picks_legal_actions():
+    policy = NetworkPolicy(PolicyValueNetwork.initialise(seed=0), sample=True, seed=0)
+    state = GameState()
+    state.phase = Phase.TRICK_PLAY
+    state.hands[3] = [Card(Suit.SPADE, Rank.RE), Card(Suit.COPPE, Rank.SEI)]
+    legal = {card_index(card) for card in state.hands[3]}
+
+    actions, values = policy.act_batch([state] * 50, [3] * 50)
+
+    assert set(actions.tolist()) <= legal
+    assert np.all(np.abs(values) <= 1)
+
+
+def test_policy_reports_no_legal_action():
+    policy = NetworkPolicy(PolicyValueNetwork.initialise(hidden_sizes=(8,), seed=0))
+    state = GameState()
+    state.phase = Phase.DEAD_TRICK_PLAY
+    state.call.target_points = 120
+    state.hands[0] = [Card(Suit.ORO, Rank.ASSO)]
+
+    assert policy.act(state, 0) == NO_LEGAL_ACTION
@@ -0,0 +1,82 @@
+import json
+
+import numpy as np
+
+from briscola5.learning.features import FEATURE_SIZE
+from briscola5.learning.network import PolicyValueNetwork
+from briscola5.learning.selfplay import (
+    ReplayBuffer,
+    SelfPlayConfig,
+    SelfPlayTrainer,
+    gating_score,
+    play_selfplay_games,
+)
+
+
+def _samples(start, count):
+    features = np.zeros((count, FEATURE_SIZE), dtype=np.float32)
+    features[:, 0] = np.arange(start, start + count)
+    actions = np.arange(start, start + count, dtype=np.int16)
+    return features, actions, np.ones(count, dtype=np.float32)
+
+
+def test_replay_buffer_wraps_and_resumes(tmp_path):
+    buffer = ReplayBuffer(tmp_path, capacity=5)
+    buffer.append(*_samples(0, 3))
+    buffer.append(*_samples(3, 4))
+    buffer.flush()
+
+    assert len(buffer) == 5
+    assert buffer.actions.tolist() == [5, 6, 2, 3, 4]
+
+    reopened = ReplayBuffer(tmp_path, capacity=5)
+    assert (len(reopened), reopened.position) == (5, 2)
+    reopened.append(*_samples(7, 1))
+    assert reopened.actions.tolist() == [5, 6, 7, 3, 4]
+    assert reopened.features[2, 0] == 7
+
+    features, actions, _ = reopened.sample(8, np.random.default_rng(0))
+    assert features.shape == (8, FEATURE_SIZE)
+    assert set(actions.tolist()) <= {3, 4, 5, 6, 7}
+
+
+def test_replay_buffer_keeps_newest_of_oversized_append(tmp_path):
+    buffer = ReplayBuffer(tmp_path, capacity=3)
+    buffer.append(*_samples(0, 7))
+    assert sorted(buffer.actions.tolist()) == [4, 5, 6]
+
+
+def test_selfplay_and_gating_workers(tmp_path):
+    path = tmp_path / "weights.npz"
+    PolicyValueNetwork.initialise(hidden_sizes=(16,), seed=0).save(path)
+
+    features, actions, returns = play_selfplay_games(str(path), num_games=3, seed=1)
+    assert features.shape == (len(actions), FEATURE_SIZE)
+    assert set(returns.tolist()) <= {-1.0, 1.0}
+
+    won, scored = gating_score(str(path), num_games=5, seed=2)
+    assert 0 <= won <= scored <= 5
+    assert gating_score(str(path), num_games=5, seed=2) == (won, scored)
+
+
+def test_trainer_runs_and_resumes(tmp_path):
+    config = SelfPlayConfig(
+        tmp_path,
+        workers=1,
+        games_per_iteration=4,
+        buffer_capacity=2_000,
+        train_steps=3,
+        batch_size=16,
+        gate_every=2,
+        gate_games=5,
+        hidden_sizes=(16,),
+    )
+    SelfPlayTrainer(config).run(iterations=2)
+
+    log = [json.loads(line) for line in (tmp_path / "selfplay.log").read_text().splitlines()]
+    assert [entry["event"] for entry in log] == ["train", "train", "gate"]
+    assert (tmp_path / "best.npz").exists()
+
+    resumed = SelfPlayTrainer(config)
+    assert resumed.iteration == 2
+    assert len(resumed.buffer) == log[1]["buffer"]
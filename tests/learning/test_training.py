@@ -0,0 +1,20 @@
+import numpy as np
+
+from briscola5.learning.features import ACTION_SIZE, FEATURE_SIZE
+from briscola5.learning.network import PolicyValueNetwork
+from briscola5.learning.training import train_step
+
+
+def test_train_step_fits_a_fixed_batch():
+    rng = np.random.default_rng(0)
+    features = (rng.random((32, FEATURE_SIZE)) < 0.05).astype(np.float32)
+    actions = rng.integers(0, ACTION_SIZE, 32)
+    returns = np.where(rng.random(32) > 0.5, 1.0, -1.0).astype(np.float32)
+    network = PolicyValueNetwork.initialise(hidden_sizes=(32,), seed=0)
+
+    _, first_value_loss = train_step(network, features, actions, returns, learning_rate=0.05)
+    for _ in range(200):
+        _, value_loss = train_step(network, features, actions, returns, learning_rate=0.05)
+
+    assert value_loss < first_value_loss / 10
+    assert all(param.dtype == np.float32 for param in network.params.values())